@@ -1,5 +1,6 @@
+import os
 import streamlit as st
-from config.database import create_projects_table, create_member_table, authenticate_user, create_user
+from config.database import ensure_schema, authenticate_user, create_user
 from components.dashboard import dashboard_page
 from components.projects import project_page
 from components.inventory import inventory_page
@@ -7,6 +8,7 @@ from components.workload import workload_page
 from components.diagram import diagram_page
 from components.security import security_page
 from components.admin import admin_page
+from services.snapshot_scheduler import start_scheduler
 
 # 로그인 페이지
 def login_page():
@@ -31,7 +33,6 @@ def login_page():
                             st.session_state.logged_in = True
                             st.session_state.user_id = user['id']
                             st.session_state.permission = user['permission']
-                            st.session_state.user_projects = user['projects']
                             st.success("로그인 성공!")
                             st.rerun()
                         else:
@@ -193,6 +194,14 @@ st.sidebar.markdown(
 )
 st.sidebar.markdown("---")
 
+# 스키마 준비 (프로세스당 1회 마이그레이션, 이후 rerun에서는 DDL 없음, 로그인 전에 member 테이블 필요)
+ensure_schema()
+
+# 스냅샷 사전 수집 스케줄러 시작 (로그인 전부터 수집, 프로세스당 1회)
+# SNAPSHOT_SCHEDULER=worker 이면 snapshot_worker.py가 담당, off 이면 비활성화
+if os.getenv('SNAPSHOT_SCHEDULER', 'inprocess') == 'inprocess':
+    start_scheduler()
+
 # 로그인 체크
 if 'logged_in' not in st.session_state or not st.session_state.logged_in:
     login_page()
@@ -252,10 +261,6 @@ for page_name, button_text, button_key in menus:
 
 menu = st.session_state.current_page
 
-# 앱 시작 시 테이블 생성
-create_projects_table()
-create_member_table()
-
 # 메뉴에 따른 페이지 렌더링
 if menu == "대시보드":
     dashboard_page()
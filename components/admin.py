@@ -1,40 +1,58 @@
 import streamlit as st
 import pandas as pd
-from config.database import get_db_connection
+from config.database import db_connection, bump_acl_version
 from models.project import get_projects_from_db
 from psycopg2 import Error
+from psycopg2.extras import execute_values
 
 def get_all_users():
     """모든 사용자 목록 조회"""
-    connection = get_db_connection()
     users = []
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("SELECT id, permission, projects FROM member ORDER BY id")
-            rows = cursor.fetchall()
-            users = [{'id': row[0], 'permission': row[1], 'projects': row[2]} for row in rows]
-        except Error as e:
-            st.error(f"사용자 목록 조회 오류: {e}")
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT m.id, m.permission, m.all_projects,
+                           COALESCE(ARRAY_AGG(mp.project_id ORDER BY mp.project_id)
+                                    FILTER (WHERE mp.project_id IS NOT NULL), '{}')
+                    FROM member m
+                    LEFT JOIN member_project mp ON mp.member_id = m.id
+                    GROUP BY m.id
+                    ORDER BY m.id
+                """)
+                rows = cursor.fetchall()
+                users = [
+                    {'id': row[0], 'permission': row[1], 'all_projects': row[2], 'project_ids': list(row[3])}
+                    for row in rows
+                ]
+            except Error as e:
+                st.error(f"사용자 목록 조회 오류: {e}")
     return users
 
 def update_user_project_permissions(user_id, project_ids):
     """사용자 프로젝트 권한 업데이트"""
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            projects_str = ','.join(map(str, project_ids)) if project_ids else ''
-            cursor.execute("UPDATE member SET projects = %s WHERE id = %s", (projects_str, user_id))
-            connection.commit()
-            return True
-        except Error as e:
-            st.error(f"권한 업데이트 오류: {e}")
-            return False
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                # 선택에서 빠진 권한 삭제 후 새 권한 추가 (한 트랜잭션)
+                cursor.execute(
+                    "DELETE FROM member_project WHERE member_id = %s AND NOT (project_id = ANY(%s))",
+                    (user_id, list(project_ids))
+                )
+                if project_ids:
+                    execute_values(cursor, """
+                        INSERT INTO member_project (member_id, project_id)
+                        VALUES %s
+                        ON CONFLICT DO NOTHING
+                    """, [(user_id, project_id) for project_id in project_ids])
+                connection.commit()
+                bump_acl_version()
+                return True
+            except Error as e:
+                st.error(f"권한 업데이트 오류: {e}")
+                return False
     return False
 
 def admin_page():
@@ -74,14 +92,12 @@ def admin_page():
         st.info(f"선택된 사용자: **{selected_user_id}**")
         
         # 현재 사용자의 프로젝트 권한 표시
-        current_projects = selected_user['projects']
-        if current_projects:
-            if current_projects == 'all':
-                st.success("현재 권한: 모든 프로젝트 접근 가능")
-            else:
-                current_project_ids = [int(pid) for pid in current_projects.split(',') if pid.strip()]
-                current_project_names = [p['project_name'] for p in all_projects if p['id'] in current_project_ids]
-                st.info(f"현재 접근 가능한 프로젝트: {', '.join(current_project_names)}")
+        current_project_ids = selected_user['project_ids']
+        if selected_user['all_projects']:
+            st.success("현재 권한: 모든 프로젝트 접근 가능")
+        elif current_project_ids:
+            current_project_names = [p['project_name'] for p in all_projects if p['id'] in current_project_ids]
+            st.info(f"현재 접근 가능한 프로젝트: {', '.join(current_project_names)}")
         else:
             st.warning("현재 접근 가능한 프로젝트가 없습니다.")
         
@@ -91,10 +107,6 @@ def admin_page():
         st.subheader("프로젝트 권한 설정")
         
         # 현재 권한 기반으로 체크박스 초기값 설정
-        current_project_ids = []
-        if current_projects and current_projects != 'all':
-            current_project_ids = [int(pid) for pid in current_projects.split(',') if pid.strip()]
-        
         selected_projects = []
         
         # 모든 프로젝트 체크박스
@@ -128,11 +140,10 @@ def admin_page():
         
         user_status = []
         for user in users:
-            if user['projects'] == 'all':
+            if user['all_projects']:
                 project_info = "모든 프로젝트"
-            elif user['projects']:
-                user_project_ids = [int(pid) for pid in user['projects'].split(',') if pid.strip()]
-                project_names = [p['project_name'] for p in all_projects if p['id'] in user_project_ids]
+            elif user['project_ids']:
+                project_names = [p['project_name'] for p in all_projects if p['id'] in user['project_ids']]
                 project_info = ', '.join(project_names) if project_names else "없음"
             else:
                 project_info = "없음"
@@ -0,0 +1,61 @@
+import streamlit as st
+from config.database import get_acl_version
+from models.project import get_member_projects
+from utils.cache import cache_stats, inflight_services
+
+# 현재 사용자가 접근 가능한 프로젝트 [{'id', 'project_name', 'region'}]
+# 세션별로 캐시하고 프로젝트/권한 변경(ACL 버전 증가) 시에만 다시 조회
+def get_visible_projects():
+    user_id = st.session_state.get('user_id')
+    version = get_acl_version()
+    cached = st.session_state.get('visible_projects')
+    if cached is None or cached['version'] != version or cached['user_id'] != user_id:
+        cached = {'version': version, 'user_id': user_id, 'projects': get_member_projects(user_id)}
+        st.session_state.visible_projects = cached
+    return cached['projects']
+
+# 현재 사용자가 접근 가능한 프로젝트명 목록
+def get_visible_project_names():
+    return [project['project_name'] for project in get_visible_projects()]
+
+# 병렬 수집 결과 중 실패/시간초과 서비스 표시
+def show_collection_errors(statuses):
+    for name, status in statuses.items():
+        if status['status'] == 'error':
+            st.error(status['message'])
+        elif status['status'] == 'timeout':
+            st.warning(status['message'])
+
+# 프로젝트/서비스 단위 새로고침 컨트롤 (클릭 시 새로고침할 서비스 목록 반환, 아니면 빈 목록)
+def render_refresh_control(project_key, service_names, key):
+    col1, col2, col3 = st.columns([2, 1, 3])
+    with col1:
+        target = st.selectbox(
+            "새로고침 대상",
+            ["전체 서비스"] + list(service_names),
+            key=f"{key}_refresh_target",
+            label_visibility="collapsed"
+        )
+    with col2:
+        clicked = st.button("🔄 새로고침", key=f"{key}_refresh")
+    with col3:
+        stats = cache_stats()
+        st.caption(f"캐시 적중 {stats['hits']}회 / 미적중 {stats['misses']}회 (항목 {stats['entries']}개)")
+    if not clicked:
+        return []
+    return list(service_names) if target == "전체 서비스" else [target]
+
+# 스냅샷 수집 시각/소요 시간 표시
+def show_snapshot_info(inventory):
+    if inventory['collected_at']:
+        st.caption(
+            f"📦 스냅샷 기준 {inventory['collected_at'].strftime('%Y-%m-%d %H:%M:%S')} "
+            f"(마지막 수집 소요 {inventory['duration']:.1f}초) · 최신 데이터는 새로고침으로 수집합니다."
+        )
+
+# 수집 스피너 (다른 세션이 같은 프로젝트를 수집 중이면 대기 중임을 표시)
+def collection_spinner(project_key, message):
+    waiting = inflight_services(project_key)
+    if waiting:
+        message = f"다른 세션에서 수집 중인 {', '.join(waiting)} 결과를 기다리고 있습니다..."
+    return st.spinner(message)
@@ -1,91 +1,41 @@
 import streamlit as st
 import pandas as pd
-from models.project import get_project_names, get_project_info, get_projects_from_db
-from config.database import get_all_security_scores
-from utils.aws_session import create_aws_session
+from models.project import get_project_names, get_project_info
+from components.common import get_visible_project_names
+from config.database import get_all_security_scores, get_security_score_trend
+from services.registry import DASHBOARD_SERVICES
+from services.inventory_snapshot import load_project_inventory
 
-def filter_project_names_by_permission(project_names):
-    """사용자 권한에 따라 프로젝트명 필터링"""
-    user_projects = st.session_state.get('user_projects', '')
-    if user_projects == 'all':
-        return project_names
-    elif not user_projects:
-        return []
-    else:
-        # 프로젝트 ID로 프로젝트명 필터링
-        allowed_ids = [int(pid) for pid in user_projects.split(',') if pid.strip()]
-        all_projects = get_projects_from_db()
-        allowed_project_names = [p['project_name'] for p in all_projects if p['id'] in allowed_ids]
-        return [name for name in project_names if name in allowed_project_names]
-
-# 프로젝트별 서비스 현황 조회
-def get_project_services_count(project_name):
+# 프로젝트별 서비스 현황 조회 (최신 스냅샷의 리소스 수)
+def get_project_services_count(project_name, refresh=False):
     project_info = get_project_info(project_name)
     if not project_info:
         return {}
     
-    session = create_aws_session(
-        project_info['access_key'],
-        project_info['secret_key'],
-        project_info['region']
+    inventory = load_project_inventory(
+        project_info, DASHBOARD_SERVICES, DASHBOARD_SERVICES if refresh else ()
     )
-    
-    if not session:
-        return {}
-    
-    services_count = {}
-    
-    try:
-        # EC2 인스턴스 수
-        ec2 = session.client('ec2')
-        instances = ec2.describe_instances()
-        ec2_count = sum(len(reservation['Instances']) for reservation in instances['Reservations'])
-        services_count['EC2'] = ec2_count
-    except:
-        services_count['EC2'] = 0
-    
-    try:
-        # RDS 인스턴스 수
-        rds = session.client('rds')
-        db_instances = rds.describe_db_instances()
-        services_count['RDS'] = len(db_instances['DBInstances'])
-    except:
-        services_count['RDS'] = 0
-    
-    try:
-        # S3 버킷 수
-        s3 = session.client('s3')
-        buckets = s3.list_buckets()
-        services_count['S3'] = len(buckets['Buckets'])
-    except:
-        services_count['S3'] = 0
-    
-    try:
-        # ELB 수
-        elb = session.client('elbv2')
-        load_balancers = elb.describe_load_balancers()
-        services_count['ELB'] = len(load_balancers['LoadBalancers'])
-    except:
-        services_count['ELB'] = 0
-    
-    return services_count
+    return {name: len(frame) for name, frame in inventory['frames'].items()}
 
 # 대시보드 페이지
 def dashboard_page():
     st.title("📊 대시보드")
     
     # 프로젝트별 서비스 현황
-    st.subheader("🏗️ 프로젝트별 서비스 현황")
+    col1, col2 = st.columns([5, 1])
+    with col1:
+        st.subheader("🏗️ 프로젝트별 서비스 현황")
+    with col2:
+        refresh = st.button("🔄 새로고침", key="dashboard_refresh")
     
-    all_project_names = get_project_names()
-    project_names = filter_project_names_by_permission(all_project_names)
+    project_names = get_visible_project_names()
     
     if project_names:
         project_services_list = []
         
         with st.spinner("프로젝트별 서비스 현황을 조회하고 있습니다..."):
             for project_name in project_names:
-                services_count = get_project_services_count(project_name)
+                services_count = get_project_services_count(project_name, refresh)
                 
                 # 서비스 현황 문자열 생성
                 service_summary = []
@@ -122,7 +72,7 @@ def dashboard_page():
                 total_elb = sum(p['ELB'] for p in project_services_list)
                 st.metric("전체 ELB", total_elb)
     else:
-        if not all_project_names:
+        if not get_project_names():
             st.info("등록된 프로젝트가 없습니다. 프로젝트를 먼저 추가해주세요.")
         else:
             st.info("접근 가능한 프로젝트가 없습니다. 관리자에게 문의하세요.")
@@ -135,18 +85,8 @@ def dashboard_page():
     
     # DB에서 보안점수 조회 및 권한 필터링
     all_security_data = get_all_security_scores()
-    user_projects = st.session_state.get('user_projects', '')
-    
-    if user_projects == 'all':
-        security_data = all_security_data
-    elif user_projects:
-        # 프로젝트 ID로 필터링
-        allowed_ids = [int(pid) for pid in user_projects.split(',') if pid.strip()]
-        all_projects = get_projects_from_db()
-        allowed_project_names = [p['project_name'] for p in all_projects if p['id'] in allowed_ids]
-        security_data = [data for data in all_security_data if data['project'] in allowed_project_names]
-    else:
-        security_data = []
+    allowed_project_names = set(project_names)
+    security_data = [data for data in all_security_data if data['project'] in allowed_project_names]
     
     if security_data:
         # 보안점수별로 정렬 (높은 점수부터)
@@ -192,5 +132,12 @@ def dashboard_page():
             # 위험 상태 프로젝트 수
             risk_count = len([d for d in security_data if d['score'] < 60])
             st.metric("위험 프로젝트", risk_count)
+        
+        # 보안점수 추이 (점검 결과 이력을 SQL에서 일자별 점수로 집계)
+        trend = get_security_score_trend([data['project'] for data in security_data], days=30)
+        if trend:
+            st.markdown("#### 📈 보안점수 추이 (최근 30일)")
+            trend_df = pd.DataFrame(trend).pivot(index='day', columns='project', values='score')
+            st.line_chart(trend_df)
     else:
         st.info("보안점검을 수행한 프로젝트가 없습니다. 보안점검 메뉴에서 먼저 점검을 수행해주세요.")
\ No newline at end of file
@@ -1,94 +1,28 @@
 import streamlit as st
-from models.project import get_project_names, get_project_info, get_projects_from_db
-from config.database import get_db_connection
-
-def filter_project_names_by_permission(project_names):
-    """사용자 권한에 따라 프로젝트명 필터링"""
-    user_projects = st.session_state.get('user_projects', '')
-    if user_projects == 'all':
-        return project_names
-    elif not user_projects:
-        return []
-    else:
-        allowed_ids = [int(pid) for pid in user_projects.split(',') if pid.strip()]
-        all_projects = get_projects_from_db()
-        allowed_project_names = [p['project_name'] for p in all_projects if p['id'] in allowed_ids]
-        return [name for name in project_names if name in allowed_project_names]
-from utils.aws_session import create_aws_session
+from models.project import get_project_names, get_project_info
 from utils.diagram_generator import load_drawio_with_xml, generate_aws_drawio_xml
-from services.aws_ec2 import get_ec2_instances, get_ec2_reserved_instances
-from services.aws_database import get_rds_instances, get_rds_reserved_instances, get_elasticache_clusters
-from services.aws_storage import get_s3_buckets, get_efs_filesystems
-from services.aws_network import get_load_balancers, get_cloudfront_distributions
-from services.aws_security import get_waf_webacls, get_acm_certificates
-from services.aws_vpc import (
-    get_vpcs, get_subnets, get_internet_gateways, get_nat_gateways,
-    get_vpn_gateways, get_transit_gateways, get_vpc_peering_connections
-)
-from psycopg2 import Error
+from services.registry import DIAGRAM_SERVICES
+from services.inventory_snapshot import load_project_inventory
+from components.common import show_collection_errors, render_refresh_control, show_snapshot_info, collection_spinner, get_visible_project_names
 
-# VPC 구성도를 위한 전체 AWS 리소스 조회
-def get_full_aws_resources(project_name):
-    project_info = get_project_info(project_name)
+# VPC 구성도를 위한 전체 AWS 리소스 조회 (최신 스냅샷 기준)
+def get_full_aws_resources(project_info, refresh_services=()):
     if not project_info:
         return {}
     
-    # 실제 access_key 값 사용 (마스킹되지 않은)
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("SELECT * FROM project WHERE project_name = %s", (project_name,))
-            row = cursor.fetchone()
-            if row:
-                columns = [desc[0] for desc in cursor.description]
-                project_info = dict(zip(columns, row))
-        except Error as e:
-            st.error(f"프로젝트 정보 조회 오류: {e}")
-            return {}
-        finally:
-            connection.close()
+    # 기본 리소스 + VPC 관련 리소스 (스냅샷에 없거나 새로고침한 서비스만 병렬 수집)
+    inventory = load_project_inventory(project_info, DIAGRAM_SERVICES, refresh_services)
+    show_collection_errors(inventory['statuses'])
+    show_snapshot_info(inventory)
     
-    session = create_aws_session(
-        project_info['access_key'],
-        project_info['secret_key'],
-        project_info['region']
-    )
-    
-    if not session:
-        return {}
-    
-    # 기본 리소스 + VPC 관련 리소스
-    resources = {
-        'VPC': get_vpcs(session),
-        'Subnet': get_subnets(session),
-        'Internet Gateway': get_internet_gateways(session),
-        'NAT Gateway': get_nat_gateways(session),
-        'VPN Gateway': get_vpn_gateways(session),
-        'Transit Gateway': get_transit_gateways(session),
-        'VPC Peering': get_vpc_peering_connections(session),
-        'EC2': get_ec2_instances(session),
-        'RDS': get_rds_instances(session),
-        'S3': get_s3_buckets(session),
-        'ELB': get_load_balancers(session),
-        'ElastiCache': get_elasticache_clusters(session),
-        'EFS': get_efs_filesystems(session),
-        'CloudFront': get_cloudfront_distributions(session),
-        'AWS WAF': get_waf_webacls(session),
-        'ACM': get_acm_certificates(session),
-        'EC2 RI': get_ec2_reserved_instances(session),
-        'RDS RI': get_rds_reserved_instances(session)
-    }
-    
-    return resources
+    return inventory['frames']
 
 # 구성도 페이지
 def diagram_page():
     st.title("🗺️ 구성도")
     
     # 프로젝트 선택
-    all_project_names = get_project_names()
-    project_names = filter_project_names_by_permission(all_project_names)
+    project_names = get_visible_project_names()
     
     if project_names:
         # 선택된 프로젝트가 있으면 기본값으로 설정
@@ -106,10 +40,14 @@ def diagram_page():
         # 선택된 프로젝트 표시 및 구성도 생성
         if selected_project != "프로젝트 선택":
             st.info(f"선택된 프로젝트: **{selected_project}**")
+            project_info = get_project_info(selected_project)
+            refresh_services = []
+            if project_info:
+                refresh_services = render_refresh_control(project_info['id'], DIAGRAM_SERVICES, "diagram")
             
             # 프로젝트 선택 시 전체 AWS 리소스 조회 및 구성도 생성
-            with st.spinner(f"{selected_project} 프로젝트의 AWS 구성도를 생성하고 있습니다..."):
-                full_aws_data = get_full_aws_resources(selected_project)
+            with collection_spinner(project_info['id'] if project_info else None, f"{selected_project} 프로젝트의 AWS 구성도를 생성하고 있습니다..."):
+                full_aws_data = get_full_aws_resources(project_info, refresh_services)
             
             # 구성도그리기 페이지로 데이터 전달
             st.session_state.diagram_project = selected_project
@@ -136,7 +74,7 @@ def diagram_page():
         else:
             st.info("프로젝트를 선택하여 AWS 구성도를 생성하세요.")
     else:
-        if not all_project_names:
+        if not get_project_names():
             st.warning("등록된 프로젝트가 없습니다. 프로젝트를 먼저 추가해주세요.")
         else:
             st.warning("접근 가능한 프로젝트가 없습니다. 관리자에게 문의하세요.")
\ No newline at end of file
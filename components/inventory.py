@@ -2,31 +2,10 @@ import streamlit as st
 import pandas as pd
 import io
 from datetime import datetime
-from models.project import get_project_names, get_project_info, get_projects_from_db
-from utils.aws_session import create_aws_session
-
-def filter_project_names_by_permission(project_names):
-    """사용자 권한에 따라 프로젝트명 필터링"""
-    user_projects = st.session_state.get('user_projects', '')
-    if user_projects == 'all':
-        return project_names
-    elif not user_projects:
-        return []
-    else:
-        allowed_ids = [int(pid) for pid in user_projects.split(',') if pid.strip()]
-        all_projects = get_projects_from_db()
-        allowed_project_names = [p['project_name'] for p in all_projects if p['id'] in allowed_ids]
-        return [name for name in project_names if name in allowed_project_names]
-from services.aws_ec2 import get_ec2_instances, get_ec2_reserved_instances
-from services.aws_database import get_rds_instances, get_rds_reserved_instances, get_elasticache_clusters
-from services.aws_storage import get_s3_buckets, get_efs_filesystems
-from services.aws_network import get_load_balancers, get_cloudfront_distributions
-from services.aws_security import get_waf_webacls, get_acm_certificates
-from services.aws_vpc import (
-    get_vpcs, get_subnets, get_internet_gateways, get_nat_gateways,
-    get_vpn_gateways, get_vpn_connections, get_transit_gateways,
-    get_vpc_peering_connections, get_customer_gateways
-)
+from models.project import get_project_names, get_project_info
+from services.registry import INVENTORY_SERVICES, VPC_SERVICES
+from services.inventory_snapshot import load_project_inventory
+from components.common import show_collection_errors, render_refresh_control, show_snapshot_info, collection_spinner, get_visible_project_names
 
 # 인벤토리 페이지
 def inventory_page():
@@ -41,8 +20,7 @@ def inventory_page():
             st.rerun()
     
     # 프로젝트 선택
-    all_project_names = get_project_names()
-    project_names = filter_project_names_by_permission(all_project_names)
+    project_names = get_visible_project_names()
     
     if project_names:
         # 프로젝트에서 인벤토리 버튼을 눌렀을 때 자동 선택
@@ -71,7 +49,7 @@ def inventory_page():
             st.session_state.current_inventory_project = selected_project
         
     else:
-        if not all_project_names:
+        if not get_project_names():
             st.warning("등록된 프로젝트가 없습니다. 프로젝트를 먼저 추가해주세요.")
         else:
             st.warning("접근 가능한 프로젝트가 없습니다. 관리자에게 문의하세요.")
@@ -80,43 +58,21 @@ def inventory_page():
     # AWS 리소스 데이터 가져오기
     aws_data = {}
     vpc_data = {}
+    statuses = {}
     if selected_project and selected_project != "프로젝트 선택":
-        with st.spinner(f"{selected_project} 프로젝트의 AWS 리소스를 조회하고 있습니다..."):
-            project_info = get_project_info(selected_project)
-            if project_info:
-                session = create_aws_session(
-                    project_info['access_key'],
-                    project_info['secret_key'],
-                    project_info['region']
+        project_info = get_project_info(selected_project)
+        if project_info:
+            refresh_services = render_refresh_control(project_info['id'], INVENTORY_SERVICES + VPC_SERVICES, "inventory")
+            with collection_spinner(project_info['id'], f"{selected_project} 프로젝트의 AWS 리소스를 조회하고 있습니다..."):
+                # 최신 스냅샷 기준 조회 (스냅샷에 없거나 새로고침한 서비스만 병렬 수집)
+                inventory = load_project_inventory(
+                    project_info, INVENTORY_SERVICES + VPC_SERVICES, refresh_services
                 )
-                if session:
-                    # EC2 관련 데이터
-                    aws_data = {
-                        'EC2': get_ec2_instances(session),
-                        'RDS': get_rds_instances(session),
-                        'S3': get_s3_buckets(session),
-                        'ELB': get_load_balancers(session),
-                        'ElastiCache': get_elasticache_clusters(session),
-                        'EFS': get_efs_filesystems(session),
-                        'CloudFront': get_cloudfront_distributions(session),
-                        'AWS WAF': get_waf_webacls(session),
-                        'ACM': get_acm_certificates(session),
-                        'EC2 RI': get_ec2_reserved_instances(session),
-                        'RDS RI': get_rds_reserved_instances(session)
-                    }
-                    
-                    # VPC 관련 데이터
-                    vpc_data = {
-                        'VPC': get_vpcs(session),
-                        'Subnet': get_subnets(session),
-                        'Internet Gateway': get_internet_gateways(session),
-                        'NAT Gateway': get_nat_gateways(session),
-                        'VPN Gateway': get_vpn_gateways(session),
-                        'Site-to-Site VPN': get_vpn_connections(session),
-                        'Transit Gateway': get_transit_gateways(session),
-                        'VPC Peering': get_vpc_peering_connections(session),
-                        'Customer Gateway': get_customer_gateways(session)
-                    }
+            resources, statuses = inventory['frames'], inventory['statuses']
+            aws_data = {name: resources[name] for name in INVENTORY_SERVICES}
+            vpc_data = {name: resources[name] for name in VPC_SERVICES}
+            show_snapshot_info(inventory)
+        show_collection_errors(statuses)
         
         # 버튼 영역
         col1, col2 = st.columns([1, 1])
@@ -1,20 +1,17 @@
 import streamlit as st
 from models.project import (
-    add_project_to_db, get_projects_from_db, update_project_in_db,
-    get_project_original_info, delete_project_from_db
+    add_project_to_db, update_project_in_db, get_project_original_info,
+    delete_project_from_db, get_project_names, get_member_project_details
 )
 from config.database import update_user_projects
+from utils.aws_session import parse_regions, ALL_REGIONS
 
-def filter_projects_by_permission(projects):
-    """사용자 권한에 따라 프로젝트 필터링"""
-    user_projects = st.session_state.get('user_projects', '')
-    if user_projects == 'all':
-        return projects
-    elif not user_projects:
-        return []
-    else:
-        allowed_ids = [int(pid) for pid in user_projects.split(',') if pid.strip()]
-        return [p for p in projects if p['id'] in allowed_ids]
+# 선택 가능한 리전 ('all'은 계정에서 활성화된 전체 리전)
+REGIONS = [
+    "us-east-1", "us-east-2", "us-west-1", "us-west-2",
+    "ap-northeast-1", "ap-northeast-2", "ap-southeast-1", "ap-southeast-2",
+    "eu-west-1", "eu-west-2", "eu-central-1"
+]
 
 # 프로젝트 페이지
 def project_page():
@@ -47,11 +44,8 @@ def project_page():
             with st.form("add_project_form"):
                 project_name = st.text_input("프로젝트 명", placeholder="프로젝트 이름을 입력하세요")
                 account_id = st.text_input("Account ID", placeholder="AWS Account ID를 입력하세요")
-                region = st.selectbox("리전", [
-                    "us-east-1", "us-east-2", "us-west-1", "us-west-2",
-                    "ap-northeast-1", "ap-northeast-2", "ap-southeast-1", "ap-southeast-2",
-                    "eu-west-1", "eu-west-2", "eu-central-1"
-                ])
+                # 여러 리전 선택 가능 (첫 번째 리전이 기본 리전)
+                region = ','.join(st.multiselect("리전", REGIONS + [ALL_REGIONS], default=[REGIONS[0]]))
                 access_key = st.text_input("Access Key", placeholder="AWS Access Key를 입력하세요", type="password")
                 secret_key = st.text_input("Secret Key", placeholder="AWS Secret Key를 입력하세요", type="password")
                 
@@ -68,15 +62,6 @@ def project_page():
                             # 사용자 권한 업데이트 (admin이 아닌 경우)
                             if st.session_state.get('permission') != 'admin':
                                 update_user_projects(st.session_state.get('user_id'), project_id)
-                                # 세션 상태 업데이트
-                                current_projects = st.session_state.get('user_projects', '')
-                                if current_projects and current_projects != 'all':
-                                    projects_list = current_projects.split(',')
-                                    if str(project_id) not in projects_list:
-                                        projects_list.append(str(project_id))
-                                        st.session_state.user_projects = ','.join(projects_list)
-                                else:
-                                    st.session_state.user_projects = str(project_id)
                             
                             st.session_state.show_add_modal = False
                             st.success(f"프로젝트 '{project_name}'이(가) 추가되었습니다!")
@@ -100,9 +85,8 @@ def project_page():
                 with st.form("edit_project_form"):
                     edit_project_name = st.text_input("프로젝트 명", value=project_info['project_name'])
                     edit_account_id = st.text_input("Account ID", value=project_info['account_id'])
-                    regions = ["us-east-1", "us-east-2", "us-west-1", "us-west-2", "ap-northeast-1", "ap-northeast-2", "ap-southeast-1", "ap-southeast-2", "eu-west-1", "eu-west-2", "eu-central-1"]
-                    region_index = regions.index(project_info['region']) if project_info['region'] in regions else 0
-                    edit_region = st.selectbox("리전", regions, index=region_index)
+                    current_regions = [region for region in parse_regions(project_info['region']) if region in REGIONS + [ALL_REGIONS]]
+                    edit_region = ','.join(st.multiselect("리전", REGIONS + [ALL_REGIONS], default=current_regions or [REGIONS[0]]))
                     edit_access_key = st.text_input("Access Key", value=project_info['access_key'], type="password")
                     edit_secret_key = st.text_input("Secret Key", value=project_info['secret_key'], type="password")
                     
@@ -131,11 +115,11 @@ def project_page():
     
     # 프로젝트 목록
     st.markdown("### 프로젝트 목록")
-    all_projects = get_projects_from_db()
-    projects = filter_projects_by_permission(all_projects)
+    # 접근 가능한 프로젝트의 상세 정보 (마스킹된 키 포함)
+    projects = get_member_project_details(st.session_state.get('user_id'))
     
     if not projects:
-        if not all_projects:
+        if not get_project_names():
             st.info("등록된 프로젝트가 없습니다. 새 프로젝트를 추가해주세요.")
         else:
             st.info("접근 가능한 프로젝트가 없습니다. 관리자에게 문의하세요.")
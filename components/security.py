@@ -1,25 +1,132 @@
 import streamlit as st
 import pandas as pd
-from models.project import get_project_names, get_project_info, get_projects_from_db
-from utils.aws_session import create_aws_session
+from models.project import get_project_names, get_project_info
+from components.common import get_visible_project_names
+from utils.aws_session import create_project_session
+import uuid
+from config.database import update_security_score, record_security_results, compact_security_results, get_security_runs
+from services.security_checks import (
+    SECURITY_CHECKS, run_security_checks, summarize_security_results, security_result_rows, diff_security_runs
+)
+
+# 취약성여부에 따른 행 색상
+VERDICT_COLORS = {'취약함': 'red', '양호함': 'blue', '확인불가': 'orange'}
+
+# 심각도 표시
+SEVERITY_BADGES = {'Critical': '🟣 Critical', 'High': '🔴 High', 'Medium': '🟠 Medium', 'Low': '🟡 Low'}
 
-def filter_project_names_by_permission(project_names):
-    """사용자 권한에 따라 프로젝트명 필터링"""
-    user_projects = st.session_state.get('user_projects', '')
-    if user_projects == 'all':
-        return project_names
-    elif not user_projects:
-        return []
+# 점검 결과 행을 취약성여부에 따라 색상 표시
+def highlight_verdict(row):
+    color = VERDICT_COLORS.get(row.get('취약성여부'))
+    return [f'color: {color}' if color else ''] * len(row)
+
+# 점검 1개 결과 표시
+def render_check_result(number, outcome):
+    check = outcome['check']
+    st.markdown(f"### {number}. {check['title']}")
+    st.caption(SEVERITY_BADGES.get(check['severity'], check['severity']))
+    if outcome['status'] == 'error':
+        st.error(outcome['message'])
+        return
+    result = outcome['result']
+    if result.empty:
+        st.info(check['empty_message'])
+    elif '취약성여부' in result.columns:
+        st.dataframe(result.style.apply(highlight_verdict, axis=1), use_container_width=True)
     else:
-        allowed_ids = [int(pid) for pid in user_projects.split(',') if pid.strip()]
-        all_projects = get_projects_from_db()
-        allowed_project_names = [p['project_name'] for p in all_projects if p['id'] in allowed_ids]
-        return [name for name in project_names if name in allowed_project_names]
-from config.database import update_security_score
-from services.aws_security_check import (
-    check_s3_public_access, check_sg_open_to_world, check_iam_mfa,
-    check_root_account, check_cloudtrail_logging
-)
+        st.dataframe(result, use_container_width=True, hide_index=True)
+
+# 탐지 항목 목록 표시
+def _findings_frame(findings):
+    return pd.DataFrame(
+        [(SECURITY_CHECKS[check_id]['title'] if check_id in SECURITY_CHECKS else check_id, resource_id)
+         for check_id, resource_id in findings],
+        columns=['점검 항목', '리소스']
+    )
+
+# 저장된 두 실행 간 탐지 항목 변경 표시 (재점검 없이 DB 이력만 비교, 기본: 이번 실행과 직전 실행)
+def render_findings_diff(project_name, run_id):
+    st.markdown("---")
+    st.subheader("점검 간 변경 사항")
+    runs = get_security_runs(project_name)
+    if len(runs) < 2:
+        st.info("비교할 이전 점검 결과가 없습니다.")
+        return
+
+    labels = {run['run_id']: f"{run['created_at']:%Y-%m-%d %H:%M:%S}" for run in runs}
+    run_ids = list(labels)
+    col1, col2 = st.columns(2)
+    with col1:
+        base_run_id = st.selectbox(
+            "기준 점검", run_ids, index=1, format_func=labels.get, key=f"diff_base_run_{project_name}"
+        )
+    with col2:
+        target_index = run_ids.index(run_id) if run_id in run_ids else 0
+        target_run_id = st.selectbox(
+            "비교 점검", run_ids, index=target_index, format_func=labels.get, key=f"diff_target_run_{project_name}"
+        )
+
+    diff = diff_security_runs(project_name, target_run_id, base_run_id)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("신규 탐지", len(diff['new']))
+    with col2:
+        st.metric("해소", len(diff['resolved']))
+    with col3:
+        st.metric("유지", len(diff['unchanged']))
+
+    for title, key in (("신규 탐지", 'new'), ("해소", 'resolved')):
+        if diff[key]:
+            with st.expander(f"{title} ({len(diff[key])})", expanded=key == 'new'):
+                st.dataframe(_findings_frame(diff[key]), use_container_width=True, hide_index=True)
+
+# 프로젝트 보안점검 1회 실행 후 결과 이력과 점수 저장 (실패 시 None)
+def run_project_security_scan(project_name):
+    """반환값: {'run_id', 'results', 'summary', 'score_saved'}"""
+    project_info = get_project_info(project_name)
+    if not project_info:
+        st.error("프로젝트 정보를 찾을 수 없습니다.")
+        return None
+    session = create_project_session(project_info)
+    if not session:
+        st.error("AWS 세션 생성에 실패했습니다.")
+        return None
+
+    # 등록된 보안점검 병렬 실행 (공유 입력 1회 조회)
+    results = run_security_checks(session)
+    
+    # 점검 항목별 결과 이력 저장 (오래된 이력은 일별 집계로 압축)
+    run_id = uuid.uuid4().hex
+    if record_security_results(project_name, run_id, security_result_rows(results)):
+        compact_security_results()
+    
+    summary = summarize_security_results(results)
+    score_saved = summary['score'] is not None and update_security_score(project_name, summary['score'])
+    return {'run_id': run_id, 'results': results, 'summary': summary, 'score_saved': score_saved}
+
+# 저장된 보안점검 실행 결과 표시
+def render_security_scan(scan):
+    st.subheader("AWS 보안점검 결과")
+    for number, outcome in enumerate(scan['results'].values(), start=1):
+        render_check_result(number, outcome)
+    
+    # 전체 요약
+    st.markdown("---")
+    st.subheader("보안점검 요약")
+    
+    summary = scan['summary']
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("취약한 항목", summary['vulnerable'])
+    with col2:
+        st.metric("양호한 항목", summary['good'])
+    with col3:
+        if summary['score'] is not None:
+            st.metric("보안 점수", f"{summary['score']}%")
+            if scan['score_saved']:
+                st.success(f"보안점수 {summary['score']}%가 저장되었습니다.")
+        else:
+            st.warning("보안점검 항목이 없습니다.")
 
 # 보안점검 페이지
 def security_page():
@@ -34,8 +141,7 @@ def security_page():
             st.rerun()
     
     # 프로젝트 선택
-    all_project_names = get_project_names()
-    project_names = filter_project_names_by_permission(all_project_names)
+    project_names = get_visible_project_names()
     
     if project_names:
         default_index = 0
@@ -52,141 +158,28 @@ def security_page():
         if selected_project != "프로젝트 선택":
             st.session_state.selected_project = selected_project
             
-            # AWS 보안점검 수행
-            with st.spinner(f"{selected_project} 프로젝트의 보안점검을 수행하고 있습니다..."):
-                project_info = get_project_info(selected_project)
-                if project_info:
-                    session = create_aws_session(
-                        project_info['access_key'],
-                        project_info['secret_key'],
-                        project_info['region']
-                    )
-                    
-                    if session:
-                        # 보안점검 항목들
-                        st.subheader("AWS 보안점검 결과")
-                        
-                        # 1. S3 Public 여부
-                        st.markdown("### 1. S3 Public Access 점검")
-                        s3_results = check_s3_public_access(session)
-                        if not s3_results.empty:
-                            # 취약함 항목을 빨간색으로 표시
-                            def highlight_vulnerable(row):
-                                if row['취약성여부'] == '취약함':
-                                    return ['color: red'] * len(row)
-                                elif row['취약성여부'] == '양호함':
-                                    return ['color: blue'] * len(row)
-                                return [''] * len(row)
-                            
-                            styled_s3 = s3_results.style.apply(highlight_vulnerable, axis=1)
-                            st.dataframe(styled_s3, use_container_width=True)
-                        else:
-                            st.info("S3 버킷이 없습니다.")
-                        
-                        # 2. Security Group Inbound 0.0.0.0/0
-                        st.markdown("### 2. Security Group Inbound 0.0.0.0/0 점검")
-                        sg_results = check_sg_open_to_world(session)
-                        if not sg_results.empty:
-                            def highlight_vulnerable_sg(row):
-                                if row['취약성여부'] == '취약함':
-                                    return ['color: red'] * len(row)
-                                elif row['취약성여부'] == '양호함':
-                                    return ['color: blue'] * len(row)
-                                return [''] * len(row)
-                            
-                            styled_sg = sg_results.style.apply(highlight_vulnerable_sg, axis=1)
-                            st.dataframe(styled_sg, use_container_width=True)
-                        else:
-                            st.info("Security Group이 없습니다.")
-                        
-                        # 3. IAM 사용자 MFA
-                        st.markdown("### 3. IAM 사용자 MFA 활성화 점검")
-                        iam_results = check_iam_mfa(session)
-                        if not iam_results.empty:
-                            def highlight_vulnerable_iam(row):
-                                if row['취약성여부'] == '취약함':
-                                    return ['color: red'] * len(row)
-                                elif row['취약성여부'] == '양호함':
-                                    return ['color: blue'] * len(row)
-                                return [''] * len(row)
-                            
-                            styled_iam = iam_results.style.apply(highlight_vulnerable_iam, axis=1)
-                            st.dataframe(styled_iam, use_container_width=True)
-                        else:
-                            st.info("IAM 사용자가 없습니다.")
-                        
-                        # 4. Root 계정 사용 및 액세스키
-                        st.markdown("### 4. Root 계정 사용 및 액세스키 점검")
-                        root_results = check_root_account(session)
-                        if not root_results.empty:
-                            def highlight_vulnerable_root(row):
-                                if row['취약성여부'] == '취약함':
-                                    return ['color: red'] * len(row)
-                                elif row['취약성여부'] == '양호함':
-                                    return ['color: blue'] * len(row)
-                                elif row['취약성여부'] == '확인불가':
-                                    return ['color: orange'] * len(row)
-                                return [''] * len(row)
-                            
-                            styled_root = root_results.style.apply(highlight_vulnerable_root, axis=1)
-                            st.dataframe(styled_root, use_container_width=True)
-                        else:
-                            st.info("Root 계정 정보를 확인할 수 없습니다.")
-                        
-                        # 5. CloudTrail 로그 활성화
-                        st.markdown("### 5. CloudTrail 로그 활성화 점검")
-                        cloudtrail_results = check_cloudtrail_logging(session)
-                        if not cloudtrail_results.empty:
-                            def highlight_vulnerable_cloudtrail(row):
-                                if row['취약성여부'] == '취약함':
-                                    return ['color: red'] * len(row)
-                                elif row['취약성여부'] == '양호함':
-                                    return ['color: blue'] * len(row)
-                                elif row['취약성여부'] == '확인불가':
-                                    return ['color: orange'] * len(row)
-                                return [''] * len(row)
-                            
-                            styled_cloudtrail = cloudtrail_results.style.apply(highlight_vulnerable_cloudtrail, axis=1)
-                            st.dataframe(styled_cloudtrail, use_container_width=True)
-                        else:
-                            st.info("CloudTrail 정보를 확인할 수 없습니다.")
-                        
-                        # 전체 요약
-                        st.markdown("---")
-                        st.subheader("보안점검 요약")
-                        
-                        total_vulnerable = 0
-                        total_good = 0
-                        
-                        for df in [s3_results, sg_results, iam_results, root_results, cloudtrail_results]:
-                            if not df.empty and '취약성여부' in df.columns:
-                                total_vulnerable += len(df[df['취약성여부'] == '취약함'])
-                                total_good += len(df[df['취약성여부'] == '양호함'])
-                        
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("취약한 항목", total_vulnerable)
-                        with col2:
-                            st.metric("양호한 항목", total_good)
-                        with col3:
-                            total_items = total_vulnerable + total_good
-                            if total_items > 0:
-                                security_score = round((total_good / total_items) * 100, 1)
-                                st.metric("보안 점수", f"{security_score}%")
-                                
-                                # 보안점수를 DB에 저장
-                                if update_security_score(selected_project, security_score):
-                                    st.success(f"보안점수 {security_score}%가 저장되었습니다.")
-                            else:
-                                st.warning("보안점검 항목이 없습니다.")
-                    else:
-                        st.error("AWS 세션 생성에 실패했습니다.")
-                else:
-                    st.error("프로젝트 정보를 찾을 수 없습니다.")
+            # 보안점검은 버튼을 눌렀을 때만 수행 (rerun마다 점검 이력이 쌓이지 않도록)
+            scans = st.session_state.setdefault('security_scans', {})
+            if st.button("🔍 점검 실행", type="primary", key="run_security_scan"):
+                with st.spinner(f"{selected_project} 프로젝트의 보안점검을 수행하고 있습니다..."):
+                    scan = run_project_security_scan(selected_project)
+                if scan:
+                    scans[selected_project] = scan
+                    # 비교 선택을 새 실행 기준으로 초기화
+                    st.session_state.pop(f"diff_base_run_{selected_project}", None)
+                    st.session_state.pop(f"diff_target_run_{selected_project}", None)
+            
+            scan = scans.get(selected_project)
+            if scan:
+                render_security_scan(scan)
+            else:
+                st.info("'점검 실행'을 눌러 보안점검을 수행하세요.")
+            
+            render_findings_diff(selected_project, scan['run_id'] if scan else None)
         else:
             st.info("프로젝트를 선택하여 보안점검을 수행하세요.")
     else:
-        if not all_project_names:
+        if not get_project_names():
             st.warning("등록된 프로젝트가 없습니다. 프로젝트를 먼저 추가해주세요.")
         else:
             st.warning("접근 가능한 프로젝트가 없습니다. 관리자에게 문의하세요.")
\ No newline at end of file
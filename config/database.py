@@ -1,13 +1,29 @@
 import os
+import time
+import threading
+from contextlib import contextmanager
 import psycopg2
 from psycopg2 import Error
-import streamlit as st
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
+from utils.errors import report_error
 
 # 환경변수 로드
 load_dotenv()
 
-# 데이터베이스 연결 함수
+# 연결 풀 크기 (프로세스당 동시에 사용하는 최대 연결 수)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '10'))
+# 풀이 가득 찼을 때 연결 반환을 기다리는 시간 (초)
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '10'))
+# 이 시간(초) 이상 유휴 상태였던 연결은 재사용 전에 SELECT 1로 확인
+DB_POOL_CHECK_INTERVAL = float(os.getenv('DB_POOL_CHECK_INTERVAL', '30'))
+
+# 프로세스 전역 연결 풀 {'pid', 'idle': [(연결, 반환 시각)], 'slots': 세마포어}
+_pool = {'pid': None, 'idle': [], 'slots': None}
+_pool_lock = threading.Lock()
+
+# 데이터베이스 연결 함수 (풀을 거치지 않는 새 연결)
 def get_db_connection():
     try:
         connection = psycopg2.connect(
@@ -19,207 +35,641 @@ def get_db_connection():
         )
         return connection
     except Error as e:
-        st.error(f"데이터베이스 연결 오류: {e}")
+        report_error(f"데이터베이스 연결 오류: {e}")
         return None
 
-# 프로젝트 테이블 생성
-def create_projects_table():
+# 현재 프로세스의 연결 풀
+def _connection_pool():
+    with _pool_lock:
+        if _pool['pid'] != os.getpid():
+            # fork된 자식 프로세스는 부모와 소켓을 공유하므로 상속한 연결을 닫지 않고 버림
+            _pool.update(pid=os.getpid(), idle=[], slots=threading.BoundedSemaphore(DB_POOL_SIZE))
+        return _pool
+
+def _close_quietly(connection):
+    try:
+        connection.close()
+    except Error:
+        pass
+
+# 유휴 연결 상태 확인 (최근 반환된 연결은 왕복 없이 재사용)
+def _is_healthy(connection, idle_since):
+    if connection.closed:
+        return False
+    if time.monotonic() - idle_since < DB_POOL_CHECK_INTERVAL:
+        return True
+    try:
+        cursor = connection.cursor()
+        cursor.execute("SELECT 1")
+        connection.rollback()
+        return True
+    except Error:
+        return False
+
+# 풀에서 연결 대여 (유휴 연결이 없으면 새로 연결, 실패 시 None)
+def _acquire_connection(pool):
+    if not pool['slots'].acquire(timeout=DB_POOL_TIMEOUT):
+        report_error("데이터베이스 연결 대기 시간이 초과되었습니다.")
+        return None
+    while True:
+        with _pool_lock:
+            entry = pool['idle'].pop() if pool['idle'] else None
+        if entry is None:
+            break
+        connection, idle_since = entry
+        if _is_healthy(connection, idle_since):
+            return connection
+        _close_quietly(connection)
+
     connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            # 프로젝트 테이블 생성
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS project (
-                    id SERIAL PRIMARY KEY,
-                    project_name VARCHAR(255) NOT NULL,
-                    account_id VARCHAR(255) NOT NULL,
-                    region VARCHAR(100) NOT NULL,
-                    access_key VARCHAR(255) NOT NULL,
-                    secret_key VARCHAR(255) NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # 보안점검 테이블 생성
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS security (
-                    id SERIAL PRIMARY KEY,
-                    project_name VARCHAR(255) NOT NULL UNIQUE,
-                    security_point DECIMAL(5,2) NOT NULL,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # 시퀀스 재설정 시도
-            try:
-                cursor.execute("SELECT MAX(id) FROM project")
-                max_id = cursor.fetchone()[0]
-                if max_id is not None:
-                    cursor.execute(f"ALTER SEQUENCE project_id_seq RESTART WITH {max_id + 1}")
-            except:
-                pass  # 시퀀스 재설정 실패는 무시
-                
-            connection.commit()
-        except Error as e:
-            st.error(f"테이블 생성 오류: {e}")
-        finally:
-            connection.close()
+    if connection is None:
+        pool['slots'].release()
+    return connection
+
+# 연결 반환 (끝나지 않은 트랜잭션은 롤백, 끊어진 연결은 폐기)
+def _release_connection(pool, connection):
+    try:
+        reusable = not connection.closed and connection.get_transaction_status() != TRANSACTION_STATUS_UNKNOWN
+        if reusable and connection.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            connection.rollback()
+    except Error:
+        reusable = False
+
+    if reusable:
+        with _pool_lock:
+            pool['idle'].append((connection, time.monotonic()))
+    else:
+        _close_quietly(connection)
+    pool['slots'].release()
+
+# 풀 연결 컨텍스트 (연결 실패 시 None, 블록이 끝나면 풀에 반환)
+@contextmanager
+def db_connection():
+    pool = _connection_pool()
+    connection = _acquire_connection(pool)
+    try:
+        yield connection
+    finally:
+        if connection is not None:
+            _release_connection(pool, connection)
+
+# 스키마 마이그레이션 (버전, 설명, SQL 문 목록), 버전 순서대로 1회씩 적용
+# SQL 문은 문자열 또는 (문자열, 파라미터), 기존 배포에 처음 적용될 때를 위해 IF NOT EXISTS 사용
+MIGRATIONS = [
+    (1, "프로젝트/보안점수/멤버 테이블", [
+        """
+        CREATE TABLE IF NOT EXISTS project (
+            id SERIAL PRIMARY KEY,
+            project_name VARCHAR(255) NOT NULL,
+            account_id VARCHAR(255) NOT NULL,
+            region VARCHAR(100) NOT NULL,
+            access_key VARCHAR(255) NOT NULL,
+            secret_key VARCHAR(255) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS security (
+            id SERIAL PRIMARY KEY,
+            project_name VARCHAR(255) NOT NULL UNIQUE,
+            security_point DECIMAL(5,2) NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS member (
+            id VARCHAR(255) PRIMARY KEY,
+            pw VARCHAR(255) NOT NULL,
+            permission VARCHAR(50) DEFAULT 'user',
+            projects TEXT DEFAULT '',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # admin 계정 생성 (이미 존재하면 무시)
+        ("""
+        INSERT INTO member (id, pw, permission, projects)
+        VALUES (%s, %s, %s, %s)
+        ON CONFLICT (id) DO NOTHING
+        """, ('admin', 'Woongjin!2025', 'admin', 'all')),
+        # 직접 입력된 기존 데이터가 있으면 시퀀스를 최대 ID 다음으로 재설정
+        "SELECT setval('project_id_seq', COALESCE((SELECT MAX(id) FROM project), 0) + 1, false)"
+    ]),
+    (2, "보안점검 결과 이력", [
+        """
+        CREATE TABLE IF NOT EXISTS security_result (
+            id BIGSERIAL PRIMARY KEY,
+            run_id VARCHAR(64) NOT NULL,
+            project_name VARCHAR(255) NOT NULL,
+            check_id VARCHAR(100) NOT NULL,
+            resource_id TEXT NOT NULL,
+            status VARCHAR(20) NOT NULL,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_security_result_project ON security_result (project_name, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_security_result_run ON security_result (run_id)",
+        "CREATE INDEX IF NOT EXISTS idx_security_result_created ON security_result (created_at)",
+        """
+        CREATE TABLE IF NOT EXISTS security_result_daily (
+            project_name VARCHAR(255) NOT NULL,
+            day DATE NOT NULL,
+            check_id VARCHAR(100) NOT NULL,
+            status VARCHAR(20) NOT NULL,
+            result_count INTEGER NOT NULL,
+            PRIMARY KEY (project_name, day, check_id, status)
+        )
+        """
+    ]),
+    # 여러 리전(쉼표 구분)을 저장할 수 있도록 region 컬럼 확장
+    (3, "프로젝트 다중 리전", [
+        "ALTER TABLE project ALTER COLUMN region TYPE TEXT"
+    ]),
+    # payload: 압축된 서비스별 DataFrame
+    (4, "인벤토리 스냅샷", [
+        """
+        CREATE TABLE IF NOT EXISTS inventory_snapshot (
+            id SERIAL PRIMARY KEY,
+            project_id INTEGER NOT NULL,
+            collected_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            duration_ms INTEGER NOT NULL,
+            service_status TEXT NOT NULL,
+            payload BYTEA NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_inventory_snapshot_project ON inventory_snapshot (project_id, collected_at DESC)"
+    ]),
+    # 계정별 CloudTrail 조회 완료 시점과 Root 마지막 사용 시각
+    (5, "Root 계정 사용 조회 상태", [
+        """
+        CREATE TABLE IF NOT EXISTS root_activity (
+            account_id VARCHAR(20) PRIMARY KEY,
+            scanned_until TIMESTAMPTZ NOT NULL,
+            last_used_at TIMESTAMPTZ,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    ]),
+    # 점검 ID + 리소스 ID 해시, 실행 간 비교용
+    (6, "보안점검 탐지 항목 키", [
+        "ALTER TABLE security_result ADD COLUMN IF NOT EXISTS finding_key BIGINT"
+    ]),
+    # 버킷 이름+생성일 기준, 같은 이름으로 재생성되면 새 행
+    (7, "S3 버킷 메타데이터", [
+        """
+        CREATE TABLE IF NOT EXISTS s3_bucket_metadata (
+            bucket_name VARCHAR(63) NOT NULL,
+            creation_date TIMESTAMPTZ NOT NULL,
+            region VARCHAR(30) NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (bucket_name, creation_date)
+        )
+        """
+    ]),
+    # member.projects 쉼표 구분 문자열을 (멤버, 프로젝트) 행으로 정규화, 'all'은 all_projects 플래그로 변환
+    (8, "멤버-프로젝트 권한 테이블", [
+        """
+        CREATE TABLE IF NOT EXISTS member_project (
+            member_id VARCHAR(255) NOT NULL REFERENCES member (id) ON DELETE CASCADE,
+            project_id INTEGER NOT NULL REFERENCES project (id) ON DELETE CASCADE,
+            PRIMARY KEY (member_id, project_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_member_project_project ON member_project (project_id, member_id)",
+        "ALTER TABLE member ADD COLUMN IF NOT EXISTS all_projects BOOLEAN NOT NULL DEFAULT FALSE",
+        """
+        INSERT INTO member_project (member_id, project_id)
+        SELECT m.id, p.id
+        FROM member m
+        CROSS JOIN LATERAL unnest(string_to_array(m.projects, ',')) AS csv (project_id)
+        JOIN project p ON p.id::TEXT = TRIM(csv.project_id)
+        WHERE m.projects <> 'all'
+        ON CONFLICT DO NOTHING
+        """,
+        "UPDATE member SET all_projects = TRUE WHERE projects = 'all'",
+        "ALTER TABLE member DROP COLUMN IF EXISTS projects"
+    ]),
+    # 이름 중복 프로젝트는 가장 먼저 등록된 것 외에 ID를 붙여 이름 변경 후 고유 인덱스 생성
+    # 프로젝트명 기준 이력(보안점수, 점검 결과, 일별 집계)은 중복 프로젝트 간에 구분할 수 없으므로
+    # 변경 전 이력을 새 이름으로 복사하여 두 프로젝트 모두 변경 전과 같은 이력/추이를 유지
+    (9, "프로젝트명 고유 인덱스", [
+        """
+        CREATE TEMP TABLE project_rename ON COMMIT DROP AS
+        SELECT p.id, p.project_name AS old_name, p.project_name || ' (' || p.id || ')' AS new_name
+        FROM project p
+        WHERE EXISTS (
+            SELECT 1 FROM project other
+            WHERE other.project_name = p.project_name AND other.id < p.id
+        )
+        """,
+        """
+        UPDATE project p
+        SET project_name = r.new_name
+        FROM project_rename r
+        WHERE p.id = r.id
+        """,
+        """
+        INSERT INTO security (project_name, security_point, updated_at)
+        SELECT r.new_name, s.security_point, s.updated_at
+        FROM project_rename r
+        JOIN security s ON s.project_name = r.old_name
+        ON CONFLICT (project_name) DO NOTHING
+        """,
+        # 복사한 실행은 새 run_id로 구분 (run_id만으로 탐지 항목을 조회하므로)
+        """
+        INSERT INTO security_result (run_id, project_name, check_id, resource_id, status, created_at, finding_key)
+        SELECT md5(sr.run_id || ':' || r.new_name), r.new_name, sr.check_id, sr.resource_id, sr.status, sr.created_at, sr.finding_key
+        FROM project_rename r
+        JOIN security_result sr ON sr.project_name = r.old_name
+        """,
+        """
+        INSERT INTO security_result_daily (project_name, day, check_id, status, result_count)
+        SELECT r.new_name, d.day, d.check_id, d.status, d.result_count
+        FROM project_rename r
+        JOIN security_result_daily d ON d.project_name = r.old_name
+        ON CONFLICT (project_name, day, check_id, status) DO NOTHING
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_project_name ON project (project_name)"
+    ])
+]
+
+# 여러 프로세스(앱, 스냅샷 워커, 보안점검 실행기)가 동시에 마이그레이션하지 않도록 사용하는 advisory lock 키
+_MIGRATION_LOCK_ID = 7217001
+
+# 프로세스 내 스키마 준비 여부
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+# 적용되지 않은 마이그레이션 적용 (마이그레이션별 트랜잭션, 적용된 버전 목록 반환)
+def migrate_schema():
+    """DB 연결 또는 마이그레이션 실패 시 None"""
+    applied = None
+    with db_connection() as connection:
+        if connection:
+            applied = []
+            try:
+                cursor = connection.cursor()
+                cursor.execute("SELECT pg_advisory_lock(%s)", (_MIGRATION_LOCK_ID,))
+                try:
+                    cursor.execute("""
+                        CREATE TABLE IF NOT EXISTS schema_migrations (
+                            version INTEGER PRIMARY KEY,
+                            description VARCHAR(255) NOT NULL,
+                            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        )
+                    """)
+                    cursor.execute("SELECT version FROM schema_migrations")
+                    current = {row[0] for row in cursor.fetchall()}
+                    connection.commit()
+
+                    for version, description, statements in MIGRATIONS:
+                        if version in current:
+                            continue
+                        for statement in statements:
+                            sql, params = statement if isinstance(statement, tuple) else (statement, None)
+                            cursor.execute(sql, params)
+                        cursor.execute(
+                            "INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+                            (version, description)
+                        )
+                        connection.commit()
+                        applied.append(version)
+                finally:
+                    connection.rollback()
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", (_MIGRATION_LOCK_ID,))
+                    connection.commit()
+            except Error as e:
+                report_error(f"스키마 마이그레이션 오류: {e}")
+                return None
+    return applied
+
+# 스키마 준비 (프로세스당 1회, 실패하면 다음 호출에서 재시도)
+def ensure_schema():
+    global _schema_ready
+    if _schema_ready:
+        return True
+    with _schema_lock:
+        if not _schema_ready:
+            _schema_ready = migrate_schema() is not None
+    return _schema_ready
 
 # 보안점수 저장/업데이트
 def update_security_score(project_name, security_point):
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            # UPSERT (INSERT ON CONFLICT UPDATE)
-            cursor.execute("""
-                INSERT INTO security (project_name, security_point, updated_at)
-                VALUES (%s, %s, CURRENT_TIMESTAMP)
-                ON CONFLICT (project_name)
-                DO UPDATE SET 
-                    security_point = EXCLUDED.security_point,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (project_name, security_point))
-            connection.commit()
-            return True
-        except Error as e:
-            st.error(f"보안점수 저장 오류: {e}")
-            return False
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                # UPSERT (INSERT ON CONFLICT UPDATE)
+                cursor.execute("""
+                    INSERT INTO security (project_name, security_point, updated_at)
+                    VALUES (%s, %s, CURRENT_TIMESTAMP)
+                    ON CONFLICT (project_name)
+                    DO UPDATE SET 
+                        security_point = EXCLUDED.security_point,
+                        updated_at = CURRENT_TIMESTAMP
+                """, (project_name, security_point))
+                connection.commit()
+                return True
+            except Error as e:
+                report_error(f"보안점수 저장 오류: {e}")
+                return False
     return False
 
 # 모든 프로젝트의 보안점수 조회
 def get_all_security_scores():
-    connection = get_db_connection()
     security_scores = []
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("SELECT project_name, security_point FROM security ORDER BY security_point DESC")
-            rows = cursor.fetchall()
-            security_scores = [{'project': row[0], 'score': float(row[1])} for row in rows]
-        except Error as e:
-            st.error(f"보안점수 조회 오류: {e}")
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("SELECT project_name, security_point FROM security ORDER BY security_point DESC")
+                rows = cursor.fetchall()
+                security_scores = [{'project': row[0], 'score': float(row[1])} for row in rows]
+            except Error as e:
+                report_error(f"보안점수 조회 오류: {e}")
     return security_scores
 
-# 멤버 테이블 생성
-def create_member_table():
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS member (
-                    id VARCHAR(255) PRIMARY KEY,
-                    pw VARCHAR(255) NOT NULL,
-                    permission VARCHAR(50) DEFAULT 'user',
-                    projects TEXT DEFAULT '',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+# Root 계정 사용 조회 상태 조회 ({'scanned_until', 'last_used_at'}, 이력이 없으면 None)
+def get_root_activity(account_id):
+    activity = None
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute(
+                    "SELECT scanned_until, last_used_at FROM root_activity WHERE account_id = %s",
+                    (account_id,)
                 )
-            """)
-            
-            # admin 계정 생성 (이미 존재하면 무시)
-            cursor.execute("""
-                INSERT INTO member (id, pw, permission, projects)
-                VALUES (%s, %s, %s, %s)
-                ON CONFLICT (id) DO NOTHING
-            """, ('admin', 'Woongjin!2025', 'admin', 'all'))
-            
-            connection.commit()
-        except Error as e:
-            st.error(f"멤버 테이블 생성 오류: {e}")
-        finally:
-            connection.close()
+                row = cursor.fetchone()
+                if row:
+                    activity = {'scanned_until': row[0], 'last_used_at': row[1]}
+            except Error as e:
+                report_error(f"Root 계정 사용 이력 조회 오류: {e}")
+    return activity
+
+# Root 계정 사용 조회 상태 저장 (마지막 사용 시각은 더 최근 값만 반영)
+def save_root_activity(account_id, scanned_until, last_used_at):
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    INSERT INTO root_activity (account_id, scanned_until, last_used_at, updated_at)
+                    VALUES (%s, %s, %s, CURRENT_TIMESTAMP)
+                    ON CONFLICT (account_id)
+                    DO UPDATE SET
+                        scanned_until = GREATEST(root_activity.scanned_until, EXCLUDED.scanned_until),
+                        last_used_at = GREATEST(root_activity.last_used_at, EXCLUDED.last_used_at),
+                        updated_at = CURRENT_TIMESTAMP
+                """, (account_id, scanned_until, last_used_at))
+                connection.commit()
+                return True
+            except Error as e:
+                report_error(f"Root 계정 사용 이력 저장 오류: {e}")
+                return False
+    return False
+
+# S3 버킷 메타데이터 일괄 조회 (buckets: [(bucket_name, creation_date)])
+def get_bucket_metadata(buckets):
+    """반환값: {(bucket_name, creation_date): {'region'}} (저장된 버킷만)"""
+    if not buckets:
+        return {}
+    metadata = {}
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT bucket_name, creation_date, region
+                    FROM s3_bucket_metadata
+                    WHERE bucket_name = ANY(%s)
+                """, (list({name for name, _ in buckets}),))
+                stored = {(row[0], row[1]): {'region': row[2]} for row in cursor.fetchall()}
+                metadata = {key: stored[key] for key in buckets if key in stored}
+            except Error as e:
+                report_error(f"S3 버킷 메타데이터 조회 오류: {e}")
+    return metadata
+
+# S3 버킷 메타데이터 저장 (rows: [(bucket_name, creation_date, region)])
+def save_bucket_metadata(rows):
+    if not rows:
+        return True
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                execute_values(cursor, """
+                    INSERT INTO s3_bucket_metadata (bucket_name, creation_date, region)
+                    VALUES %s
+                    ON CONFLICT (bucket_name, creation_date) DO NOTHING
+                """, rows)
+                connection.commit()
+                return True
+            except Error as e:
+                report_error(f"S3 버킷 메타데이터 저장 오류: {e}")
+                return False
+    return False
+
+# 보안점검 결과 이력 보관 기간 (일), 이보다 오래된 결과는 일별 집계로 압축
+SECURITY_RESULT_RETENTION_DAYS = 14
+
+# 보안점검 항목별 결과 이력 저장 (rows: [(check_id, resource_id, status, finding_key)])
+def record_security_results(project_name, run_id, rows):
+    if not rows:
+        return True
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                execute_values(cursor, """
+                    INSERT INTO security_result (run_id, project_name, check_id, resource_id, status, finding_key)
+                    VALUES %s
+                """, [(run_id, project_name, *row) for row in rows])
+                connection.commit()
+                return True
+            except Error as e:
+                report_error(f"보안점검 결과 저장 오류: {e}")
+                return False
+    return False
+
+# 프로젝트의 보안점검 실행 목록 (최신순)
+def get_security_runs(project_name, limit=20):
+    """반환값: [{'run_id', 'created_at', 'result_count'}] (보관 기간 내 원본 이력이 있는 실행만)"""
+    runs = []
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT run_id, MIN(created_at) AS created_at, COUNT(*)
+                    FROM security_result
+                    WHERE project_name = %s
+                    GROUP BY run_id
+                    ORDER BY created_at DESC
+                    LIMIT %s
+                """, (project_name, limit))
+                runs = [{'run_id': row[0], 'created_at': row[1], 'result_count': row[2]} for row in cursor.fetchall()]
+            except Error as e:
+                report_error(f"보안점검 실행 목록 조회 오류: {e}")
+    return runs
+
+# 실행 1회의 탐지 항목 조회 [(finding_key, check_id, resource_id)]
+def get_run_findings(run_id, statuses):
+    findings = []
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT finding_key, check_id, resource_id
+                    FROM security_result
+                    WHERE run_id = %s AND status = ANY(%s)
+                """, (run_id, list(statuses)))
+                findings = cursor.fetchall()
+            except Error as e:
+                report_error(f"보안점검 탐지 항목 조회 오류: {e}")
+    return findings
+
+# 보관 기간이 지난 결과를 일별 집계로 압축 후 삭제
+def compact_security_results(retention_days=SECURITY_RESULT_RETENTION_DAYS):
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    WITH expired AS (
+                        DELETE FROM security_result
+                        WHERE created_at < CURRENT_DATE - %s * INTERVAL '1 day'
+                        RETURNING project_name, created_at, check_id, status
+                    )
+                    INSERT INTO security_result_daily (project_name, day, check_id, status, result_count)
+                    SELECT project_name, DATE(created_at), check_id, status, COUNT(*)
+                    FROM expired
+                    GROUP BY project_name, DATE(created_at), check_id, status
+                    ON CONFLICT (project_name, day, check_id, status)
+                    DO UPDATE SET result_count = security_result_daily.result_count + EXCLUDED.result_count
+                """, (retention_days,))
+                connection.commit()
+                return True
+            except Error as e:
+                report_error(f"보안점검 결과 압축 오류: {e}")
+                return False
+    return False
+
+# 프로젝트별 일자별 보안점수 추이 (원본 이력 + 일별 집계를 SQL에서 합산)
+def get_security_score_trend(project_names=None, days=30):
+    """반환값: [{'project', 'day', 'score'}] (점수는 해당 일자 양호/(양호+취약) 비율)"""
+    trend = []
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                project_filter = "AND project_name = ANY(%(projects)s)" if project_names is not None else ""
+                cursor.execute(f"""
+                    WITH daily AS (
+                        SELECT project_name, DATE(created_at) AS day, status, COUNT(*) AS result_count
+                        FROM security_result
+                        WHERE created_at >= CURRENT_DATE - %(days)s * INTERVAL '1 day' {project_filter}
+                        GROUP BY project_name, DATE(created_at), status
+                        UNION ALL
+                        SELECT project_name, day, status, result_count
+                        FROM security_result_daily
+                        WHERE day >= CURRENT_DATE - %(days)s * INTERVAL '1 day' {project_filter}
+                    )
+                    SELECT project_name, day,
+                           ROUND(100.0 * COALESCE(SUM(result_count) FILTER (WHERE status = '양호함'), 0)
+                                 / SUM(result_count) FILTER (WHERE status IN ('양호함', '취약함')), 1) AS score
+                    FROM daily
+                    GROUP BY project_name, day
+                    HAVING SUM(result_count) FILTER (WHERE status IN ('양호함', '취약함')) > 0
+                    ORDER BY day, project_name
+                """, {'days': days, 'projects': list(project_names or [])})
+                trend = [{'project': row[0], 'day': row[1], 'score': float(row[2])} for row in cursor.fetchall()]
+            except Error as e:
+                report_error(f"보안점수 추이 조회 오류: {e}")
+    return trend
+
+# 프로젝트/권한 변경 버전 (세션별 접근 가능 프로젝트 캐시 무효화용, 프로세스 전역)
+_acl_version = 0
+_acl_lock = threading.Lock()
+
+def get_acl_version():
+    return _acl_version
+
+# 프로젝트 추가/수정/삭제, 권한 변경 시 호출하여 모든 세션의 캐시 무효화
+def bump_acl_version():
+    global _acl_version
+    with _acl_lock:
+        _acl_version += 1
 
 # 사용자 인증
 def authenticate_user(user_id, password):
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("SELECT id, permission, projects FROM member WHERE id = %s AND pw = %s", (user_id, password))
-            result = cursor.fetchone()
-            if result:
-                return {'id': result[0], 'permission': result[1], 'projects': result[2]}
-        except Error as e:
-            st.error(f"사용자 인증 오류: {e}")
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("SELECT id, permission, all_projects FROM member WHERE id = %s AND pw = %s", (user_id, password))
+                result = cursor.fetchone()
+                if result:
+                    return {'id': result[0], 'permission': result[1], 'all_projects': result[2]}
+            except Error as e:
+                report_error(f"사용자 인증 오류: {e}")
     return None
 
 # 사용자가 접근 가능한 프로젝트 ID 목록 조회
 def get_user_project_ids(user_id):
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("SELECT projects FROM member WHERE id = %s", (user_id,))
-            result = cursor.fetchone()
-            if result and result[0]:
-                projects = result[0]
-                if projects == 'all':
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    SELECT m.all_projects, mp.project_id
+                    FROM member m
+                    LEFT JOIN member_project mp ON mp.member_id = m.id
+                    WHERE m.id = %s
+                    ORDER BY mp.project_id
+                """, (user_id,))
+                rows = cursor.fetchall()
+                if rows and rows[0][0]:
                     return 'all'
-                else:
-                    return [int(pid) for pid in projects.split(',') if pid.strip()]
-            return []
-        except Error as e:
-            st.error(f"사용자 프로젝트 조회 오류: {e}")
-        finally:
-            connection.close()
+                return [row[1] for row in rows if row[1] is not None]
+            except Error as e:
+                report_error(f"사용자 프로젝트 조회 오류: {e}")
     return []
 
 # 사용자 생성
 def create_user(user_id, password):
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("""
-                INSERT INTO member (id, pw, permission, projects)
-                VALUES (%s, %s, 'user', '')
-            """, (user_id, password))
-            connection.commit()
-            return True
-        except Error as e:
-            if "duplicate key" in str(e).lower():
-                st.error("이미 존재하는 아이디입니다.")
-            else:
-                st.error(f"사용자 생성 오류: {e}")
-            return False
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    INSERT INTO member (id, pw, permission)
+                    VALUES (%s, %s, 'user')
+                """, (user_id, password))
+                connection.commit()
+                return True
+            except Error as e:
+                if "duplicate key" in str(e).lower():
+                    report_error("이미 존재하는 아이디입니다.")
+                else:
+                    report_error(f"사용자 생성 오류: {e}")
+                return False
     return False
 
 # 사용자 프로젝트 권한 업데이트
 def update_user_projects(user_id, project_id):
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            # 현재 프로젝트 목록 조회
-            cursor.execute("SELECT projects FROM member WHERE id = %s", (user_id,))
-            result = cursor.fetchone()
-            if result:
-                current_projects = result[0]
-                if current_projects and current_projects != 'all':
-                    projects_list = current_projects.split(',')
-                    if str(project_id) not in projects_list:
-                        projects_list.append(str(project_id))
-                        new_projects = ','.join(projects_list)
-                    else:
-                        new_projects = current_projects
-                else:
-                    new_projects = str(project_id)
-                
-                cursor.execute("UPDATE member SET projects = %s WHERE id = %s", (new_projects, user_id))
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    INSERT INTO member_project (member_id, project_id)
+                    VALUES (%s, %s)
+                    ON CONFLICT DO NOTHING
+                """, (user_id, project_id))
                 connection.commit()
+                bump_acl_version()
                 return True
-        except Error as e:
-            st.error(f"프로젝트 권한 업데이트 오류: {e}")
-        finally:
-            connection.close()
+            except Error as e:
+                report_error(f"프로젝트 권한 업데이트 오류: {e}")
     return False
\ No newline at end of file
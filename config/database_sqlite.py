@@ -1,6 +1,6 @@
 import sqlite3
-import streamlit as st
 import os
+from utils.errors import report_error
 
 # SQLite 데이터베이스 연결
 def get_db_connection():
@@ -10,7 +10,7 @@ def get_db_connection():
         connection.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
         return connection
     except Exception as e:
-        st.error(f"데이터베이스 연결 오류: {e}")
+        report_error(f"데이터베이스 연결 오류: {e}")
         return None
 
 # 프로젝트 테이블 생성
@@ -32,6 +32,6 @@ def create_projects_table():
             """)
             connection.commit()
         except Exception as e:
-            st.error(f"테이블 생성 오류: {e}")
+            report_error(f"테이블 생성 오류: {e}")
         finally:
             connection.close()
\ No newline at end of file
@@ -1,133 +1,232 @@
-import streamlit as st
+import time
+import threading
 from psycopg2 import Error
-from config.database import get_db_connection
+from config.database import db_connection, bump_acl_version
+from models.snapshot import delete_snapshots
+from utils.cache import invalidate
+from utils.aws_session import evict_aws_sessions
+from utils.errors import report_error
+
+# 프로젝트 조회 캐시 유지 시간 (초), 다른 프로세스(워커, 보안점검 실행기)의 변경이 반영되는 최대 지연
+PROJECT_CACHE_TTL = 300
+
+# ('id', 프로젝트 ID) / ('name', 프로젝트명) -> (만료 시각, 프로젝트 정보)
+_project_cache = {}
+_project_cache_lock = threading.Lock()
+# 조회 중 무효화된 결과를 저장하지 않기 위한 세대 번호
+_project_cache_generation = 0
+
+# 프로젝트 캐시 조회 (미적중 시 loader()로 조회 후 ID/이름 두 키로 저장, 호출자에게는 복사본 반환)
+def _cached_project(key, loader):
+    now = time.monotonic()
+    with _project_cache_lock:
+        entry = _project_cache.get(key)
+        generation = _project_cache_generation
+    if entry is not None and entry[0] > now:
+        return dict(entry[1])
+
+    project_info = loader()
+    if project_info is None:
+        return None
+    with _project_cache_lock:
+        if generation == _project_cache_generation:
+            entry = (now + PROJECT_CACHE_TTL, project_info)
+            _project_cache[('id', project_info['id'])] = entry
+            _project_cache[('name', project_info['project_name'])] = entry
+    return dict(project_info)
+
+# 프로젝트 추가/수정/삭제 시 캐시 전체 무효화 (이름 변경 시 이전 이름 키도 제거)
+def invalidate_project_cache():
+    global _project_cache_generation
+    with _project_cache_lock:
+        _project_cache.clear()
+        _project_cache_generation += 1
+
+# 프로젝트 변경 후처리 (조회 캐시와 세션별 접근 가능 프로젝트 캐시 무효화)
+# project_id: 수정/삭제된 프로젝트 (이전 자격증명/리전으로 만든 세션, 조회 캐시, 인벤토리 스냅샷 폐기)
+def _project_changed(project_id=None):
+    invalidate_project_cache()
+    bump_acl_version()
+    if project_id is not None:
+        evict_aws_sessions(project_id)
+        invalidate(project_id)
+        delete_snapshots(project_id)
+
+# 프로젝트명 중복 오류 여부
+def _is_duplicate_name(error):
+    return "duplicate key" in str(error).lower()
 
 # 프로젝트 추가 (프로젝트 ID 반환)
 def add_project_to_db(project_name, account_id, region, access_key, secret_key):
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            # SERIAL 타입을 사용하여 자동 증가하는 ID 생성
-            cursor.execute("""
-                INSERT INTO project (project_name, account_id, region, access_key, secret_key)
-                VALUES (%s, %s, %s, %s, %s) RETURNING id
-            """, (project_name, account_id, region, access_key, secret_key))
-            project_id = cursor.fetchone()[0]
-            connection.commit()
-            return project_id
-        except Error as e:
-            st.error(f"프로젝트 추가 오류: {e}")
-            return None
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                # SERIAL 타입을 사용하여 자동 증가하는 ID 생성
+                cursor.execute("""
+                    INSERT INTO project (project_name, account_id, region, access_key, secret_key)
+                    VALUES (%s, %s, %s, %s, %s) RETURNING id
+                """, (project_name, account_id, region, access_key, secret_key))
+                project_id = cursor.fetchone()[0]
+                connection.commit()
+                _project_changed()
+                return project_id
+            except Error as e:
+                if _is_duplicate_name(e):
+                    report_error("이미 존재하는 프로젝트명입니다.")
+                else:
+                    report_error(f"프로젝트 추가 오류: {e}")
+                return None
     return None
 
 # 프로젝트 목록 조회
 def get_projects_from_db():
-    connection = get_db_connection()
     projects = []
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("SELECT * FROM project ORDER BY created_at DESC")
-            columns = [desc[0] for desc in cursor.description]
-            rows = cursor.fetchall()
-            projects = [dict(zip(columns, row)) for row in rows]
-            # access_key 마스킹 처리
-            for project in projects:
-                project['access_key'] = project['access_key'][:8] + "..."
-                project['secret_key'] = "***"
-        except Error as e:
-            st.error(f"프로젝트 조회 오류: {e}")
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("SELECT * FROM project ORDER BY created_at DESC")
+                columns = [desc[0] for desc in cursor.description]
+                rows = cursor.fetchall()
+                projects = [dict(zip(columns, row)) for row in rows]
+                # access_key 마스킹 처리
+                for project in projects:
+                    project['access_key'] = project['access_key'][:8] + "..."
+                    project['secret_key'] = "***"
+            except Error as e:
+                report_error(f"프로젝트 조회 오류: {e}")
+    return projects
+
+# 수집용 프로젝트 전체 조회 (마스킹 없이, 스냅샷 스케줄러용)
+def get_projects_for_collection():
+    projects = []
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("SELECT * FROM project ORDER BY id")
+                columns = [desc[0] for desc in cursor.description]
+                projects = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            except Error as e:
+                report_error(f"프로젝트 조회 오류: {e}")
     return projects
 
 # 프로젝트 수정
 def update_project_in_db(project_id, project_name, account_id, region, access_key, secret_key):
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("""
-                UPDATE project 
-                SET project_name = %s, account_id = %s, region = %s, access_key = %s, secret_key = %s
-                WHERE id = %s
-            """, (project_name, account_id, region, access_key, secret_key, project_id))
-            connection.commit()
-            return True
-        except Error as e:
-            st.error(f"프로젝트 수정 오류: {e}")
-            return False
-        finally:
-            connection.close()
-    return False
-
-# 프로젝트 원본 정보 조회 (마스킹 없이)
+    updated = False
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("""
+                    UPDATE project 
+                    SET project_name = %s, account_id = %s, region = %s, access_key = %s, secret_key = %s
+                    WHERE id = %s
+                """, (project_name, account_id, region, access_key, secret_key, project_id))
+                connection.commit()
+                updated = True
+            except Error as e:
+                if _is_duplicate_name(e):
+                    report_error("이미 존재하는 프로젝트명입니다.")
+                else:
+                    report_error(f"프로젝트 수정 오류: {e}")
+    # 연결 반납 후 후처리 (스냅샷 삭제가 풀에서 연결을 다시 사용)
+    if updated:
+        _project_changed(project_id)
+    return updated
+
+# 프로젝트 원본 정보 조회 (마스킹 없이, 프로젝트 캐시 사용)
 def get_project_original_info(project_id):
-    connection = get_db_connection()
+    return _cached_project(('id', project_id), lambda: _select_project('id', project_id))
+
+# 프로젝트 1건 조회 (column: 'id' 또는 'project_name', 둘 다 인덱스 사용)
+def _select_project(column, value):
     project_info = None
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("SELECT * FROM project WHERE id = %s", (project_id,))
-            row = cursor.fetchone()
-            if row:
-                columns = [desc[0] for desc in cursor.description]
-                project_info = dict(zip(columns, row))
-        except Error as e:
-            st.error(f"프로젝트 정보 조회 오류: {e}")
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute(f"SELECT * FROM project WHERE {column} = %s", (value,))
+                row = cursor.fetchone()
+                if row:
+                    columns = [desc[0] for desc in cursor.description]
+                    project_info = dict(zip(columns, row))
+            except Error as e:
+                report_error(f"프로젝트 정보 조회 오류: {e}")
     return project_info
 
 # 프로젝트 삭제
 def delete_project_from_db(project_id):
-    connection = get_db_connection()
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("DELETE FROM project WHERE id = %s", (project_id,))
-            connection.commit()
-            return True
-        except Error as e:
-            st.error(f"프로젝트 삭제 오류: {e}")
-            return False
-        finally:
-            connection.close()
-    return False
+    deleted = False
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("DELETE FROM project WHERE id = %s", (project_id,))
+                connection.commit()
+                deleted = True
+            except Error as e:
+                report_error(f"프로젝트 삭제 오류: {e}")
+    if deleted:
+        _project_changed(project_id)
+    return deleted
 
 # 프로젝트명 목록 조회
 def get_project_names():
-    connection = get_db_connection()
     project_names = []
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("SELECT project_name FROM project ORDER BY project_name")
-            results = cursor.fetchall()
-            project_names = [row[0] for row in results]
-        except Error as e:
-            st.error(f"프로젝트명 조회 오류: {e}")
-        finally:
-            connection.close()
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("SELECT project_name FROM project ORDER BY project_name")
+                results = cursor.fetchall()
+                project_names = [row[0] for row in results]
+            except Error as e:
+                report_error(f"프로젝트명 조회 오류: {e}")
     return project_names
 
-# 프로젝트 정보 조회
+# 프로젝트 정보 조회 (프로젝트 캐시 사용)
 def get_project_info(project_name):
-    connection = get_db_connection()
-    project_info = None
-    if connection:
-        try:
-            cursor = connection.cursor()
-            cursor.execute("SELECT * FROM project WHERE project_name = %s", (project_name,))
-            row = cursor.fetchone()
-            if row:
-                columns = [desc[0] for desc in cursor.description]
-                project_info = dict(zip(columns, row))
-        except Error as e:
-            st.error(f"프로젝트 정보 조회 오류: {e}")
-        finally:
-            connection.close()
-    return project_info
\ No newline at end of file
+    return _cached_project(('name', project_name), lambda: _select_project('project_name', project_name))
+
+# 멤버가 접근 가능한 프로젝트 조회 (all_projects 멤버 분기 UNION member_project 분기, 각 분기가 인덱스 사용)
+# columns: project 테이블 별칭 p 기준 컬럼 목록, order_by: 결과 컬럼명 기준 정렬
+def _select_member_projects(member_id, columns, order_by):
+    projects = []
+    with db_connection() as connection:
+        if connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute(f"""
+                    SELECT {columns}
+                    FROM project p
+                    JOIN member m ON m.id = %s AND m.all_projects
+                    UNION
+                    SELECT {columns}
+                    FROM member_project mp
+                    JOIN project p ON p.id = mp.project_id
+                    WHERE mp.member_id = %s
+                    ORDER BY {order_by}
+                """, (member_id, member_id))
+                names = [desc[0] for desc in cursor.description]
+                projects = [dict(zip(names, row)) for row in cursor.fetchall()]
+            except Error as e:
+                report_error(f"접근 가능 프로젝트 조회 오류: {e}")
+    return projects
+
+# 멤버가 접근 가능한 프로젝트 목록 (all_projects 멤버는 전체, 그 외는 member_project 기준)
+def get_member_projects(member_id):
+    """반환값: [{'id', 'project_name', 'region'}] (프로젝트명 순)"""
+    return _select_member_projects(member_id, "p.id, p.project_name, p.region", "project_name")
+
+# 프로젝트 페이지 표시용 접근 가능 프로젝트 상세 (access_key 마스킹, 최근 등록 순)
+def get_member_project_details(member_id):
+    """반환값: [{'id', 'project_name', 'account_id', 'region', 'access_key', 'secret_key', 'created_at'}]"""
+    projects = _select_member_projects(
+        member_id, "p.id, p.project_name, p.account_id, p.region, p.access_key, p.created_at", "created_at DESC, id DESC"
+    )
+    for project in projects:
+        project['access_key'] = project['access_key'][:8] + "..."
+        project['secret_key'] = "***"
+    return projects
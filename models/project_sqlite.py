@@ -1,5 +1,5 @@
-import streamlit as st
 from config.database_sqlite import get_db_connection
+from utils.errors import report_error
 
 # 프로젝트 추가
 def add_project_to_db(project_name, account_id, region, access_key, secret_key):
@@ -14,7 +14,7 @@ def add_project_to_db(project_name, account_id, region, access_key, secret_key):
             connection.commit()
             return True
         except Exception as e:
-            st.error(f"프로젝트 추가 오류: {e}")
+            report_error(f"프로젝트 추가 오류: {e}")
             return False
         finally:
             connection.close()
@@ -35,7 +35,7 @@ def get_projects_from_db():
                 project['access_key'] = project['access_key'][:8] + "..."
                 project['secret_key'] = "***"
         except Exception as e:
-            st.error(f"프로젝트 조회 오류: {e}")
+            report_error(f"프로젝트 조회 오류: {e}")
         finally:
             connection.close()
     return projects
@@ -54,7 +54,7 @@ def update_project_in_db(project_id, project_name, account_id, region, access_ke
             connection.commit()
             return True
         except Exception as e:
-            st.error(f"프로젝트 수정 오류: {e}")
+            report_error(f"프로젝트 수정 오류: {e}")
             return False
         finally:
             connection.close()
@@ -72,7 +72,7 @@ def get_project_original_info(project_id):
             if row:
                 project_info = dict(row)
         except Exception as e:
-            st.error(f"프로젝트 정보 조회 오류: {e}")
+            report_error(f"프로젝트 정보 조회 오류: {e}")
         finally:
             connection.close()
     return project_info
@@ -87,7 +87,7 @@ def delete_project_from_db(project_id):
             connection.commit()
             return True
         except Exception as e:
-            st.error(f"프로젝트 삭제 오류: {e}")
+            report_error(f"프로젝트 삭제 오류: {e}")
             return False
         finally:
             connection.close()
@@ -104,7 +104,7 @@ def get_project_names():
             results = cursor.fetchall()
             project_names = [row[0] for row in results]
         except Exception as e:
-            st.error(f"프로젝트명 조회 오류: {e}")
+            report_error(f"프로젝트명 조회 오류: {e}")
         finally:
             connection.close()
     return project_names
@@ -121,7 +121,7 @@ def get_project_info(project_name):
             if row:
                 project_info = dict(row)
         except Exception as e:
-            st.error(f"프로젝트 정보 조회 오류: {e}")
+            report_error(f"프로젝트 정보 조회 오류: {e}")
         finally:
             connection.close()
     return project_info
\ No newline at end of file
@@ -0,0 +1,186 @@
+import os
+import json
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+import pandas as pd
+import psycopg2
+from config.database import db_connection
+from config import database_sqlite
+from utils.errors import report_error
+
+# 프로젝트별로 보관할 스냅샷 수 (오래된 스냅샷은 저장 시 삭제)
+SNAPSHOT_RETENTION = 5
+
+# SQLite 저장소용 테이블 (DB_TYPE=sqlite)
+_SQLITE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS inventory_snapshot (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        project_id INTEGER NOT NULL,
+        collected_at TIMESTAMP NOT NULL,
+        duration_ms INTEGER NOT NULL,
+        service_status TEXT NOT NULL,
+        payload BLOB NOT NULL
+    )
+"""
+_SQLITE_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_inventory_snapshot_project
+    ON inventory_snapshot (project_id, collected_at)
+"""
+
+# 스냅샷 저장소 연결 컨텍스트 (연결, 플레이스홀더), 연결 실패 시 (None, None)
+# Postgres는 풀 연결 사용 (실패 시 오류 보고, SQLite로 대체하지 않음), DB_TYPE=sqlite 배포만 SQLite 사용
+@contextmanager
+def _snapshot_connection():
+    if os.getenv('DB_TYPE', 'postgresql') != 'sqlite':
+        with db_connection() as connection:
+            yield (connection, '%s') if connection else (None, None)
+        return
+    connection = database_sqlite.get_db_connection()
+    if not connection:
+        yield None, None
+        return
+    try:
+        connection.execute(_SQLITE_SCHEMA)
+        connection.execute(_SQLITE_INDEX)
+        yield connection, '?'
+    finally:
+        connection.close()
+
+# {서비스명: DataFrame}을 압축된 JSON으로 직렬화
+def serialize_frames(frames):
+    data = {name: df.to_dict(orient='split') for name, df in frames.items()}
+    for frame_data in data.values():
+        frame_data.pop('index', None)
+    return zlib.compress(json.dumps(data, ensure_ascii=False, default=str).encode('utf-8'))
+
+# 직렬화된 스냅샷을 {서비스명: DataFrame}으로 복원
+def deserialize_frames(payload):
+    data = json.loads(zlib.decompress(bytes(payload)).decode('utf-8'))
+    return {
+        name: pd.DataFrame(frame_data['data'], columns=frame_data['columns'])
+        for name, frame_data in data.items()
+    }
+
+# 스냅샷 저장 잠금 키 (pg_advisory_xact_lock(SNAPSHOT_LOCK_CLASS, 프로젝트 ID), 스키마 마이그레이션 잠금과 구분)
+SNAPSHOT_LOCK_CLASS = 7217002
+
+# 조회 결과 1행을 스냅샷 dict로 변환
+def _snapshot_from_row(row):
+    collected_at = row[1]
+    if isinstance(collected_at, str):
+        collected_at = datetime.fromisoformat(collected_at)
+    return {
+        'id': row[0],
+        'frames': deserialize_frames(row[4]),
+        'statuses': json.loads(row[3]),
+        'collected_at': collected_at,
+        'duration': row[2] / 1000
+    }
+
+# 프로젝트의 최신 스냅샷 1행 조회 (없으면 None)
+def _select_latest_snapshot(cursor, ph, project_id):
+    cursor.execute(f"""
+        SELECT id, collected_at, duration_ms, service_status, payload
+        FROM inventory_snapshot WHERE project_id = {ph}
+        ORDER BY collected_at DESC, id DESC LIMIT 1
+    """, (project_id,))
+    row = cursor.fetchone()
+    return _snapshot_from_row(row) if row else None
+
+# 스냅샷 1건 추가 후 보관 개수를 넘는 오래된 스냅샷 삭제 (스냅샷 ID 반환)
+def _insert_snapshot(cursor, ph, project_id, frames, statuses, duration, collected_at):
+    payload = serialize_frames(frames)
+    params = (
+        project_id, collected_at, int(duration * 1000),
+        json.dumps(statuses, ensure_ascii=False, default=str),
+        psycopg2.Binary(payload) if ph == '%s' else payload
+    )
+    if ph == '%s':
+        cursor.execute(f"""
+            INSERT INTO inventory_snapshot (project_id, collected_at, duration_ms, service_status, payload)
+            VALUES ({ph}, {ph}, {ph}, {ph}, {ph}) RETURNING id
+        """, params)
+        snapshot_id = cursor.fetchone()[0]
+    else:
+        cursor.execute(f"""
+            INSERT INTO inventory_snapshot (project_id, collected_at, duration_ms, service_status, payload)
+            VALUES ({ph}, {ph}, {ph}, {ph}, {ph})
+        """, params)
+        snapshot_id = cursor.lastrowid
+
+    cursor.execute(f"""
+        DELETE FROM inventory_snapshot
+        WHERE project_id = {ph} AND id NOT IN (
+            SELECT id FROM inventory_snapshot WHERE project_id = {ph}
+            ORDER BY collected_at DESC, id DESC LIMIT {SNAPSHOT_RETENTION}
+        )
+    """, (project_id, project_id))
+    return snapshot_id
+
+# 최신 스냅샷에 수집 결과를 병합하여 저장 (프로젝트 단위 잠금 안에서 최신 조회 -> 병합 -> 저장)
+# 같은 프로젝트를 동시에 수집해도 나중에 저장한 쪽이 다른 쪽의 서비스 결과를 덮어쓰지 않음
+def update_snapshot(project_id, merge):
+    """merge(latest) -> (frames, statuses, duration), latest: load_latest_snapshot 형식 또는 None
+    반환값: 저장한 (frames, statuses, duration) 또는 None (저장 실패)
+    """
+    with _snapshot_connection() as (connection, ph):
+        if not connection:
+            return None
+        try:
+            cursor = connection.cursor()
+            if ph == '%s':
+                cursor.execute("SELECT pg_advisory_xact_lock(%s, %s)", (SNAPSHOT_LOCK_CLASS, project_id))
+            else:
+                cursor.execute("BEGIN IMMEDIATE")
+            merged = merge(_select_latest_snapshot(cursor, ph, project_id))
+            _insert_snapshot(cursor, ph, project_id, *merged, datetime.now())
+            connection.commit()
+            return merged
+        except Exception as e:
+            # 끝나지 않은 트랜잭션은 연결 반환(풀 롤백, SQLite close) 시 취소
+            report_error(f"스냅샷 저장 오류: {e}")
+            return None
+
+# 프로젝트의 최신 스냅샷 조회
+def load_latest_snapshot(project_id):
+    """반환값: {'id', 'frames', 'statuses', 'collected_at', 'duration'} 또는 None"""
+    with _snapshot_connection() as (connection, ph):
+        if not connection:
+            return None
+        try:
+            return _select_latest_snapshot(connection.cursor(), ph, project_id)
+        except Exception as e:
+            report_error(f"스냅샷 조회 오류: {e}")
+            return None
+
+# 프로젝트 스냅샷 전체 삭제 (프로젝트 수정/삭제 시 이전 설정으로 수집된 데이터 폐기)
+def delete_snapshots(project_id):
+    with _snapshot_connection() as (connection, ph):
+        if not connection:
+            return False
+        try:
+            cursor = connection.cursor()
+            cursor.execute(f"DELETE FROM inventory_snapshot WHERE project_id = {ph}", (project_id,))
+            connection.commit()
+            return True
+        except Exception as e:
+            report_error(f"스냅샷 삭제 오류: {e}")
+            return False
+
+# 프로젝트의 최신 스냅샷 서비스별 상태만 조회 (payload 복원 없이)
+def load_snapshot_statuses(project_id):
+    with _snapshot_connection() as (connection, ph):
+        if not connection:
+            return {}
+        try:
+            cursor = connection.cursor()
+            cursor.execute(f"""
+                SELECT service_status FROM inventory_snapshot WHERE project_id = {ph}
+                ORDER BY collected_at DESC, id DESC LIMIT 1
+            """, (project_id,))
+            row = cursor.fetchone()
+            return json.loads(row[0]) if row else {}
+        except Exception as e:
+            report_error(f"스냅샷 조회 오류: {e}")
+            return {}
@@ -0,0 +1,127 @@
+import sys
+import time
+import uuid
+import argparse
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from models.project import get_projects_for_collection, get_project_original_info
+from config.database import ensure_schema, update_security_score, record_security_results, compact_security_results
+from services.security_checks import (
+    SECURITY_CHECKS, run_security_checks, summarize_security_results, security_result_rows, diff_security_runs
+)
+from utils.aws_session import create_project_session
+from utils.errors import capture_errors
+
+# 전체 프로젝트 보안점검 실행기 (Streamlit 없이 단독 실행, cron 등록 가능)
+#   python security_scan.py                       전체 프로젝트
+#   python security_scan.py -p 프로젝트A -p 프로젝트B   지정 프로젝트만
+#   python security_scan.py --workers 4 --per-account 1
+#   python security_scan.py --diff                 직전 점검 대비 신규/해소 항목 출력
+
+# 동시에 점검하는 프로젝트 수 (프로세스 수)
+DEFAULT_WORKERS = 4
+# 같은 AWS 계정을 동시에 점검하는 프로젝트 수 상한 (API 스로틀링 방지)
+DEFAULT_PER_ACCOUNT = 1
+
+# 프로젝트 1개 보안점검 후 결과 이력과 점수 저장 (워커 프로세스에서 실행)
+def scan_project(project_id):
+    started = time.monotonic()
+    with capture_errors() as errors:
+        project_info = get_project_original_info(project_id)
+        if not project_info:
+            return {'project': project_id, 'score': None, 'diff': None, 'errors': ["프로젝트 정보를 찾을 수 없습니다."], 'duration': 0}
+
+        session = create_project_session(project_info)
+        score = None
+        diff = None
+        if session:
+            results = run_security_checks(session)
+            errors.extend(outcome['message'] for outcome in results.values() if outcome['status'] == 'error')
+            score = summarize_security_results(results)['score']
+            run_id = uuid.uuid4().hex
+            if record_security_results(project_info['project_name'], run_id, security_result_rows(results)):
+                diff = diff_security_runs(project_info['project_name'], run_id)
+            if score is not None:
+                update_security_score(project_info['project_name'], score)
+        else:
+            errors.append("AWS 세션 생성에 실패했습니다.")
+    return {
+        'project': project_info['project_name'],
+        'score': score,
+        'diff': diff,
+        'errors': list(errors),
+        'duration': time.monotonic() - started
+    }
+
+# 프로젝트 점검 결과 출력 (show_diff이면 신규/해소 항목 목록 포함)
+def print_summary(summary, show_diff=False):
+    score = '-' if summary['score'] is None else f"{summary['score']}%"
+    diff = summary['diff']
+    changes = '' if diff is None else f", 신규 {len(diff['new'])} / 해소 {len(diff['resolved'])}"
+    print(f"[scan] {summary['project']}: 보안점수 {score}{changes} ({summary['duration']:.1f}초)")
+    if show_diff and diff:
+        for sign, key in (('+', 'new'), ('-', 'resolved')):
+            for check_id, resource_id in diff[key]:
+                title = SECURITY_CHECKS[check_id]['title'] if check_id in SECURITY_CHECKS else check_id
+                print(f"  {sign} {title}: {resource_id}")
+
+# 계정별 동시 실행 수를 지키며 프로세스 풀에 점검 제출
+def run_scan(projects, workers=DEFAULT_WORKERS, per_account=DEFAULT_PER_ACCOUNT, show_diff=False):
+    queue = list(projects)
+    running = {}
+    account_counts = {}
+    summaries = []
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while queue or running:
+            # 계정 한도에 걸리지 않은 프로젝트를 워커 수만큼 제출
+            for project in list(queue):
+                if len(running) >= workers:
+                    break
+                account = project['account_id']
+                if account_counts.get(account, 0) >= per_account:
+                    continue
+                queue.remove(project)
+                account_counts[account] = account_counts.get(account, 0) + 1
+                running[executor.submit(scan_project, project['id'])] = project
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                project = running.pop(future)
+                account_counts[project['account_id']] -= 1
+                try:
+                    summary = future.result()
+                except Exception as e:
+                    summary = {'project': project['project_name'], 'score': None, 'diff': None, 'errors': [str(e)], 'duration': 0}
+                summaries.append(summary)
+                print_summary(summary, show_diff)
+                for message in summary['errors']:
+                    print(f"[scan] {summary['project']}: {message}", file=sys.stderr)
+
+    # 오래된 점검 이력은 일별 집계로 압축
+    compact_security_results()
+    return summaries
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="전체 프로젝트 보안점검 실행")
+    parser.add_argument('-p', '--project', action='append', help="점검할 프로젝트명 (여러 번 지정 가능, 생략 시 전체)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="동시 점검 프로세스 수")
+    parser.add_argument('--per-account', type=int, default=DEFAULT_PER_ACCOUNT, help="AWS 계정별 동시 점검 수")
+    parser.add_argument('--diff', action='store_true', help="직전 점검 대비 신규/해소 항목 출력")
+    args = parser.parse_args(argv)
+
+    if not ensure_schema():
+        return 1
+
+    projects = get_projects_for_collection()
+    if args.project:
+        projects = [project for project in projects if project['project_name'] in args.project]
+    if not projects:
+        print("점검할 프로젝트가 없습니다.", file=sys.stderr)
+        return 1
+
+    summaries = run_scan(projects, max(args.workers, 1), max(args.per_account, 1), args.diff)
+    # 하나라도 실패하면 0이 아닌 종료 코드 (cron 알림용)
+    return 1 if any(summary['errors'] for summary in summaries) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,14 @@
-import streamlit as st
+from utils.errors import report_error
+from utils.pagination import iter_pages, frame_from_chunks
 import pandas as pd
 from datetime import datetime, timedelta
 
-# RDS 인스턴스 조회
-def get_rds_instances(session):
-    try:
-        rds = session.client('rds')
-        response = rds.describe_db_instances()
+# RDS 인스턴스 조회 (페이지 단위 스트리밍)
+def iter_rds_instances(session):
+    rds = session.client('rds')
+    for page in iter_pages(rds, 'describe_db_instances'):
         instances = []
-        for db in response['DBInstances']:
+        for db in page['DBInstances']:
             instances.append({
                 'DB Instance': db['DBInstanceIdentifier'],
                 'Engine': db['Engine'],
@@ -16,24 +16,28 @@ def get_rds_instances(session):
                 'Status': db['DBInstanceStatus'],
                 'AZ': db.get('AvailabilityZone', 'N/A')
             })
-        return pd.DataFrame(instances)
+        yield instances
+
+# RDS 인스턴스 조회
+def get_rds_instances(session):
+    try:
+        return frame_from_chunks(iter_rds_instances(session))
     except Exception as e:
-        st.error(f"RDS 조회 오류: {e}")
+        report_error(f"RDS 조회 오류: {e}")
         return pd.DataFrame()
 
-# RDS Reserved Instance 조회
-def get_rds_reserved_instances(session):
-    try:
-        rds = session.client('rds')
-        response = rds.describe_reserved_db_instances()
+# RDS Reserved Instance 조회 (페이지 단위 스트리밍)
+def iter_rds_reserved_instances(session):
+    rds = session.client('rds')
+    for page in iter_pages(rds, 'describe_reserved_db_instances'):
         reserved_instances = []
-        for ri in response['ReservedDBInstances']:
+        for ri in page['ReservedDBInstances']:
             # 만료일시 계산
             start_date = ri['StartTime']
             duration_seconds = ri['Duration']
             end_date = start_date + timedelta(seconds=duration_seconds)
             expiry_date = end_date.strftime('%Y-%m-%d')
-            
+
             reserved_instances.append({
                 'Reserved DB Instance ID': ri['ReservedDBInstanceId'],
                 'DB Instance Class': ri['DBInstanceClass'],
@@ -46,18 +50,22 @@ def get_rds_reserved_instances(session):
                 'Offering Type': ri.get('OfferingType', 'N/A'),
                 '만료일시': expiry_date
             })
-        return pd.DataFrame(reserved_instances)
+        yield reserved_instances
+
+# RDS Reserved Instance 조회
+def get_rds_reserved_instances(session):
+    try:
+        return frame_from_chunks(iter_rds_reserved_instances(session))
     except Exception as e:
-        st.error(f"RDS RI 조회 오류: {e}")
+        report_error(f"RDS RI 조회 오류: {e}")
         return pd.DataFrame()
 
-# ElastiCache 클러스터 조회
-def get_elasticache_clusters(session):
-    try:
-        elasticache = session.client('elasticache')
-        response = elasticache.describe_cache_clusters()
+# ElastiCache 클러스터 조회 (페이지 단위 스트리밍)
+def iter_elasticache_clusters(session):
+    elasticache = session.client('elasticache')
+    for page in iter_pages(elasticache, 'describe_cache_clusters'):
         clusters = []
-        for cluster in response['CacheClusters']:
+        for cluster in page['CacheClusters']:
             clusters.append({
                 'Cluster ID': cluster['CacheClusterId'],
                 'Engine': cluster['Engine'],
@@ -65,7 +73,12 @@ def get_elasticache_clusters(session):
                 'Status': cluster['CacheClusterStatus'],
                 'AZ': cluster.get('PreferredAvailabilityZone', 'N/A')
             })
-        return pd.DataFrame(clusters)
+        yield clusters
+
+# ElastiCache 클러스터 조회
+def get_elasticache_clusters(session):
+    try:
+        return frame_from_chunks(iter_elasticache_clusters(session))
     except Exception as e:
-        st.error(f"ElastiCache 조회 오류: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        report_error(f"ElastiCache 조회 오류: {e}")
+        return pd.DataFrame()
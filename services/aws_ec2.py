@@ -1,39 +1,87 @@
-import streamlit as st
+from utils.errors import report_error
+from utils.pagination import iter_pages, frame_from_chunks
 import pandas as pd
 from datetime import datetime, timedelta
 
+# describe_instances instance-id 필터 1회당 최대 값 개수
+INSTANCE_ID_BATCH_SIZE = 200
+
+# EC2 인스턴스 응답을 행으로 변환
+def _instance_row(instance):
+    name = next((tag['Value'] for tag in instance.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
+    # Private IP 추출
+    private_ip = instance.get('PrivateIpAddress', 'N/A')
+    return {
+        'Instance ID': instance['InstanceId'],
+        'Name': name,
+        'Type': instance['InstanceType'],
+        'Private IP': private_ip,  # Private IP 추가
+        'State': instance['State']['Name'],
+        'AZ': instance['Placement']['AvailabilityZone'],
+        'Subnet ID': instance.get('SubnetId', 'N/A')
+    }
+
+# EC2 인스턴스 조회 (페이지 단위 스트리밍)
+def iter_ec2_instances(session, **params):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_instances', **params):
+        instances = []
+        for reservation in page['Reservations']:
+            for instance in reservation['Instances']:
+                instances.append(_instance_row(instance))
+        yield instances
+
+# 인스턴스 ID -> {Name, Private IP, Subnet ID, State, ...} 인덱스 생성
+def build_instance_index(session, instance_ids=None):
+    """instance_ids가 없으면 전체 인스턴스를 페이지네이션 1회로, 있으면 instance-id 필터 배치로 조회
+    InstanceIds 파라미터는 종료/잘못된 ID가 하나만 섞여도 배치 전체가 InvalidInstanceID.NotFound로 실패하므로
+    필터를 사용하여 없는 ID는 결과에서만 빠지게 함 (인덱스에 없는 ID는 describe_instance_target에서 Unknown 표시)
+    """
+    if instance_ids is None:
+        batches = [{}]
+    else:
+        ids = sorted(set(instance_ids))
+        if not ids:
+            return {}
+        batches = [
+            {'Filters': [{'Name': 'instance-id', 'Values': ids[i:i + INSTANCE_ID_BATCH_SIZE]}]}
+            for i in range(0, len(ids), INSTANCE_ID_BATCH_SIZE)
+        ]
+
+    index = {}
+    for params in batches:
+        for chunk in iter_ec2_instances(session, **params):
+            for row in chunk:
+                index[row['Instance ID']] = row
+    return index
+
+# 이미 조회한 EC2 DataFrame으로 인스턴스 인덱스 생성 (추가 API 호출 없음)
+def instance_index_from_frame(ec2_df):
+    if ec2_df is None or ec2_df.empty:
+        return {}
+    return {row['Instance ID']: row for row in ec2_df.to_dict('records')}
+
+# 대상 인스턴스 표시 문자열
+def describe_instance_target(instance_index, instance_id):
+    instance = instance_index.get(instance_id)
+    if instance is None:
+        return f"Unknown ({instance_id})"
+    return f"{instance['Name']} ({instance_id}, {instance['Private IP']})"
+
 # EC2 인스턴스 조회
 def get_ec2_instances(session):
     try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_instances()
-        instances = []
-        for reservation in response['Reservations']:
-            for instance in reservation['Instances']:
-                name = next((tag['Value'] for tag in instance.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
-                # Private IP 추출
-                private_ip = instance.get('PrivateIpAddress', 'N/A')
-                instances.append({
-                    'Instance ID': instance['InstanceId'],
-                    'Name': name,
-                    'Type': instance['InstanceType'],
-                    'Private IP': private_ip,  # Private IP 추가
-                    'State': instance['State']['Name'],
-                    'AZ': instance['Placement']['AvailabilityZone'],
-                    'Subnet ID': instance.get('SubnetId', 'N/A')
-                })
-        return pd.DataFrame(instances)
+        return frame_from_chunks(iter_ec2_instances(session))
     except Exception as e:
-        st.error(f"EC2 조회 오류: {e}")
+        report_error(f"EC2 조회 오류: {e}")
         return pd.DataFrame()
 
-# EC2 Reserved Instance 조회
-def get_ec2_reserved_instances(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_reserved_instances()
+# EC2 Reserved Instance 조회 (페이지 단위 스트리밍)
+def iter_ec2_reserved_instances(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_reserved_instances'):
         reserved_instances = []
-        for ri in response['ReservedInstances']:
+        for ri in page['ReservedInstances']:
             # 만료일시 계산 (End 필드가 없으면 Start + Duration으로 계산)
             if 'End' in ri:
                 expiry_date = ri['End'].strftime('%Y-%m-%d')
@@ -42,7 +90,7 @@ def get_ec2_reserved_instances(session):
                 duration_seconds = ri['Duration']
                 end_date = start_date + timedelta(seconds=duration_seconds)
                 expiry_date = end_date.strftime('%Y-%m-%d')
-            
+
             reserved_instances.append({
                 'Reserved Instance ID': ri['ReservedInstancesId'],
                 'Instance Type': ri['InstanceType'],
@@ -54,7 +102,12 @@ def get_ec2_reserved_instances(session):
                 'Offering Type': ri.get('OfferingType', 'N/A'),
                 '만료일시': expiry_date
             })
-        return pd.DataFrame(reserved_instances)
+        yield reserved_instances
+
+# EC2 Reserved Instance 조회
+def get_ec2_reserved_instances(session):
+    try:
+        return frame_from_chunks(iter_ec2_reserved_instances(session))
     except Exception as e:
-        st.error(f"EC2 RI 조회 오류: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        report_error(f"EC2 RI 조회 오류: {e}")
+        return pd.DataFrame()
@@ -0,0 +1,256 @@
+from utils.errors import report_error
+from utils.pagination import iter_pages
+from utils.collector import map_concurrently
+from services.aws_ec2 import build_instance_index, describe_instance_target
+
+# 리스너 기본 동작에서 forward 대상 그룹 ARN 추출
+def _forward_target_group_arns(listener):
+    arns = []
+    for action in listener.get('DefaultActions', []):
+        if action['Type'] == 'forward':
+            if 'TargetGroupArn' in action:
+                arns.append(action['TargetGroupArn'])
+            elif 'ForwardConfig' in action and action['ForwardConfig'].get('TargetGroups'):
+                arns.extend(tg['TargetGroupArn'] for tg in action['ForwardConfig']['TargetGroups'])
+    return arns
+
+# ALB/NLB 1개의 리스너와 대상 그룹을 한 번에 조회
+def _fetch_lb_structure(elb, lb_arn):
+    listeners = [
+        listener
+        for page in iter_pages(elb, 'describe_listeners', LoadBalancerArn=lb_arn)
+        for listener in page['Listeners']
+    ]
+    # LB에 연결된 대상 그룹 전체를 1회(페이지네이션) 조회
+    # 워커 스레드에서 실행되므로 실패는 예외로 전달 (호출 스레드에서 _report_failures로 보고)
+    target_groups = {}
+    for page in iter_pages(elb, 'describe_target_groups', LoadBalancerArn=lb_arn):
+        for tg in page['TargetGroups']:
+            target_groups[tg['TargetGroupArn']] = tg['TargetGroupName']
+    return listeners, target_groups
+
+# 병렬 조회 결과 중 실패 항목 보고 (호출 스레드에서 보고해야 수집기가 서비스 오류로 처리하고 캐시하지 않음)
+def _report_failures(results, label):
+    for item, result in results.items():
+        if isinstance(result, Exception):
+            report_error(f"{label} 조회 오류 ({item}): {result}")
+
+# ELB 토폴로지 (LB -> 리스너 -> 대상 그룹 -> 대상) 구성
+def resolve_elb_topology(session, instance_index=None):
+    """반환값: {'load_balancers': [...], 'instance_index': {...}}
+    load_balancers 항목:
+      {'name', 'type', 'scheme', 'classic': bool,
+       'listeners': [{'protocol', 'port', 'target_groups': [{'arn', 'name', 'targets'}]}] 또는 None (조회 실패),
+       'instances': [인스턴스 ID] (CLB만)}
+    대상 그룹의 name/targets가 None이면 해당 대상 그룹 조회에 실패한 것
+    """
+    elb = session.client('elbv2')
+    elb_classic = session.client('elb')
+    load_balancers = []
+
+    # ALB/NLB 조회 후 LB별 리스너/대상 그룹을 병렬 조회
+    try:
+        lbs = [lb for page in iter_pages(elb, 'describe_load_balancers') for lb in page['LoadBalancers']]
+    except Exception as e:
+        report_error(f"ALB/NLB 조회 오류: {e}")
+        lbs = []
+    structures = map_concurrently(lambda arn: _fetch_lb_structure(elb, arn), [lb['LoadBalancerArn'] for lb in lbs])
+    _report_failures(structures, "ELB 리스너")
+
+    # 리스너가 참조하는 대상 그룹의 대상 상태를 병렬 조회
+    tg_arns = set()
+    for structure in structures.values():
+        if not isinstance(structure, Exception):
+            listeners, target_groups = structure
+            for listener in listeners:
+                tg_arns.update(arn for arn in _forward_target_group_arns(listener) if arn in target_groups)
+    target_health = map_concurrently(
+        lambda arn: elb.describe_target_health(TargetGroupArn=arn)['TargetHealthDescriptions'],
+        tg_arns
+    )
+    _report_failures(target_health, "ELB 대상 상태")
+
+    for lb in lbs:
+        structure = structures.get(lb['LoadBalancerArn'])
+        listeners_info = None
+        if structure is not None and not isinstance(structure, Exception):
+            listeners, target_groups = structure
+            listeners_info = []
+            for listener in listeners:
+                tg_info = []
+                for arn in _forward_target_group_arns(listener):
+                    health = target_health.get(arn)
+                    if arn not in target_groups or health is None or isinstance(health, Exception):
+                        tg_info.append({'arn': arn, 'name': None, 'targets': None})
+                    else:
+                        tg_info.append({
+                            'arn': arn,
+                            'name': target_groups[arn],
+                            'targets': [target['Target']['Id'] for target in health]
+                        })
+                listeners_info.append({
+                    'protocol': listener['Protocol'],
+                    'port': listener['Port'],
+                    'target_groups': tg_info
+                })
+        load_balancers.append({
+            'name': lb['LoadBalancerName'],
+            'type': lb['Type'],
+            'scheme': lb['Scheme'],
+            'classic': False,
+            'listeners': listeners_info,
+            'instances': []
+        })
+
+    # CLB 조회 후 인스턴스 상태를 병렬 조회
+    try:
+        clbs = [
+            clb
+            for page in iter_pages(elb_classic, 'describe_load_balancers')
+            for clb in page['LoadBalancerDescriptions']
+        ]
+    except Exception as e:
+        report_error(f"CLB 조회 오류: {e}")
+        clbs = []
+    instance_health = map_concurrently(
+        lambda name: elb_classic.describe_instance_health(LoadBalancerName=name)['InstanceStates'],
+        [clb['LoadBalancerName'] for clb in clbs]
+    )
+    _report_failures(instance_health, "CLB 인스턴스 상태")
+    for clb in clbs:
+        states = instance_health.get(clb['LoadBalancerName'])
+        load_balancers.append({
+            'name': clb['LoadBalancerName'],
+            'type': 'classic',
+            'scheme': clb['Scheme'],
+            'classic': True,
+            'listeners': [
+                {
+                    'protocol': listener['Listener']['Protocol'],
+                    'port': listener['Listener']['LoadBalancerPort'],
+                    'target_groups': []
+                }
+                for listener in clb['ListenerDescriptions']
+            ],
+            'instances': [] if isinstance(states, Exception) or states is None else [state['InstanceId'] for state in states]
+        })
+
+    # 전체 대상 인스턴스를 배치 조회하여 인덱스 구성
+    if instance_index is None:
+        instance_ids = set()
+        for lb in load_balancers:
+            instance_ids.update(lb['instances'])
+            for listener in lb['listeners'] or []:
+                for tg in listener['target_groups']:
+                    instance_ids.update(target for target in tg['targets'] or [] if target.startswith('i-'))
+        try:
+            instance_index = build_instance_index(session, instance_ids)
+        except Exception as e:
+            report_error(f"ELB 대상 인스턴스 조회 오류: {e}")
+            instance_index = {}
+
+    return {'load_balancers': load_balancers, 'instance_index': instance_index}
+
+# ELB별 1행 요약 (get_elb_details용)
+def elb_summary_rows(topology):
+    instance_index = topology['instance_index']
+    rows = []
+    for lb in topology['load_balancers']:
+        if lb['classic']:
+            listeners_info = [f"{listener['protocol']}:{listener['port']}" for listener in lb['listeners']]
+            ec2_instances = {describe_instance_target(instance_index, instance_id) for instance_id in lb['instances']}
+            rows.append({
+                'ELB Name': lb['name'],
+                'Type': 'classic',
+                'Scheme': lb['scheme'],
+                'Listeners': ', '.join(listeners_info) if listeners_info else 'N/A',
+                'Target Groups': 'Direct Instance',
+                'EC2 Instances': ', '.join(sorted(ec2_instances)) if ec2_instances else 'No EC2 Instances'
+            })
+            continue
+
+        if lb['listeners'] is None:
+            listeners_info = ['N/A']
+            target_groups_info = []
+            ec2_instances = set()
+        else:
+            listeners_info = [f"{listener['protocol']}:{listener['port']}" for listener in lb['listeners']]
+            target_groups_info = []
+            ec2_instances = set()
+            for listener in lb['listeners']:
+                for tg in listener['target_groups']:
+                    if tg['name'] is None:
+                        continue
+                    target_groups_info.append(tg['name'])
+                    ec2_instances.update(
+                        describe_instance_target(instance_index, target)
+                        for target in tg['targets'] if target.startswith('i-')
+                    )
+
+        # ELB별로 하나의 행만 생성
+        rows.append({
+            'ELB Name': lb['name'],
+            'Type': lb['type'],
+            'Scheme': lb['scheme'],
+            'Listeners': ', '.join(listeners_info) if listeners_info else 'N/A',
+            'Target Groups': ', '.join(list(dict.fromkeys(target_groups_info))) if target_groups_info else 'N/A',
+            'EC2 Instances': ', '.join(sorted(ec2_instances)) if ec2_instances else 'No EC2 Instances'
+        })
+    return rows
+
+# 리스너/대상 그룹별 상세 행 (워크로드 페이지용)
+def elb_listener_rows(topology):
+    instance_index = topology['instance_index']
+    rows = []
+    for lb in topology['load_balancers']:
+        if lb['classic']:
+            ec2_instances = [describe_instance_target(instance_index, instance_id) for instance_id in lb['instances']]
+            for listener in lb['listeners']:
+                rows.append({
+                    'ELB Name': lb['name'],
+                    'Type': 'CLB',
+                    'Scheme': lb['scheme'],
+                    'Listener': f"{listener['protocol']}:{listener['port']}",
+                    'Target Group': 'Direct Instance',
+                    'EC2 Instances': ', '.join(ec2_instances) if ec2_instances else 'No EC2 Instances'
+                })
+            continue
+
+        base = {'ELB Name': lb['name'], 'Type': lb['type'].upper(), 'Scheme': lb['scheme']}
+        if lb['listeners'] is None:
+            rows.append({**base, 'Listener': 'N/A', 'Target Group': 'N/A', 'EC2 Instances': 'N/A'})
+            continue
+
+        for listener in lb['listeners']:
+            listener_name = f"{listener['protocol']}:{listener['port']}"
+            # 대상그룹이 없는 리스너의 경우 (NLB 등)
+            if not listener['target_groups']:
+                rows.append({**base, 'Listener': listener_name, 'Target Group': 'No Target Group', 'EC2 Instances': 'N/A'})
+                continue
+
+            for tg in listener['target_groups']:
+                if tg['name'] is None:
+                    rows.append({**base, 'Listener': listener_name, 'Target Group': 'Error', 'EC2 Instances': 'Error'})
+                    continue
+                ec2_instances = [
+                    describe_instance_target(instance_index, target) if target.startswith('i-') else f"IP Target ({target})"
+                    for target in tg['targets']
+                ]
+                rows.append({
+                    **base,
+                    'Listener': listener_name,
+                    'Target Group': tg['name'],
+                    'EC2 Instances': ', '.join(ec2_instances) if ec2_instances else 'No Targets'
+                })
+    return rows
+
+# LB별 대상 인스턴스 행 (구성도 연결선용, LB x 인스턴스 1건당 1행)
+def elb_target_rows(topology):
+    rows = []
+    for lb in topology['load_balancers']:
+        instance_ids = set(lb['instances'])
+        for listener in lb['listeners'] or []:
+            for tg in listener['target_groups']:
+                instance_ids.update(target for target in tg['targets'] or [] if target.startswith('i-'))
+        rows.extend({'ELB Name': lb['name'], 'Instance ID': instance_id} for instance_id in sorted(instance_ids))
+    return rows
@@ -1,13 +1,15 @@
-import streamlit as st
+from utils.errors import report_error
+from utils.pagination import iter_pages, frame_from_chunks
+from services.aws_elb import resolve_elb_topology, elb_summary_rows, elb_listener_rows, elb_target_rows
+from utils.cache import cached_call
 import pandas as pd
 
-# ELB 로드밸런서 조회
-def get_load_balancers(session):
-    try:
-        elb = session.client('elbv2')
-        response = elb.describe_load_balancers()
+# ELB 로드밸런서 조회 (페이지 단위 스트리밍)
+def iter_load_balancers(session):
+    elb = session.client('elbv2')
+    for page in iter_pages(elb, 'describe_load_balancers'):
         load_balancers = []
-        for lb in response['LoadBalancers']:
+        for lb in page['LoadBalancers']:
             load_balancers.append({
                 'Load Balancer': lb['LoadBalancerName'],
                 'Type': lb['Type'],
@@ -15,194 +17,109 @@ def get_load_balancers(session):
                 'State': lb['State']['Code'],
                 'AZ': ', '.join([az['ZoneName'] for az in lb['AvailabilityZones']])
             })
-        return pd.DataFrame(load_balancers)
+        yield load_balancers
+
+# ELB 로드밸런서 조회
+def get_load_balancers(session):
+    try:
+        return frame_from_chunks(iter_load_balancers(session))
+    except Exception as e:
+        report_error(f"ELB 조회 오류: {e}")
+        return pd.DataFrame()
+
+# ELB 토폴로지 (리전별 캐시, ELB 요약/리스너 상세/구성도 대상 조회가 공유)
+def _elb_topology(session, instance_index=None):
+    return cached_call(
+        session.project_key, session.region_name, 'ELB Topology',
+        lambda: resolve_elb_topology(session, instance_index)
+    )
+
+# ELB 상세 정보 조회 (ELB별 1행)
+def get_elb_details(session, instance_index=None):
+    try:
+        topology = _elb_topology(session, instance_index)
+        return pd.DataFrame(elb_summary_rows(topology))
     except Exception as e:
-        st.error(f"ELB 조회 오류: {e}")
+        report_error(f"ELB 상세 정보 조회 오류: {e}")
         return pd.DataFrame()
 
-# ELB 상세 정보 조회 (워크로드용)
-def get_elb_details(session):
+# ELB 상세 정보 조회 (리스너/대상 그룹별 1행, 워크로드용)
+def get_elb_listener_details(session, instance_index=None):
     try:
-        elb = session.client('elbv2')
-        elb_classic = session.client('elb')
-        elb_details = []
-        
-        # ALB/NLB 조회
-        try:
-            response = elb.describe_load_balancers()
-            for lb in response['LoadBalancers']:
-                lb_arn = lb['LoadBalancerArn']
-                lb_name = lb['LoadBalancerName']
-                lb_type = lb['Type']
-                lb_scheme = lb['Scheme']
-                
-                # 리스너 조회
-                listeners_info = []
-                target_groups_info = []
-                all_ec2_instances = set()
-                
-                try:
-                    listeners = elb.describe_listeners(LoadBalancerArn=lb_arn)['Listeners']
-                    for listener in listeners:
-                        listener_port = listener['Port']
-                        listener_protocol = listener['Protocol']
-                        listeners_info.append(f"{listener_protocol}:{listener_port}")
-                        
-                        # 대상 그룹 조회
-                        for action in listener.get('DefaultActions', []):
-                            if action['Type'] == 'forward':
-                                tg_arn = None
-                                if 'TargetGroupArn' in action:
-                                    tg_arn = action['TargetGroupArn']
-                                elif 'ForwardConfig' in action and action['ForwardConfig'].get('TargetGroups'):
-                                    tg_arn = action['ForwardConfig']['TargetGroups'][0]['TargetGroupArn']
-                                
-                                if tg_arn:
-                                    try:
-                                        # 대상 그룹 상세 정보
-                                        tg_info = elb.describe_target_groups(TargetGroupArns=[tg_arn])['TargetGroups'][0]
-                                        tg_name = tg_info['TargetGroupName']
-                                        target_groups_info.append(tg_name)
-                                        
-                                        # 대상 상태 확인 및 EC2 인스턴스 정보 수집
-                                        target_health = elb.describe_target_health(TargetGroupArn=tg_arn)
-                                        ec2_client = session.client('ec2')
-                                        
-                                        for target in target_health['TargetHealthDescriptions']:
-                                            if target['Target']['Id'].startswith('i-'):
-                                                instance_id = target['Target']['Id']
-                                                try:
-                                                    ec2_response = ec2_client.describe_instances(InstanceIds=[instance_id])
-                                                    for reservation in ec2_response['Reservations']:
-                                                        for instance in reservation['Instances']:
-                                                            instance_name = next((tag['Value'] for tag in instance.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
-                                                            private_ip = instance.get('PrivateIpAddress', 'N/A')
-                                                            all_ec2_instances.add(f"{instance_name} ({instance_id}, {private_ip})")
-                                                except:
-                                                    all_ec2_instances.add(f"Unknown ({instance_id})")
-                                    except Exception as tg_error:
-                                        continue
-                except Exception as listener_error:
-                    listeners_info = ['N/A']
-                
-                # ELB별로 하나의 행만 생성
-                elb_details.append({
-                    'ELB Name': lb_name,
-                    'Type': lb_type,
-                    'Scheme': lb_scheme,
-                    'Listeners': ', '.join(listeners_info) if listeners_info else 'N/A',
-                    'Target Groups': ', '.join(list(set(target_groups_info))) if target_groups_info else 'N/A',
-                    'EC2 Instances': ', '.join(sorted(all_ec2_instances)) if all_ec2_instances else 'No EC2 Instances'
-                })
-        except Exception as alb_error:
-            pass
-        
-        # CLB 조회
-        try:
-            classic_response = elb_classic.describe_load_balancers()
-            for clb in classic_response['LoadBalancerDescriptions']:
-                clb_name = clb['LoadBalancerName']
-                clb_scheme = clb['Scheme']
-                
-                # 리스너 정보 수집
-                listeners_info = []
-                for listener in clb['ListenerDescriptions']:
-                    listener_info = listener['Listener']
-                    protocol = listener_info['Protocol']
-                    port = listener_info['LoadBalancerPort']
-                    listeners_info.append(f"{protocol}:{port}")
-                
-                # CLB에 연결된 EC2 인스턴스 정보
-                ec2_instances = set()
-                try:
-                    instance_health = elb_classic.describe_instance_health(LoadBalancerName=clb_name)
-                    ec2_client = session.client('ec2')
-                    
-                    for instance_state in instance_health['InstanceStates']:
-                        instance_id = instance_state['InstanceId']
-                        try:
-                            ec2_response = ec2_client.describe_instances(InstanceIds=[instance_id])
-                            for reservation in ec2_response['Reservations']:
-                                for instance in reservation['Instances']:
-                                    instance_name = next((tag['Value'] for tag in instance.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
-                                    private_ip = instance.get('PrivateIpAddress', 'N/A')
-                                    ec2_instances.add(f"{instance_name} ({instance_id}, {private_ip})")
-                        except:
-                            ec2_instances.add(f"Unknown ({instance_id})")
-                except:
-                    pass
-                
-                elb_details.append({
-                    'ELB Name': clb_name,
-                    'Type': 'classic',
-                    'Scheme': clb_scheme,
-                    'Listeners': ', '.join(listeners_info) if listeners_info else 'N/A',
-                    'Target Groups': 'Direct Instance',
-                    'EC2 Instances': ', '.join(sorted(ec2_instances)) if ec2_instances else 'No EC2 Instances'
-                })
-        except Exception as clb_error:
-            pass
-        
-        return pd.DataFrame(elb_details)
-        
+        topology = _elb_topology(session, instance_index)
+        return pd.DataFrame(elb_listener_rows(topology))
     except Exception as e:
-        st.error(f"ELB 상세 정보 조회 오류: {e}")
+        report_error(f"ELB 상세 정보 조회 오류: {e}")
         return pd.DataFrame()
 
+# ELB 대상 인스턴스 조회 (ELB x 인스턴스 1건당 1행, 구성도용)
+def get_elb_targets(session, instance_index=None):
+    try:
+        topology = _elb_topology(session, instance_index)
+        return pd.DataFrame(elb_target_rows(topology), columns=['ELB Name', 'Instance ID'])
+    except Exception as e:
+        report_error(f"ELB 대상 조회 오류: {e}")
+        return pd.DataFrame()
+
+# CloudFront 배포 조회 (페이지 단위 스트리밍)
+def iter_cloudfront_distributions(session):
+    cloudfront = session.client('cloudfront')
+    for page in iter_pages(cloudfront, 'list_distributions'):
+        distributions = []
+        for dist in page.get('DistributionList', {}).get('Items', []):
+            distributions.append({
+                'Distribution ID': dist['Id'],
+                'Domain': dist['DomainName'],
+                'Status': dist['Status'],
+                'Price Class': dist['PriceClass']
+            })
+        yield distributions
+
 # CloudFront 배포 조회
 def get_cloudfront_distributions(session):
     try:
-        cloudfront = session.client('cloudfront')
-        response = cloudfront.list_distributions()
-        distributions = []
-        if 'DistributionList' in response and 'Items' in response['DistributionList']:
-            for dist in response['DistributionList']['Items']:
-                distributions.append({
-                    'Distribution ID': dist['Id'],
-                    'Domain': dist['DomainName'],
-                    'Status': dist['Status'],
-                    'Price Class': dist['PriceClass']
-                })
-        return pd.DataFrame(distributions)
+        return frame_from_chunks(iter_cloudfront_distributions(session))
     except Exception as e:
-        st.error(f"CloudFront 조회 오류: {e}")
+        report_error(f"CloudFront 조회 오류: {e}")
         return pd.DataFrame()
 
-# Route53 레코드 조회
-def get_route53_records(session):
-    try:
-        route53 = session.client('route53')
-        hosted_zones = route53.list_hosted_zones()['HostedZones']
-        records = []
-        
-        for zone in hosted_zones:
+# Route53 레코드 조회 (레코드 페이지 단위 스트리밍)
+def iter_route53_records(session):
+    route53 = session.client('route53')
+    for zone_page in iter_pages(route53, 'list_hosted_zones'):
+        for zone in zone_page['HostedZones']:
             zone_id = zone['Id']
             zone_name = zone['Name'].rstrip('.')
             
             try:
-                record_sets = route53.list_resource_record_sets(HostedZoneId=zone_id)['ResourceRecordSets']
-                for record in record_sets:
-                    record_name = record['Name'].rstrip('.')
-                    record_type = record['Type']
-                    
-                    # 값 추출
-                    values = []
-                    if 'ResourceRecords' in record:
-                        values = [rr['Value'] for rr in record['ResourceRecords']]
-                    elif 'AliasTarget' in record:
-                        values = [record['AliasTarget']['DNSName']]
-                    
-                    records.append({
-                        'Zone': zone_name,
-                        'Record Name': record_name,
-                        'Type': record_type,
-                        'Value': ', '.join(values),
-                        'TTL': record.get('TTL', 'Alias' if 'AliasTarget' in record else 'N/A')
-                    })
+                for page in iter_pages(route53, 'list_resource_record_sets', HostedZoneId=zone_id):
+                    records = []
+                    for record in page['ResourceRecordSets']:
+                        record_name = record['Name'].rstrip('.')
+                        record_type = record['Type']
+                        
+                        # 값 추출
+                        values = []
+                        if 'ResourceRecords' in record:
+                            values = [rr['Value'] for rr in record['ResourceRecords']]
+                        elif 'AliasTarget' in record:
+                            values = [record['AliasTarget']['DNSName']]
+                        
+                        records.append({
+                            'Zone': zone_name,
+                            'Record Name': record_name,
+                            'Type': record_type,
+                            'Value': ', '.join(values),
+                            'TTL': record.get('TTL', 'Alias' if 'AliasTarget' in record else 'N/A')
+                        })
+                    yield records
             except Exception as zone_error:
                 continue
-        
-        return pd.DataFrame(records)
+
+# Route53 레코드 조회
+def get_route53_records(session):
+    try:
+        return frame_from_chunks(iter_route53_records(session))
     except Exception as e:
-        st.error(f"Route53 조회 오류: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        report_error(f"Route53 조회 오류: {e}")
+        return pd.DataFrame()
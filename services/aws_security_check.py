@@ -1,222 +1,433 @@
-import streamlit as st
+from utils.cache import cached_call
+from utils.collector import map_concurrently
+from utils.pagination import iter_pages
+from config.database import get_root_activity, save_root_activity
+from services.sg_rules import flatten_sg_rules, evaluate_sg_rules, SG_POLICIES
+from services.aws_storage import get_s3_bucket_metadata
+from services.iam_policies import evaluate_iam_grants, IAM_POLICIES, SERVICE_LINKED_ROLE_PATH
+import io
+import time
+from datetime import datetime, timezone, timedelta
 import pandas as pd
 
-# S3 Public 여부 점검
-def check_s3_public_access(session):
+# 자격증명 보고서 재생성 가능 주기 (AWS는 4시간 이내 보고서를 재사용)
+CREDENTIAL_REPORT_TTL = 4 * 3600
+# 액세스키 교체/미사용 기준 (일)
+ACCESS_KEY_MAX_AGE_DAYS = 90
+ACCESS_KEY_MAX_UNUSED_DAYS = 90
+# IAM 사용자/역할 미사용 기준 (일)
+IAM_INACTIVE_DAYS = 90
+# Root 계정 최근 사용 판단 기준 (일)
+ROOT_USAGE_RECENT_DAYS = 7
+# CloudTrail 이벤트 조회 가능 기간 (일)
+ROOT_EVENT_LOOKBACK_DAYS = 90
+# CloudTrail 이벤트 전달 지연 여유 (분, 이벤트는 발생 후 최대 약 15분 뒤 조회됨)
+ROOT_EVENT_DELIVERY_MARGIN_MINUTES = 20
+
+# Public Access Block 4개 항목
+PAB_FLAGS = ('BlockPublicAcls', 'IgnorePublicAcls', 'BlockPublicPolicy', 'RestrictPublicBuckets')
+
+# 세션 계정 ID 조회
+def _account_id(session):
+    return cached_call(
+        session.project_key, None, 'Account ID',
+        lambda: session.client('sts').get_caller_identity()['Account']
+    )
+
+# Public Access Block 설정 조회 (미설정이면 모든 항목 False)
+def _pab_flags(response_getter):
     try:
-        s3 = session.client('s3')
-        results = []
-        
-        # 모든 S3 버킷 조회
-        buckets = s3.list_buckets()['Buckets']
-        
-        for bucket in buckets:
-            bucket_name = bucket['Name']
-            is_public = False
-            
-            try:
-                # Public Access Block 설정 확인
-                public_access_block = s3.get_public_access_block(Bucket=bucket_name)
-                pab_config = public_access_block['PublicAccessBlockConfiguration']
-                
-                # 모든 Public Access Block이 True가 아니면 취약
-                if not all([
-                    pab_config.get('BlockPublicAcls', False),
-                    pab_config.get('IgnorePublicAcls', False),
-                    pab_config.get('BlockPublicPolicy', False),
-                    pab_config.get('RestrictPublicBuckets', False)
-                ]):
-                    is_public = True
-            except:
-                # Public Access Block이 설정되지 않은 경우 취약
-                is_public = True
-            
-            try:
-                # Bucket ACL 확인
-                acl = s3.get_bucket_acl(Bucket=bucket_name)
-                for grant in acl['Grants']:
-                    grantee = grant.get('Grantee', {})
-                    if grantee.get('Type') == 'Group' and 'AllUsers' in grantee.get('URI', ''):
-                        is_public = True
-                        break
-            except:
-                pass
-            
-            results.append({
-                'Bucket Name': bucket_name,
-                '취약성여부': '취약함' if is_public else '양호함'
-            })
-        
-        return pd.DataFrame(results)
-    except Exception as e:
-        st.error(f"S3 Public Access 점검 오류: {e}")
-        return pd.DataFrame()
+        config = response_getter()['PublicAccessBlockConfiguration']
+        return {flag: config.get(flag, False) for flag in PAB_FLAGS}
+    except Exception:
+        return {flag: False for flag in PAB_FLAGS}
+
+# 계정 수준 Public Access Block 조회
+def _account_pab_flags(session):
+    s3control = session.client('s3control')
+    return _pab_flags(lambda: s3control.get_public_access_block(AccountId=_account_id(session)))
+
+# 버킷 1개의 Public 여부 점검 (PAB, ACL, 정책 상태)
+def _check_bucket_public(s3, bucket_name, account_flags):
+    bucket_flags = _pab_flags(lambda: s3.get_public_access_block(Bucket=bucket_name))
+    # 계정/버킷 설정 중 하나라도 켜져 있으면 해당 항목 적용
+    effective = {flag: account_flags[flag] or bucket_flags[flag] for flag in PAB_FLAGS}
+    if all(effective.values()):
+        return {'Public Access Block': '차단됨', 'Public ACL': '-', 'Public Policy': '-', 'is_public': False}
+
+    public_acl = False
+    try:
+        for grant in s3.get_bucket_acl(Bucket=bucket_name)['Grants']:
+            grantee = grant.get('Grantee', {})
+            if grantee.get('Type') == 'Group' and 'AllUsers' in grantee.get('URI', ''):
+                public_acl = True
+                break
+    except Exception:
+        pass
 
-# Security Group Inbound 0.0.0.0/0 점검
-def check_sg_open_to_world(session):
+    public_policy = False
     try:
-        ec2 = session.client('ec2')
-        results = []
-        
-        # 모든 Security Group 조회
-        sgs = ec2.describe_security_groups()['SecurityGroups']
-        
-        for sg in sgs:
-            sg_id = sg['GroupId']
-            sg_name = sg.get('GroupName', 'N/A')
-            is_vulnerable = False
-            
-            # Inbound 규칙 확인
-            for rule in sg.get('IpPermissions', []):
-                for ip_range in rule.get('IpRanges', []):
-                    if ip_range.get('CidrIp') == '0.0.0.0/0':
-                        is_vulnerable = True
-                        break
-                if is_vulnerable:
-                    break
-            
-            results.append({
-                'Security Group ID': sg_id,
-                'Security Group Name': sg_name,
-                '취약성여부': '취약함' if is_vulnerable else '양호함'
-            })
-        
-        return pd.DataFrame(results)
-    except Exception as e:
-        st.error(f"Security Group 점검 오류: {e}")
+        public_policy = s3.get_bucket_policy_status(Bucket=bucket_name)['PolicyStatus'].get('IsPublic', False)
+    except Exception:
+        # 버킷 정책이 없는 경우
+        pass
+
+    # 모든 Public Access Block이 켜져 있지 않으면 취약
+    return {
+        'Public Access Block': '일부/미설정',
+        'Public ACL': '예' if public_acl else '아니오',
+        'Public Policy': '예' if public_policy else '아니오',
+        'is_public': True
+    }
+
+# 버킷별 Public 여부 상태 조회 (점검 입력)
+def get_s3_public_status(session):
+    """계정 수준 Public Access Block이 모두 켜져 있으면 버킷별 호출 없이 차단 처리,
+    아니면 버킷별 PAB/ACL/정책 상태를 병렬 조회 (판정은 캐시하지 않아 버킷 설정 변경이 즉시 반영, 리전만 캐시)
+    반환값: [{'Bucket Name', 'Region', 'Public Access Block', 'Public ACL', 'Public Policy', 'is_public'(None이면 확인불가)}]
+    """
+    s3 = session.client('s3')
+    buckets = [bucket for page in iter_pages(s3, 'list_buckets') for bucket in page['Buckets']]
+    if not buckets:
+        return []
+    # 버킷 리전은 영구 메타데이터 캐시에서 조회 (새 버킷만 AWS 조회)
+    regions = {name: values['region'] for name, values in get_s3_bucket_metadata(session, buckets).items()}
+
+    account_flags = _account_pab_flags(session)
+    if all(account_flags.values()):
+        return [
+            {
+                'Bucket Name': bucket['Name'],
+                'Region': regions[bucket['Name']],
+                'Public Access Block': '계정 전체 차단',
+                'Public ACL': '-',
+                'Public Policy': '-',
+                'is_public': False
+            }
+            for bucket in buckets
+        ]
+
+    # 버킷 설정(PAB/ACL/정책)은 변경 신호가 없으므로 판정은 캐시하지 않고 매 점검마다 조회
+    # 버킷 리전처럼 변하지 않는 값만 캐시 사용
+    # 버킷 리전의 클라이언트로 호출하여 리전 간 리다이렉트 방지
+    clients = {region: session.client('s3', region_name=region) for region in set(regions.values()) if region != 'N/A'}
+    checks = map_concurrently(
+        lambda name: _check_bucket_public(clients.get(regions[name], s3), name, account_flags),
+        [bucket['Name'] for bucket in buckets]
+    )
+
+    statuses = []
+    for bucket in buckets:
+        check = checks[bucket['Name']]
+        if isinstance(check, Exception):
+            check = {'Public Access Block': 'Error', 'Public ACL': 'Error', 'Public Policy': 'Error', 'is_public': None}
+        statuses.append({'Bucket Name': bucket['Name'], 'Region': regions[bucket['Name']], **check})
+    return statuses
+
+# S3 Public 여부 점검
+def check_s3_public_access(inputs):
+    statuses = inputs['s3_public_status']
+    if not statuses:
         return pd.DataFrame()
+    results = pd.DataFrame(statuses)
+    results['취약성여부'] = results.pop('is_public').map({True: '취약함', False: '양호함'}).fillna('확인불가')
+    return results
+
+# Security Group Inbound 0.0.0.0/0, ::/0 점검 (SG별 1행)
+def check_sg_open_to_world(inputs):
+    security_groups = inputs['security_groups']
+    if not security_groups:
+        return pd.DataFrame()
+
+    findings = evaluate_sg_rules(flatten_sg_rules(security_groups), {'world-open': SG_POLICIES['world-open']})
+    open_rule_counts = findings.groupby('GroupId').size()
+
+    groups = pd.DataFrame({
+        'Security Group ID': [sg['GroupId'] for sg in security_groups],
+        'Security Group Name': [sg.get('GroupName', 'N/A') for sg in security_groups]
+    })
+    counts = groups['Security Group ID'].map(open_rule_counts).fillna(0).astype(int)
+    groups['전체 허용 규칙 수'] = counts
+    groups['취약성여부'] = (counts > 0).map({True: '취약함', False: '양호함'})
+    return groups
+
+# Security Group 규칙별 정책 위반 탐지 (전체 허용, 관리 포트 노출, 넓은 포트 범위, 넓은 CIDR)
+def check_sg_rule_findings(inputs):
+    findings = evaluate_sg_rules(flatten_sg_rules(inputs['security_groups']))
+    if findings.empty:
+        return pd.DataFrame()
+
+    ports = findings['FromPort'].astype(str) + '-' + findings['ToPort'].astype(str)
+    return pd.DataFrame({
+        'Security Group ID': findings['GroupId'],
+        'Security Group Name': findings['GroupName'],
+        'Protocol': findings['Protocol'],
+        'Port Range': ports.where(findings['FromPort'] >= 0, 'N/A'),
+        'Source': findings['Source'],
+        'Policy': findings['Policy'],
+        'Severity': findings['Severity'],
+        'Finding': findings['Finding']
+    })
+
+# 자격증명 보고서 생성 및 조회 (CSV 1회 다운로드)
+def _fetch_credential_report(session):
+    iam = session.client('iam')
+    # 보고서 생성이 끝날 때까지 대기 (최근 4시간 이내 보고서가 있으면 즉시 COMPLETE)
+    for _ in range(30):
+        if iam.generate_credential_report()['State'] == 'COMPLETE':
+            break
+        time.sleep(1)
+    response = iam.get_credential_report()
+    return {
+        'generated_at': response['GeneratedTime'],
+        'frame': pd.read_csv(io.BytesIO(response['Content']), dtype=str)
+    }
+
+# 보고서 만료까지 남은 시간 (초)
+def _credential_report_ttl(report):
+    expires_at = report['generated_at'] + timedelta(seconds=CREDENTIAL_REPORT_TTL)
+    return max((expires_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+# IAM 자격증명 보고서 (사용자별 1행, 경과일 컬럼 포함)
+def get_credential_report(session):
+    """보고서는 만료(생성 후 4시간)까지 프로젝트별로 캐시되어 재조회 시 AWS를 호출하지 않음
+    추가 컬럼: password_age_days, access_key_1_age_days, access_key_2_age_days,
+              access_key_age_days, access_key_unused_days (활성 키 중 가장 오래된 값)
+    """
+    report = cached_call(
+        session.project_key, None, 'Credential Report',
+        lambda: _fetch_credential_report(session),
+        ttl=_credential_report_ttl
+    )
+    frame = report['frame'].copy()
+    now = pd.Timestamp.now(tz='UTC')
+
+    # 'N/A', 'no_information' 등은 NaT로 변환하여 경과일 계산에서 제외
+    def days_since(column):
+        return (now - pd.to_datetime(frame[column], errors='coerce', utc=True)).dt.days
+
+    frame['password_age_days'] = days_since('password_last_changed').where(frame['password_enabled'] == 'true')
+    for key in ('access_key_1', 'access_key_2'):
+        active = frame[f'{key}_active'] == 'true'
+        frame[f'{key}_age_days'] = days_since(f'{key}_last_rotated').where(active)
+        # 사용 이력이 없으면 교체(생성) 이후 미사용 기간으로 계산
+        frame[f'{key}_unused_days'] = days_since(f'{key}_last_used_date').fillna(
+            frame[f'{key}_age_days']
+        ).where(active)
+    frame['access_key_age_days'] = frame[['access_key_1_age_days', 'access_key_2_age_days']].max(axis=1)
+    frame['access_key_unused_days'] = frame[['access_key_1_unused_days', 'access_key_2_unused_days']].max(axis=1)
+    return frame
+
+# 보고서의 IAM 사용자 행 (root 계정 제외)
+def _credential_report_users(report):
+    return report[report['user'] != '<root_account>']
+
+# 경과일 표시용 (값이 없으면 N/A)
+def _format_days(series):
+    return series.map(lambda days: 'N/A' if pd.isna(days) else f"{int(days)}일")
 
 # IAM 사용자 MFA 점검
-def check_iam_mfa(session):
-    try:
-        iam = session.client('iam')
-        results = []
-        
-        # 모든 IAM 사용자 조회
-        users = iam.list_users()['Users']
-        
-        for user in users:
-            username = user['UserName']
-            has_mfa = False
-            
-            try:
-                # MFA 디바이스 확인
-                mfa_devices = iam.list_mfa_devices(UserName=username)['MFADevices']
-                has_mfa = len(mfa_devices) > 0
-            except:
-                pass
-            
-            results.append({
-                'IAM User': username,
-                '취약성여부': '양호함' if has_mfa else '취약함'
-            })
-        
-        return pd.DataFrame(results)
-    except Exception as e:
-        st.error(f"IAM MFA 점검 오류: {e}")
+def check_iam_mfa(inputs):
+    users = _credential_report_users(inputs['credential_report'])
+    if users.empty:
         return pd.DataFrame()
 
+    return pd.DataFrame({
+        'IAM User': users['user'],
+        'MFA': users['mfa_active'].map({'true': '활성', 'false': '비활성'}),
+        '비밀번호 경과일': _format_days(users['password_age_days']),
+        '액세스키 경과일': _format_days(users['access_key_age_days']),
+        '액세스키 미사용일': _format_days(users['access_key_unused_days']),
+        '취약성여부': users['mfa_active'].eq('true').map({True: '양호함', False: '취약함'})
+    }).reset_index(drop=True)
+
+# IAM 액세스키 교체/미사용 점검 (활성 액세스키가 있는 사용자만)
+def check_iam_access_keys(inputs):
+    users = _credential_report_users(inputs['credential_report'])
+    users = users[users['access_key_age_days'].notna()]
+    if users.empty:
+        return pd.DataFrame()
+
+    vulnerable = (
+        (users['access_key_age_days'] > ACCESS_KEY_MAX_AGE_DAYS)
+        | (users['access_key_unused_days'] > ACCESS_KEY_MAX_UNUSED_DAYS)
+    )
+    return pd.DataFrame({
+        'IAM User': users['user'],
+        '액세스키 경과일': _format_days(users['access_key_age_days']),
+        '액세스키 미사용일': _format_days(users['access_key_unused_days']),
+        '취약성여부': vulnerable.map({True: '취약함', False: '양호함'})
+    }).reset_index(drop=True)
+
+# 관리자 권한 보유 주체 점검 (사용자/그룹/역할별 1행, 그룹 상속 권한 포함)
+def check_iam_admin_access(inputs):
+    principals = inputs['iam_principals']
+    if principals.empty:
+        return pd.DataFrame()
+
+    findings = evaluate_iam_grants(inputs['iam_grants'], {'admin-equivalent': IAM_POLICIES['admin-equivalent']})
+    admin_policies = findings.groupby(['Type', 'Name'])['PolicyName'].agg(lambda names: ', '.join(sorted(set(names)))).to_dict()
+    policies = pd.Series(
+        [admin_policies.get(key) for key in zip(principals['Type'], principals['Name'])],
+        index=principals.index, dtype=object
+    )
+    return pd.DataFrame({
+        'Type': principals['Type'],
+        'Name': principals['Name'],
+        'Admin Policies': policies.fillna('-'),
+        '취약성여부': policies.notna().map({True: '취약함', False: '양호함'})
+    }).reset_index(drop=True)
+
+# 모든 리소스 대상 서비스 전체 작업 허용 탐지 (주체 x 정책 x 작업 1건당 1행)
+def check_iam_wildcard_actions(inputs):
+    findings = evaluate_iam_grants(inputs['iam_grants'], {'service-wildcard': IAM_POLICIES['service-wildcard']})
+    if findings.empty:
+        return pd.DataFrame()
+
+    actions = findings['Action'].where(~findings['NotAction'], 'NotAction: ' + findings['Action'])
+    return pd.DataFrame({
+        'Type': findings['Type'],
+        'Name': findings['Name'],
+        'Policy': findings['PolicyName'],
+        'Source': findings['Source'],
+        'Action': actions,
+        'Severity': findings['Severity']
+    }).drop_duplicates().reset_index(drop=True)
+
+# 미사용 IAM 사용자/역할 점검 (사용자는 자격증명 보고서, 역할은 RoleLastUsed 기준)
+def check_iam_inactive_principals(inputs):
+    principals = inputs['iam_principals']
+    principals = principals[
+        (principals['Type'] == 'User')
+        | ((principals['Type'] == 'Role') & (principals['Path'] != SERVICE_LINKED_ROLE_PATH))
+    ]
+    if principals.empty:
+        return pd.DataFrame()
+
+    # 사용자의 마지막 사용: 비밀번호, 액세스키 1/2 중 가장 최근
+    report = _credential_report_users(inputs['credential_report']).set_index('user')
+    user_last_used = pd.concat([
+        pd.to_datetime(report[column], errors='coerce', utc=True)
+        for column in ('password_last_used', 'access_key_1_last_used_date', 'access_key_2_last_used_date')
+    ], axis=1).max(axis=1)
+    last_used = principals['LastUsedDate'].where(
+        principals['Type'] == 'Role', principals['Name'].map(user_last_used)
+    )
+    # 사용 이력이 없으면 생성 이후 기간으로 판단
+    idle_days = (pd.Timestamp.now(tz='UTC') - last_used.fillna(principals['CreateDate'])).dt.days
+    return pd.DataFrame({
+        'Type': principals['Type'],
+        'Name': principals['Name'],
+        '마지막 사용': last_used.dt.strftime('%Y-%m-%d').fillna('사용 이력 없음'),
+        '미사용일': _format_days(idle_days),
+        '취약성여부': (idle_days > IAM_INACTIVE_DAYS).map({True: '취약함', False: '양호함'})
+    }).reset_index(drop=True)
+
+# Root 계정 사용 이벤트 조회 (이벤트는 최신순이므로 첫 이벤트에서 페이지 순회 중단)
+def _latest_root_event_time(session, start_time, end_time):
+    cloudtrail = session.client('cloudtrail')
+    pages = iter_pages(
+        cloudtrail, 'lookup_events',
+        LookupAttributes=[{'AttributeKey': 'Username', 'AttributeValue': 'root'}],
+        StartTime=start_time,
+        EndTime=end_time
+    )
+    for page in pages:
+        if page['Events']:
+            return page['Events'][0]['EventTime']
+    return None
+
+# Root 계정 마지막 사용 시각 (이전에 조회한 구간 이후만 CloudTrail 조회)
+def _root_last_used_at(session):
+    """계정별 조회 완료 시점을 DB에 기록하여 재점검 시 새 구간만 조회 (lookup_events는 계정당 2 TPS)
+    첫 점검은 CloudTrail 이벤트 보관 기간(90일) 전체 조회
+    조회 완료 시점은 전달 지연 여유만큼 앞당겨 저장하여 늦게 전달된 이벤트를 다음 점검에서 다시 조회
+    """
+    account_id = _account_id(session)
+    activity = get_root_activity(account_id) or {}
+    end_time = datetime.now(timezone.utc)
+    start_time = end_time - timedelta(days=ROOT_EVENT_LOOKBACK_DAYS)
+    if activity.get('scanned_until'):
+        start_time = max(start_time, activity['scanned_until'])
+
+    event_time = _latest_root_event_time(session, start_time, end_time)
+    save_root_activity(account_id, end_time - timedelta(minutes=ROOT_EVENT_DELIVERY_MARGIN_MINUTES), event_time)
+    candidates = [time for time in (event_time, activity.get('last_used_at')) if time]
+    return max(candidates) if candidates else None
+
+# Root 계정 액세스키/최근 사용 여부 조회 (점검 입력, 확인 실패 항목은 None)
+def get_root_account_status(session):
+    """반환값: {'access_keys_present', 'used_recently', 'last_used_at'(ISO 문자열, 사용 이력이 없으면 None)}"""
+    status = {'access_keys_present': None, 'used_recently': None, 'last_used_at': None}
+
+    # Root 계정 액세스키 확인
+    try:
+        account_summary = session.client('iam').get_account_summary()['SummaryMap']
+        status['access_keys_present'] = account_summary.get('AccountAccessKeysPresent', 0) > 0
+    except Exception:
+        pass
+
+    # Root 계정 사용 여부 (최근 7일 이내 CloudTrail 이벤트)
+    try:
+        last_used_at = _root_last_used_at(session)
+        recent_since = datetime.now(timezone.utc) - timedelta(days=ROOT_USAGE_RECENT_DAYS)
+        status['used_recently'] = last_used_at is not None and last_used_at >= recent_since
+        status['last_used_at'] = last_used_at.isoformat() if last_used_at else None
+    except Exception:
+        pass
+    return status
+
+# 시각 표시용 (값이 없으면 N/A)
+def _format_timestamp(value):
+    return pd.Timestamp(value).tz_convert('UTC').strftime('%Y-%m-%d %H:%M UTC') if value else 'N/A'
+
+# 점검 결과 표시 (None이면 확인불가)
+def _verdict(vulnerable):
+    if vulnerable is None:
+        return '확인불가'
+    return '취약함' if vulnerable else '양호함'
+
 # Root 계정 사용 및 액세스키 점검
-def check_root_account(session):
+def check_root_account(inputs):
+    status = inputs['root_account']
+    return pd.DataFrame([
+        {'Check Item': 'Root Account Access Keys', 'Last Used': 'N/A',
+         '취약성여부': _verdict(status['access_keys_present'])},
+        {'Check Item': f'Root Account Usage (Last {ROOT_USAGE_RECENT_DAYS} days)', 'Last Used': _format_timestamp(status['last_used_at']),
+         '취약성여부': _verdict(status['used_recently'])}
+    ])
+
+# CloudTrail 목록과 로깅 상태 조회 (점검 입력)
+def get_cloudtrail_status(session):
+    """반환값: [{'name', 'is_logging'(None이면 상태 조회 실패)}], 목록 조회 실패 시 None"""
+    cloudtrail = session.client('cloudtrail')
     try:
-        iam = session.client('iam')
-        cloudtrail = session.client('cloudtrail')
-        results = []
-        
-        # Root 계정 액세스키 확인
-        try:
-            account_summary = iam.get_account_summary()['SummaryMap']
-            root_access_keys = account_summary.get('AccountAccessKeysPresent', 0)
-            
-            results.append({
-                'Check Item': 'Root Account Access Keys',
-                '취약성여부': '취약함' if root_access_keys > 0 else '양호함'
-            })
-        except:
-            results.append({
-                'Check Item': 'Root Account Access Keys',
-                '취약성여부': '확인불가'
-            })
-        
-        # Root 계정 사용 여부 (CloudTrail 로그 확인)
+        trails = cloudtrail.describe_trails()['trailList']
+    except Exception:
+        return None
+
+    statuses = []
+    for trail in trails:
         try:
-            # 최근 7일간 Root 사용 이벤트 확인
-            import datetime
-            end_time = datetime.datetime.now()
-            start_time = end_time - datetime.timedelta(days=7)
-            
-            events = cloudtrail.lookup_events(
-                LookupAttributes=[
-                    {
-                        'AttributeKey': 'Username',
-                        'AttributeValue': 'root'
-                    }
-                ],
-                StartTime=start_time,
-                EndTime=end_time
-            )
-            
-            root_usage = len(events['Events']) > 0
-            
-            results.append({
-                'Check Item': 'Root Account Usage (Last 7 days)',
-                '취약성여부': '취약함' if root_usage else '양호함'
-            })
-        except:
-            results.append({
-                'Check Item': 'Root Account Usage (Last 7 days)',
-                '취약성여부': '확인불가'
-            })
-        
-        return pd.DataFrame(results)
-    except Exception as e:
-        st.error(f"Root 계정 점검 오류: {e}")
-        return pd.DataFrame()
+            is_logging = cloudtrail.get_trail_status(Name=trail['Name']).get('IsLogging', False)
+        except Exception:
+            is_logging = None
+        statuses.append({'name': trail['Name'], 'is_logging': is_logging})
+    return statuses
 
 # CloudTrail 로그 활성화 점검
-def check_cloudtrail_logging(session):
-    try:
-        cloudtrail = session.client('cloudtrail')
-        results = []
-        
-        # 모든 CloudTrail 조회
-        try:
-            trails = cloudtrail.describe_trails()['trailList']
-            
-            if not trails:
-                results.append({
-                    'Trail Name': 'No CloudTrail Found',
-                    'Status': 'N/A',
-                    '취약성여부': '취약함'
-                })
-            else:
-                for trail in trails:
-                    trail_name = trail['Name']
-                    
-                    # Trail 상태 확인
-                    try:
-                        status = cloudtrail.get_trail_status(Name=trail_name)
-                        is_logging = status.get('IsLogging', False)
-                        
-                        results.append({
-                            'Trail Name': trail_name,
-                            'Status': 'Logging' if is_logging else 'Not Logging',
-                            '취약성여부': '양호함' if is_logging else '취약함'
-                        })
-                    except Exception as status_error:
-                        results.append({
-                            'Trail Name': trail_name,
-                            'Status': 'Error',
-                            '취약성여부': '확인불가'
-                        })
-        except Exception as trail_error:
-            results.append({
-                'Trail Name': 'Error retrieving trails',
-                'Status': 'Error',
-                '취약성여부': '확인불가'
-            })
-        
-        return pd.DataFrame(results)
-    except Exception as e:
-        st.error(f"CloudTrail 점검 오류: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+def check_cloudtrail_logging(inputs):
+    trails = inputs['cloudtrail_status']
+    if trails is None:
+        return pd.DataFrame([{'Trail Name': 'Error retrieving trails', 'Status': 'Error', '취약성여부': '확인불가'}])
+    if not trails:
+        return pd.DataFrame([{'Trail Name': 'No CloudTrail Found', 'Status': 'N/A', '취약성여부': '취약함'}])
+
+    return pd.DataFrame([
+        {
+            'Trail Name': trail['name'],
+            'Status': 'Error' if trail['is_logging'] is None else ('Logging' if trail['is_logging'] else 'Not Logging'),
+            '취약성여부': _verdict(None if trail['is_logging'] is None else not trail['is_logging'])
+        }
+        for trail in trails
+    ])
@@ -1,34 +1,72 @@
-import streamlit as st
+import logging
+from config.database import get_bucket_metadata, save_bucket_metadata
+from utils.collector import map_concurrently
+from utils.errors import report_error, capture_errors
+from utils.pagination import iter_pages, frame_from_chunks
 import pandas as pd
 
+# 버킷 리전 조회 (LocationConstraint가 없으면 us-east-1)
+def _get_bucket_region(s3, bucket_name):
+    return s3.get_bucket_location(Bucket=bucket_name)['LocationConstraint'] or 'us-east-1'
+
+logger = logging.getLogger(__name__)
+
+# 메타데이터 캐시(DB) 호출 (실패해도 S3 수집 오류로 보고하지 않고 캐시 미적중으로 처리, 로그만 기록)
+def _metadata_cache_call(fn, *args):
+    with capture_errors() as errors:
+        result = fn(*args)
+    for message in errors:
+        logger.warning("S3 버킷 메타데이터 캐시 사용 불가: %s", message)
+    return result
+
+# 버킷별 불변 메타데이터 (저장된 버킷은 일괄 조회, 새 버킷만 병렬 조회 후 저장)
+def get_s3_bucket_metadata(session, buckets):
+    """buckets: list_buckets 결과 항목, 반환값: {버킷명: {'region'}} (조회 실패 시 region 'N/A')"""
+    keys = [(bucket['Name'], bucket['CreationDate']) for bucket in buckets]
+    known = _metadata_cache_call(get_bucket_metadata, keys)
+    missing = [name for name, creation_date in keys if (name, creation_date) not in known]
+
+    s3 = session.client('s3')
+    regions = map_concurrently(lambda name: _get_bucket_region(s3, name), missing)
+    creation_dates = dict(keys)
+    _metadata_cache_call(save_bucket_metadata, [
+        (name, creation_dates[name], region)
+        for name, region in regions.items() if not isinstance(region, Exception)
+    ])
+
+    metadata = {name: values for (name, _), values in known.items()}
+    for name, region in regions.items():
+        metadata[name] = {'region': 'N/A' if isinstance(region, Exception) else region}
+    return metadata
+
+# S3 버킷 조회 (페이지 단위 스트리밍)
+def iter_s3_buckets(session):
+    s3 = session.client('s3')
+    for page in iter_pages(s3, 'list_buckets'):
+        metadata = get_s3_bucket_metadata(session, page['Buckets'])
+        yield [
+            {
+                'Bucket Name': bucket['Name'],
+                'Creation Date': bucket['CreationDate'].strftime('%Y-%m-%d'),
+                'Region': metadata[bucket['Name']]['region']
+            }
+            for bucket in page['Buckets']
+        ]
+
 # S3 버킷 조회
 def get_s3_buckets(session):
     try:
-        s3 = session.client('s3')
-        response = s3.list_buckets()
-        buckets = []
-        for bucket in response['Buckets']:
-            try:
-                location = s3.get_bucket_location(Bucket=bucket['Name'])['LocationConstraint'] or 'us-east-1'
-            except:
-                location = 'N/A'
-            buckets.append({
-                'Bucket Name': bucket['Name'],
-                'Creation Date': bucket['CreationDate'].strftime('%Y-%m-%d'),
-                'Region': location
-            })
-        return pd.DataFrame(buckets)
+        return frame_from_chunks(iter_s3_buckets(session))
     except Exception as e:
-        st.error(f"S3 조회 오류: {e}")
+        report_error(f"S3 조회 오류: {e}")
         return pd.DataFrame()
 
-# EFS 파일시스템 조회
-def get_efs_filesystems(session):
-    try:
-        efs = session.client('efs')
-        response = efs.describe_file_systems()
+# EFS 파일시스템 조회 (페이지 단위 스트리밍)
+def iter_efs_filesystems(session):
+    efs = session.client('efs')
+    for page in iter_pages(efs, 'describe_file_systems'):
         filesystems = []
-        for fs in response['FileSystems']:
+        for fs in page['FileSystems']:
             filesystems.append({
                 'File System ID': fs['FileSystemId'],
                 'Name': fs.get('Name', 'N/A'),
@@ -39,7 +77,12 @@ def get_efs_filesystems(session):
                 'Size (Bytes)': fs['SizeInBytes']['Value'],
                 'Creation Time': fs['CreationTime'].strftime('%Y-%m-%d')
             })
-        return pd.DataFrame(filesystems)
+        yield filesystems
+
+# EFS 파일시스템 조회
+def get_efs_filesystems(session):
+    try:
+        return frame_from_chunks(iter_efs_filesystems(session))
     except Exception as e:
-        st.error(f"EFS 조회 오류: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        report_error(f"EFS 조회 오류: {e}")
+        return pd.DataFrame()
@@ -1,13 +1,13 @@
-import streamlit as st
+from utils.errors import report_error
+from utils.pagination import iter_pages, frame_from_chunks
 import pandas as pd
 
-# VPC 조회
-def get_vpcs(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_vpcs()
+# VPC 조회 (페이지 단위 스트리밍)
+def iter_vpcs(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_vpcs'):
         vpcs = []
-        for vpc in response['Vpcs']:
+        for vpc in page['Vpcs']:
             name = next((tag['Value'] for tag in vpc.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
             vpcs.append({
                 'VPC ID': vpc['VpcId'],
@@ -16,18 +16,22 @@ def get_vpcs(session):
                 'State': vpc['State'],
                 'Default': vpc['IsDefault']
             })
-        return pd.DataFrame(vpcs)
+        yield vpcs
+
+# VPC 조회
+def get_vpcs(session):
+    try:
+        return frame_from_chunks(iter_vpcs(session))
     except Exception as e:
-        st.error(f"VPC 조회 오류: {e}")
+        report_error(f"VPC 조회 오류: {e}")
         return pd.DataFrame()
 
-# Subnet 조회
-def get_subnets(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_subnets()
+# Subnet 조회 (페이지 단위 스트리밍)
+def iter_subnets(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_subnets'):
         subnets = []
-        for subnet in response['Subnets']:
+        for subnet in page['Subnets']:
             name = next((tag['Value'] for tag in subnet.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
             subnets.append({
                 'Subnet ID': subnet['SubnetId'],
@@ -38,18 +42,22 @@ def get_subnets(session):
                 'Available IPs': subnet['AvailableIpAddressCount'],
                 'State': subnet['State']
             })
-        return pd.DataFrame(subnets)
+        yield subnets
+
+# Subnet 조회
+def get_subnets(session):
+    try:
+        return frame_from_chunks(iter_subnets(session))
     except Exception as e:
-        st.error(f"Subnet 조회 오류: {e}")
+        report_error(f"Subnet 조회 오류: {e}")
         return pd.DataFrame()
 
-# Internet Gateway 조회
-def get_internet_gateways(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_internet_gateways()
+# Internet Gateway 조회 (페이지 단위 스트리밍)
+def iter_internet_gateways(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_internet_gateways'):
         igws = []
-        for igw in response['InternetGateways']:
+        for igw in page['InternetGateways']:
             name = next((tag['Value'] for tag in igw.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
             attachments = ', '.join([att['VpcId'] for att in igw.get('Attachments', [])])
             igws.append({
@@ -58,18 +66,22 @@ def get_internet_gateways(session):
                 'State': igw['Attachments'][0]['State'] if igw.get('Attachments') else 'detached',
                 'Attached VPCs': attachments or 'None'
             })
-        return pd.DataFrame(igws)
+        yield igws
+
+# Internet Gateway 조회
+def get_internet_gateways(session):
+    try:
+        return frame_from_chunks(iter_internet_gateways(session))
     except Exception as e:
-        st.error(f"Internet Gateway 조회 오류: {e}")
+        report_error(f"Internet Gateway 조회 오류: {e}")
         return pd.DataFrame()
 
-# NAT Gateway 조회
-def get_nat_gateways(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_nat_gateways()
+# NAT Gateway 조회 (페이지 단위 스트리밍)
+def iter_nat_gateways(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_nat_gateways'):
         nat_gws = []
-        for nat in response['NatGateways']:
+        for nat in page['NatGateways']:
             name = next((tag['Value'] for tag in nat.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
             # Public IP 추출
             public_ip = 'N/A'
@@ -77,7 +89,7 @@ def get_nat_gateways(session):
                 if 'PublicIp' in address:
                     public_ip = address['PublicIp']
                     break
-            
+
             nat_gws.append({
                 'NAT Gateway ID': nat['NatGatewayId'],
                 'Name': name,
@@ -87,19 +99,22 @@ def get_nat_gateways(session):
                 'State': nat['State'],
                 'Type': nat.get('ConnectivityType', 'public')
             })
-        return pd.DataFrame(nat_gws)
+        yield nat_gws
+
+# NAT Gateway 조회
+def get_nat_gateways(session):
+    try:
+        return frame_from_chunks(iter_nat_gateways(session))
     except Exception as e:
-        st.error(f"NAT Gateway 조회 오류: {e}")
+        report_error(f"NAT Gateway 조회 오류: {e}")
         return pd.DataFrame()
 
-# VPN Gateway 조회
-def get_vpn_gateways(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_vpn_gateways()
+# VPN Gateway 조회 (페이지 단위 스트리밍)
+def iter_vpn_gateways(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_vpn_gateways'):
         vpn_gws = []
-        print(f"VPN Gateway 조회 결과: {len(response.get('VpnGateways', []))}개 발견")
-        for vpn in response['VpnGateways']:
+        for vpn in page['VpnGateways']:
             name = next((tag['Value'] for tag in vpn.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
             attachments = ', '.join([att['VpcId'] for att in vpn.get('VpcAttachments', [])])
             vpn_gws.append({
@@ -109,33 +124,36 @@ def get_vpn_gateways(session):
                 'State': vpn['State'],
                 'Attached VPCs': attachments or 'None'
             })
-        return pd.DataFrame(vpn_gws)
+        yield vpn_gws
+
+# VPN Gateway 조회
+def get_vpn_gateways(session):
+    try:
+        return frame_from_chunks(iter_vpn_gateways(session))
     except Exception as e:
-        st.error(f"VPN Gateway 조회 오류: {e}")
+        report_error(f"VPN Gateway 조회 오류: {e}")
         return pd.DataFrame()
 
-# Site-to-Site VPN 연결 조회
-def get_vpn_connections(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_vpn_connections()
+# Site-to-Site VPN 연결 조회 (페이지 단위 스트리밍)
+def iter_vpn_connections(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_vpn_connections'):
         vpn_connections = []
-        print(f"Site-to-Site VPN 조회 결과: {len(response.get('VpnConnections', []))}개 발견")
-        for vpn in response['VpnConnections']:
+        for vpn in page['VpnConnections']:
             name = next((tag['Value'] for tag in vpn.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
-            
+
             # 터널 정보 추출
             tunnel_info = []
             for i, tunnel in enumerate(vpn.get('VgwTelemetry', []), 1):
                 status = tunnel.get('Status', 'N/A')
                 tunnel_info.append(f"터널{i}: {status}")
-            
+
             # 정적 라우팅 CIDR 추출
             static_routes = []
             for route in vpn.get('Routes', []):
                 if 'DestinationCidrBlock' in route:
                     static_routes.append(route['DestinationCidrBlock'])
-            
+
             vpn_connections.append({
                 'VPN Connection ID': vpn['VpnConnectionId'],
                 'Name': name,
@@ -146,18 +164,22 @@ def get_vpn_connections(session):
                 'Tunnel Status': ', '.join(tunnel_info),
                 'Static Routes': ', '.join(static_routes) if static_routes else 'N/A'
             })
-        return pd.DataFrame(vpn_connections)
+        yield vpn_connections
+
+# Site-to-Site VPN 연결 조회
+def get_vpn_connections(session):
+    try:
+        return frame_from_chunks(iter_vpn_connections(session))
     except Exception as e:
-        st.error(f"Site-to-Site VPN 조회 오류: {e}")
+        report_error(f"Site-to-Site VPN 조회 오류: {e}")
         return pd.DataFrame()
 
-# Transit Gateway 조회
-def get_transit_gateways(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_transit_gateways()
+# Transit Gateway 조회 (페이지 단위 스트리밍)
+def iter_transit_gateways(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_transit_gateways'):
         tgws = []
-        for tgw in response['TransitGateways']:
+        for tgw in page['TransitGateways']:
             name = next((tag['Value'] for tag in tgw.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
             tgws.append({
                 'Transit Gateway ID': tgw['TransitGatewayId'],
@@ -166,18 +188,22 @@ def get_transit_gateways(session):
                 'Owner ID': tgw['OwnerId'],
                 'Default Route Table': tgw.get('Options', {}).get('DefaultRouteTableAssociation', 'N/A')
             })
-        return pd.DataFrame(tgws)
+        yield tgws
+
+# Transit Gateway 조회
+def get_transit_gateways(session):
+    try:
+        return frame_from_chunks(iter_transit_gateways(session))
     except Exception as e:
-        st.error(f"Transit Gateway 조회 오류: {e}")
+        report_error(f"Transit Gateway 조회 오류: {e}")
         return pd.DataFrame()
 
-# VPC Peering Connection 조회
-def get_vpc_peering_connections(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_vpc_peering_connections()
+# VPC Peering Connection 조회 (페이지 단위 스트리밍)
+def iter_vpc_peering_connections(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_vpc_peering_connections'):
         peerings = []
-        for peer in response['VpcPeeringConnections']:
+        for peer in page['VpcPeeringConnections']:
             name = next((tag['Value'] for tag in peer.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
             peerings.append({
                 'Peering Connection ID': peer['VpcPeeringConnectionId'],
@@ -188,18 +214,22 @@ def get_vpc_peering_connections(session):
                 'Requester Region': peer['RequesterVpcInfo'].get('Region', 'N/A'),
                 'Accepter Region': peer['AccepterVpcInfo'].get('Region', 'N/A')
             })
-        return pd.DataFrame(peerings)
+        yield peerings
+
+# VPC Peering Connection 조회
+def get_vpc_peering_connections(session):
+    try:
+        return frame_from_chunks(iter_vpc_peering_connections(session))
     except Exception as e:
-        st.error(f"VPC Peering 조회 오류: {e}")
+        report_error(f"VPC Peering 조회 오류: {e}")
         return pd.DataFrame()
 
-# Customer Gateway 조회
-def get_customer_gateways(session):
-    try:
-        ec2 = session.client('ec2')
-        response = ec2.describe_customer_gateways()
+# Customer Gateway 조회 (페이지 단위 스트리밍)
+def iter_customer_gateways(session):
+    ec2 = session.client('ec2')
+    for page in iter_pages(ec2, 'describe_customer_gateways'):
         gateways = []
-        for cgw in response['CustomerGateways']:
+        for cgw in page['CustomerGateways']:
             name = next((tag['Value'] for tag in cgw.get('Tags', []) if tag['Key'] == 'Name'), 'N/A')
             gateways.append({
                 'Customer Gateway ID': cgw['CustomerGatewayId'],
@@ -208,7 +238,12 @@ def get_customer_gateways(session):
                 'BGP ASN': cgw.get('BgpAsn', 'N/A'),
                 'State': cgw['State']
             })
-        return pd.DataFrame(gateways)
+        yield gateways
+
+# Customer Gateway 조회
+def get_customer_gateways(session):
+    try:
+        return frame_from_chunks(iter_customer_gateways(session))
     except Exception as e:
-        st.error(f"Customer Gateway 조회 오류: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        report_error(f"Customer Gateway 조회 오류: {e}")
+        return pd.DataFrame()
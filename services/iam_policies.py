@@ -0,0 +1,158 @@
+import json
+from urllib.parse import unquote
+import pandas as pd
+from utils.cache import cached_call
+from utils.pagination import iter_pages
+
+# 주체 테이블 컬럼
+PRINCIPAL_COLUMNS = ['Type', 'Name', 'Arn', 'Path', 'CreateDate', 'LastUsedDate']
+# 권한 테이블 컬럼 (Allow 문장의 Action x Resource 1건당 1행)
+GRANT_COLUMNS = ['Type', 'Name', 'PolicyName', 'Source', 'Action', 'Resource', 'NotAction', 'HasCondition']
+
+# 서비스 연결 역할 경로 (AWS가 관리하므로 미사용 점검 제외)
+SERVICE_LINKED_ROLE_PATH = '/aws-service-role/'
+
+# 계정 전체 IAM 사용자/그룹/역할/정책 조회 (페이지네이션 1회 스트림)
+def _fetch_authorization_details(session):
+    iam = session.client('iam')
+    details = {'UserDetailList': [], 'GroupDetailList': [], 'RoleDetailList': [], 'Policies': []}
+    for page in iter_pages(iam, 'get_account_authorization_details'):
+        for name, items in details.items():
+            items.extend(page.get(name, []))
+    return details
+
+# IAM 권한 상세 (점검 입력들이 공유하도록 프로젝트별 캐시)
+def get_authorization_details(session):
+    return cached_call(
+        session.project_key, None, 'IAM Authorization',
+        lambda: _fetch_authorization_details(session)
+    )
+
+# 정책 문서 (boto3가 디코딩하지 않은 경우 URL 인코딩된 JSON 문자열)
+def _policy_document(document):
+    if isinstance(document, str):
+        return json.loads(unquote(document))
+    return document or {}
+
+def _as_list(value):
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+# 정책 문서의 Allow 문장을 (Action, Resource, NotAction, HasCondition) 행으로 펼침
+def _allow_rows(document):
+    rows = []
+    for statement in _as_list(_policy_document(document).get('Statement')):
+        if statement.get('Effect') != 'Allow':
+            continue
+        not_action = 'NotAction' in statement
+        actions = _as_list(statement.get('NotAction' if not_action else 'Action'))
+        # NotResource는 제외 대상 외 모든 리소스이므로 '*'로 취급
+        resources = ['*'] if 'NotResource' in statement else _as_list(statement.get('Resource'))
+        has_condition = bool(statement.get('Condition'))
+        for action in actions:
+            for resource in resources:
+                rows.append((action.lower(), resource, not_action, has_condition))
+    return rows
+
+# 관리형 정책 ARN -> (정책명, 기본 버전 문서)
+def _managed_policy_index(details):
+    index = {}
+    for policy in details['Policies']:
+        document = next(
+            (version['Document'] for version in policy.get('PolicyVersionList', []) if version.get('IsDefaultVersion')),
+            None
+        )
+        index[policy['Arn']] = (policy['PolicyName'], document)
+    return index
+
+# 주체 테이블 (사용자/그룹/역할 1건당 1행)
+def build_principals(details):
+    """LastUsedDate: 역할의 마지막 사용 시각 (사용자/그룹은 NaT, 사용자 사용 이력은 자격증명 보고서 기준)"""
+    rows = []
+    for kind, key, name_key in (('User', 'UserDetailList', 'UserName'),
+                                ('Group', 'GroupDetailList', 'GroupName'),
+                                ('Role', 'RoleDetailList', 'RoleName')):
+        for item in details[key]:
+            rows.append((
+                kind, item[name_key], item['Arn'], item.get('Path', '/'), item.get('CreateDate'),
+                item.get('RoleLastUsed', {}).get('LastUsedDate')
+            ))
+    principals = pd.DataFrame(rows, columns=PRINCIPAL_COLUMNS)
+    principals['CreateDate'] = pd.to_datetime(principals['CreateDate'], utc=True)
+    principals['LastUsedDate'] = pd.to_datetime(principals['LastUsedDate'], utc=True)
+    return principals
+
+# 권한 테이블 (인라인, 관리형, 소속 그룹 정책을 주체별로 펼침)
+def build_grants(details):
+    """Source: 'inline' | 'managed' | 'group:<그룹명>' (사용자가 그룹에서 상속한 권한)"""
+    managed = _managed_policy_index(details)
+
+    def policy_rows(item, inline_key):
+        # 주체 1개에 직접 연결된 정책의 (정책명, Source, 권한 행) 목록
+        grants = []
+        for policy in item.get(inline_key, []):
+            grants.append((policy['PolicyName'], 'inline', _allow_rows(policy['PolicyDocument'])))
+        for policy in item.get('AttachedManagedPolicies', []):
+            policy_name, document = managed.get(policy['PolicyArn'], (policy['PolicyName'], None))
+            grants.append((policy_name, 'managed', _allow_rows(document)))
+        return grants
+
+    group_grants = {group['GroupName']: policy_rows(group, 'GroupPolicyList') for group in details['GroupDetailList']}
+    rows = []
+
+    def append(kind, name, grants, source=None):
+        for policy_name, policy_source, allow_rows in grants:
+            for action, resource, not_action, has_condition in allow_rows:
+                rows.append((kind, name, policy_name, source or policy_source, action, resource, not_action, has_condition))
+
+    for group_name, grants in group_grants.items():
+        append('Group', group_name, grants)
+    for user in details['UserDetailList']:
+        append('User', user['UserName'], policy_rows(user, 'UserPolicyList'))
+        for group_name in user.get('GroupList', []):
+            append('User', user['UserName'], group_grants.get(group_name, []), f'group:{group_name}')
+    for role in details['RoleDetailList']:
+        append('Role', role['RoleName'], policy_rows(role, 'RolePolicyList'))
+    return pd.DataFrame(rows, columns=GRANT_COLUMNS)
+
+# 점검 입력: 주체 테이블
+def get_iam_principals(session):
+    return build_principals(get_authorization_details(session))
+
+# 점검 입력: 권한 테이블
+def get_iam_grants(session):
+    return build_grants(get_authorization_details(session))
+
+# 권한 조건 (권한 테이블 -> bool Series)
+def _all_resources(grants):
+    return grants['Resource'] == '*'
+
+def _admin_equivalent(grants):
+    """조건 없이 모든 리소스에 모든 작업 허용 ('*' 또는 '*:*')"""
+    return grants['Action'].isin(['*', '*:*']) & _all_resources(grants) & ~grants['NotAction'] & ~grants['HasCondition']
+
+def _service_wildcard(grants):
+    """모든 리소스에 서비스 전체 작업('s3:*' 등) 또는 NotAction 허용 (관리자 권한 제외)"""
+    wildcard = grants['Action'].str.endswith(':*') & (grants['Action'] != '*:*') & ~grants['NotAction']
+    return (wildcard | grants['NotAction']) & _all_resources(grants)
+
+# 정책명 -> (심각도, 설명, 조건 함수)
+IAM_POLICIES = {
+    'admin-equivalent': ('Critical', "모든 리소스에 모든 작업 허용 (관리자 권한)", _admin_equivalent),
+    'service-wildcard': ('High', "모든 리소스에 서비스 전체 작업(svc:*) 또는 NotAction 허용", _service_wildcard)
+}
+
+# 권한 테이블에 정책을 일괄 적용하여 탐지 결과 반환 (권한 행 x 위반 정책 1건당 1행)
+def evaluate_iam_grants(grants, policies=None):
+    policies = policies or IAM_POLICIES
+    if grants.empty:
+        return pd.DataFrame(columns=GRANT_COLUMNS + ['Policy', 'Severity', 'Finding'])
+    findings = []
+    for name, (severity, description, predicate) in policies.items():
+        matched = grants[predicate(grants)]
+        if not matched.empty:
+            findings.append(matched.assign(Policy=name, Severity=severity, Finding=description))
+    if not findings:
+        return pd.DataFrame(columns=GRANT_COLUMNS + ['Policy', 'Severity', 'Finding'])
+    return pd.concat(findings, ignore_index=True)
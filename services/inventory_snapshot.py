@@ -0,0 +1,66 @@
+import time
+from datetime import datetime
+import pandas as pd
+from models.snapshot import load_latest_snapshot, update_snapshot
+from services.registry import getters_for, GLOBAL_SERVICES
+from utils.aws_session import create_region_sessions
+from utils.collector import collect_regional_resources
+from utils.cache import invalidate
+
+# 프로젝트 인벤토리 조회 (최신 스냅샷 기준, 스냅샷에 없거나 새로고침 요청된 서비스만 프로젝트의 전체 리전에서 수집)
+def load_project_inventory(project_info, service_names, refresh_services=()):
+    """반환값: {'frames': {서비스명: DataFrame}, 'statuses': {서비스명: 상태},
+    'collected_at': 가장 오래된 서비스 수집 시각, 'duration': 마지막 수집 소요 시간(초)}
+    """
+    project_id = project_info['id']
+    snapshot = load_latest_snapshot(project_id) or {'frames': {}, 'statuses': {}, 'duration': 0}
+    frames = dict(snapshot['frames'])
+    statuses = dict(snapshot['statuses'])
+    duration = snapshot['duration']
+
+    targets = [
+        name for name in service_names
+        if name not in frames or name in refresh_services
+    ]
+    if targets:
+        sessions = create_region_sessions(project_info)
+        if sessions:
+            for name in targets:
+                if name in refresh_services:
+                    invalidate(project_id, name)
+            started = time.monotonic()
+            # 리전 x 서비스 병렬 수집 (전역 서비스는 1회만)
+            collected, collected_statuses = collect_regional_resources(
+                sessions, getters_for(targets), GLOBAL_SERVICES
+            )
+            collected_duration = time.monotonic() - started
+            collected_at = datetime.now().isoformat(timespec='seconds')
+
+            # 수집한 서비스만 저장 시점의 최신 스냅샷에 병합 (그 사이 다른 수집이 저장한 서비스 유지)
+            def merge(latest):
+                latest = latest or {'frames': {}, 'statuses': {}}
+                merged_frames = dict(latest['frames'])
+                merged_statuses = dict(latest['statuses'])
+                for name in targets:
+                    status = {**collected_statuses[name], 'collected_at': collected_at}
+                    # 새로고침 실패 시 이전 스냅샷 데이터 유지
+                    if status['status'] == 'ok' or name not in merged_frames:
+                        merged_frames[name] = collected[name]
+                    else:
+                        status['collected_at'] = merged_statuses.get(name, {}).get('collected_at')
+                    merged_statuses[name] = status
+                return merged_frames, merged_statuses, collected_duration
+
+            # 저장 실패 시 이번 조회 결과만이라도 표시
+            frames, statuses, duration = update_snapshot(project_id, merge) or merge(snapshot)
+
+    collected_times = [
+        statuses[name]['collected_at'] for name in service_names
+        if name in statuses and statuses[name].get('collected_at')
+    ]
+    return {
+        'frames': {name: frames.get(name, pd.DataFrame()) for name in service_names},
+        'statuses': {name: statuses[name] for name in service_names if name in statuses},
+        'collected_at': datetime.fromisoformat(min(collected_times)) if collected_times else None,
+        'duration': duration
+    }
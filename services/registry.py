@@ -0,0 +1,85 @@
+from services.aws_ec2 import get_ec2_instances, get_ec2_reserved_instances, instance_index_from_frame
+from services.aws_database import get_rds_instances, get_rds_reserved_instances, get_elasticache_clusters
+from services.aws_storage import get_s3_buckets, get_efs_filesystems
+from services.aws_network import (
+    get_load_balancers, get_elb_listener_details, get_elb_targets, get_cloudfront_distributions, get_route53_records
+)
+from services.aws_security import get_waf_webacls, get_acm_certificates
+from services.aws_vpc import (
+    get_vpcs, get_subnets, get_internet_gateways, get_nat_gateways,
+    get_vpn_gateways, get_vpn_connections, get_transit_gateways,
+    get_vpc_peering_connections, get_customer_gateways
+)
+from utils.cache import cached_getter, peek_cached
+
+# 캐시된 EC2 목록이 있으면 인스턴스 인덱스로 재사용 (없으면 None, ELB 대상만 배치 조회)
+def _shared_instance_index(session):
+    ec2_frame = peek_cached(session.project_key, session.region_name, 'EC2')
+    return instance_index_from_frame(ec2_frame) if ec2_frame is not None else None
+
+# 리스너별 ELB 상세 조회
+def _get_elb_detail(session):
+    return get_elb_listener_details(session, _shared_instance_index(session))
+
+# ELB별 대상 인스턴스 조회 (구성도 연결선용)
+def _get_elb_target(session):
+    return get_elb_targets(session, _shared_instance_index(session))
+
+# 서비스명별 조회 함수
+SERVICE_GETTERS = {
+    'EC2': get_ec2_instances,
+    'RDS': get_rds_instances,
+    'S3': get_s3_buckets,
+    'ELB': get_load_balancers,
+    'ElastiCache': get_elasticache_clusters,
+    'EFS': get_efs_filesystems,
+    'CloudFront': get_cloudfront_distributions,
+    'AWS WAF': get_waf_webacls,
+    'ACM': get_acm_certificates,
+    'EC2 RI': get_ec2_reserved_instances,
+    'RDS RI': get_rds_reserved_instances,
+    'VPC': get_vpcs,
+    'Subnet': get_subnets,
+    'Internet Gateway': get_internet_gateways,
+    'NAT Gateway': get_nat_gateways,
+    'VPN Gateway': get_vpn_gateways,
+    'Site-to-Site VPN': get_vpn_connections,
+    'Transit Gateway': get_transit_gateways,
+    'VPC Peering': get_vpc_peering_connections,
+    'Customer Gateway': get_customer_gateways,
+    'ELB Detail': _get_elb_detail,
+    'ELB Target': _get_elb_target,
+    'Route53': get_route53_records
+}
+
+# 인벤토리 [EC2] 섹션 서비스
+INVENTORY_SERVICES = [
+    'EC2', 'RDS', 'S3', 'ELB', 'ElastiCache', 'EFS', 'CloudFront',
+    'AWS WAF', 'ACM', 'EC2 RI', 'RDS RI'
+]
+
+# 인벤토리 [VPC] 섹션 서비스
+VPC_SERVICES = [
+    'VPC', 'Subnet', 'Internet Gateway', 'NAT Gateway', 'VPN Gateway',
+    'Site-to-Site VPN', 'Transit Gateway', 'VPC Peering', 'Customer Gateway'
+]
+
+# 구성도 생성에 필요한 서비스
+DIAGRAM_SERVICES = [
+    'VPC', 'Subnet', 'Internet Gateway', 'NAT Gateway', 'VPN Gateway',
+    'Transit Gateway', 'VPC Peering', 'EC2', 'RDS', 'S3', 'ELB', 'ELB Target',
+    'ElastiCache', 'EFS', 'CloudFront', 'AWS WAF', 'ACM', 'EC2 RI', 'RDS RI'
+]
+
+# 워크로드 페이지 서비스
+WORKLOAD_SERVICES = ['ELB Detail', 'Route53']
+
+# 리전과 무관하게 프로젝트당 1회만 조회하는 전역 서비스
+GLOBAL_SERVICES = {'S3', 'CloudFront', 'Route53'}
+
+# 대시보드 서비스 현황 집계 대상
+DASHBOARD_SERVICES = ['EC2', 'RDS', 'S3', 'ELB']
+
+# 서비스명 목록에 해당하는 조회 함수 매핑 (TTL 캐시 적용)
+def getters_for(service_names):
+    return {name: cached_getter(name, SERVICE_GETTERS[name]) for name in service_names}
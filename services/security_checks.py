@@ -0,0 +1,214 @@
+import json
+import hashlib
+import pandas as pd
+from services.sg_rules import get_security_groups
+from services.iam_policies import get_iam_principals, get_iam_grants
+from services.aws_security_check import (
+    get_s3_public_status, get_credential_report, get_root_account_status, get_cloudtrail_status,
+    check_s3_public_access, check_sg_open_to_world, check_sg_rule_findings, check_iam_mfa,
+    check_iam_access_keys, check_iam_admin_access, check_iam_wildcard_actions, check_iam_inactive_principals,
+    check_root_account, check_cloudtrail_logging
+)
+from config.database import get_security_runs, get_run_findings
+from utils.cache import cached_call
+from utils.collector import map_concurrently
+from utils.errors import capture_errors
+
+# 점검 입력명 -> 조회 함수(session) (여러 점검이 공유하는 입력은 실행당 1회만 조회)
+SECURITY_INPUTS = {
+    's3_public_status': get_s3_public_status,
+    'security_groups': get_security_groups,
+    'credential_report': get_credential_report,
+    'iam_principals': get_iam_principals,
+    'iam_grants': get_iam_grants,
+    'root_account': get_root_account_status,
+    'cloudtrail_status': get_cloudtrail_status
+}
+
+# 실행 간 비교 대상 상태 (취약 항목과 점수 미집계 점검의 탐지 항목)
+FINDING_STATUSES = ('취약함', '탐지')
+
+# 점검 ID -> 점검 정의 (등록 순서대로 표시)
+SECURITY_CHECKS = {}
+
+# 보안점검 등록
+def register_check(check_id, title, severity, inputs, evaluator, empty_message, scored=True, resource_columns=None):
+    """inputs: 필요한 SECURITY_INPUTS 이름 목록
+    evaluator: {입력명: 값}을 받아 DataFrame을 반환하는 함수 (scored이면 '취약성여부' 컬럼 포함)
+    scored: 보안 점수 집계 포함 여부
+    resource_columns: 결과 행의 리소스 ID를 구성하는 컬럼 (기본값: 첫 번째 컬럼)
+    """
+    SECURITY_CHECKS[check_id] = {
+        'id': check_id,
+        'title': title,
+        'severity': severity,
+        'inputs': list(inputs),
+        'evaluator': evaluator,
+        'empty_message': empty_message,
+        'scored': scored,
+        'resource_columns': resource_columns
+    }
+
+register_check('s3_public_access', "S3 Public Access 점검", 'High',
+               ['s3_public_status'], check_s3_public_access, "S3 버킷이 없습니다.")
+register_check('sg_open_to_world', "Security Group Inbound 0.0.0.0/0, ::/0 점검", 'High',
+               ['security_groups'], check_sg_open_to_world, "Security Group이 없습니다.")
+register_check('sg_rule_findings', "Security Group 규칙별 정책 위반", 'Medium',
+               ['security_groups'], check_sg_rule_findings, "정책을 위반한 Security Group 규칙이 없습니다.", scored=False,
+               resource_columns=['Security Group ID', 'Protocol', 'Port Range', 'Source', 'Policy'])
+register_check('iam_mfa', "IAM 사용자 MFA 활성화 점검", 'High',
+               ['credential_report'], check_iam_mfa, "IAM 사용자가 없습니다.")
+register_check('iam_access_keys', "IAM 액세스키 교체 및 미사용 점검", 'Medium',
+               ['credential_report'], check_iam_access_keys, "활성 액세스키를 가진 IAM 사용자가 없습니다.",
+               scored=False)
+register_check('iam_admin_access', "IAM 관리자 권한 보유 점검", 'Critical',
+               ['iam_principals', 'iam_grants'], check_iam_admin_access, "IAM 사용자/그룹/역할이 없습니다.",
+               scored=False, resource_columns=['Type', 'Name'])
+register_check('iam_wildcard_actions', "IAM 전체 리소스 와일드카드 작업 허용", 'High',
+               ['iam_grants'], check_iam_wildcard_actions, "모든 리소스에 서비스 전체 작업을 허용하는 정책이 없습니다.",
+               scored=False, resource_columns=['Type', 'Name', 'Policy', 'Action'])
+register_check('iam_inactive_principals', "미사용 IAM 사용자/역할 점검", 'Medium',
+               ['iam_principals', 'credential_report'], check_iam_inactive_principals, "IAM 사용자/역할이 없습니다.",
+               scored=False, resource_columns=['Type', 'Name'])
+register_check('root_account', "Root 계정 사용 및 액세스키 점검", 'Critical',
+               ['root_account'], check_root_account, "Root 계정 정보를 확인할 수 없습니다.")
+register_check('cloudtrail_logging', "CloudTrail 로그 활성화 점검", 'Medium',
+               ['cloudtrail_status'], check_cloudtrail_logging, "CloudTrail 정보를 확인할 수 없습니다.")
+
+# 점검 입력 지문 (입력이 같으면 이전 평가 결과 재사용)
+def _fingerprint(inputs):
+    digest = hashlib.sha256()
+    for name in sorted(inputs):
+        value = inputs[name]
+        digest.update(name.encode('utf-8'))
+        if isinstance(value, pd.DataFrame):
+            digest.update(','.join(map(str, value.columns)).encode('utf-8'))
+            digest.update(pd.util.hash_pandas_object(value, index=False).values.tobytes())
+        else:
+            digest.update(json.dumps(value, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+# 입력 1개 조회 (값, 오류 메시지 목록)
+def _load_input(session, name):
+    with capture_errors() as errors:
+        try:
+            value = SECURITY_INPUTS[name](session)
+        except Exception as e:
+            value = None
+            errors.append(f"{name} 조회 오류: {e}")
+    return value, list(errors)
+
+# 점검 1개 평가 (입력 지문 기준 결과 캐시)
+def _evaluate_check(project_key, check, inputs):
+    return cached_call(
+        project_key, None, 'Security Check',
+        lambda: check['evaluator'](inputs),
+        key_args=(check['id'], _fingerprint(inputs))
+    )
+
+# 보안점검 실행 (공유 입력을 병렬 1회 조회 후 점검을 병렬 평가)
+def run_security_checks(session, check_ids=None):
+    """반환값: {점검 ID: {'check': 점검 정의, 'result': DataFrame, 'status': 'ok'|'error', 'message': str}}
+    (SECURITY_CHECKS 등록 순서 유지)
+    """
+    checks = [SECURITY_CHECKS[check_id] for check_id in (check_ids or SECURITY_CHECKS)]
+    input_names = {name for check in checks for name in check['inputs']}
+    loaded = map_concurrently(lambda name: _load_input(session, name), input_names)
+
+    results = {}
+    runnable = []
+    for check in checks:
+        errors = [message for name in check['inputs'] for message in loaded[name][1]]
+        if errors:
+            results[check['id']] = {
+                'check': check, 'result': pd.DataFrame(), 'status': 'error',
+                'message': f"{check['title']} 오류: {'; '.join(errors)}"
+            }
+        else:
+            runnable.append(check['id'])
+
+    evaluated = map_concurrently(
+        lambda check_id: _evaluate_check(
+            session.project_key, SECURITY_CHECKS[check_id],
+            {name: loaded[name][0] for name in SECURITY_CHECKS[check_id]['inputs']}
+        ),
+        runnable
+    )
+    for check_id, result in evaluated.items():
+        check = SECURITY_CHECKS[check_id]
+        if isinstance(result, Exception):
+            results[check_id] = {
+                'check': check, 'result': pd.DataFrame(), 'status': 'error',
+                'message': f"{check['title']} 오류: {result}"
+            }
+        else:
+            results[check_id] = {'check': check, 'result': result, 'status': 'ok', 'message': ''}
+
+    return {check['id']: results[check['id']] for check in checks}
+
+# 점수 집계 대상 점검의 취약/양호 항목 수와 보안 점수 (항목이 없으면 점수 None)
+def summarize_security_results(results):
+    total_vulnerable = 0
+    total_good = 0
+    for outcome in results.values():
+        df = outcome['result']
+        if outcome['check']['scored'] and not df.empty and '취약성여부' in df.columns:
+            total_vulnerable += int((df['취약성여부'] == '취약함').sum())
+            total_good += int((df['취약성여부'] == '양호함').sum())
+    total_items = total_vulnerable + total_good
+    score = round((total_good / total_items) * 100, 1) if total_items > 0 else None
+    return {'vulnerable': total_vulnerable, 'good': total_good, 'score': score}
+
+# 점검 결과를 이력 저장용 행으로 변환 [(점검 ID, 리소스 ID, 상태, 탐지 항목 키)]
+def security_result_rows(results):
+    """상태는 '취약성여부' 값, 점수 미집계 점검은 탐지 행('취약성여부'가 있으면 취약함 행)만 '탐지'로 저장
+    (보안점수 추이는 양호함/취약함 행으로 계산하므로 점수 미집계 점검이 추이에 섞이지 않도록)
+    """
+    rows = []
+    for check_id, outcome in results.items():
+        df = outcome['result']
+        if outcome['status'] != 'ok' or df.empty:
+            continue
+        if not outcome['check']['scored'] and '취약성여부' in df.columns:
+            df = df[df['취약성여부'] == '취약함'].drop(columns='취약성여부')
+            if df.empty:
+                continue
+        columns = outcome['check']['resource_columns'] or [df.columns[0]]
+        resource_ids = df[columns].astype(str).agg('|'.join, axis=1)
+        statuses = df['취약성여부'] if '취약성여부' in df.columns else pd.Series('탐지', index=df.index)
+        keys = [finding_key(check_id, resource_id) for resource_id in resource_ids]
+        rows.extend(zip([check_id] * len(df), resource_ids, statuses, keys))
+    return rows
+
+# 탐지 항목 키 (점검 ID + 리소스 ID의 64비트 해시, BIGINT 컬럼에 맞춰 부호 있는 정수)
+def finding_key(check_id, resource_id):
+    digest = hashlib.blake2b(f"{check_id}\0{resource_id}".encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+# 실행 1회의 탐지 항목 {탐지 항목 키: (점검 ID, 리소스 ID)}
+def load_run_findings(run_id):
+    # 키 컬럼 추가 이전에 저장된 행은 조회 시 키 계산
+    return {
+        key if key is not None else finding_key(check_id, resource_id): (check_id, resource_id)
+        for key, check_id, resource_id in get_run_findings(run_id, FINDING_STATUSES)
+    }
+
+# 두 실행 간 탐지 항목 비교 (키 집합 연산)
+def diff_findings(base_findings, target_findings):
+    """반환값: {'new': 신규 탐지, 'resolved': 해소, 'unchanged': 유지} 각각 [(점검 ID, 리소스 ID)]"""
+    base_keys = base_findings.keys()
+    target_keys = target_findings.keys()
+    return {
+        'new': sorted(target_findings[key] for key in target_keys - base_keys),
+        'resolved': sorted(base_findings[key] for key in base_keys - target_keys),
+        'unchanged': sorted(target_findings[key] for key in target_keys & base_keys)
+    }
+
+# 프로젝트의 두 실행 비교 (base_run_id가 없으면 target 직전 실행과 비교, 이전 실행이 없으면 None)
+def diff_security_runs(project_name, target_run_id, base_run_id=None):
+    if base_run_id is None:
+        run_ids = [run['run_id'] for run in get_security_runs(project_name)]
+        if target_run_id not in run_ids or run_ids.index(target_run_id) + 1 >= len(run_ids):
+            return None
+        base_run_id = run_ids[run_ids.index(target_run_id) + 1]
+    return diff_findings(load_run_findings(base_run_id), load_run_findings(target_run_id))
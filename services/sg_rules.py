@@ -0,0 +1,119 @@
+import pandas as pd
+from utils.pagination import iter_pages
+
+# 전체 허용 CIDR
+WORLD_CIDRS = ('0.0.0.0/0', '::/0')
+# 관리 포트 (SSH, RDP)
+ADMIN_PORTS = (22, 3389)
+# 허용 포트 범위 상한 (이보다 넓으면 탐지)
+MAX_PORT_RANGE = 1000
+# 이보다 짧은 프리픽스(넓은 대역)는 탐지 (IPv4 /8, IPv6 /32)
+MIN_PREFIX_LENGTH = {'ipv4': 8, 'ipv6': 32}
+
+# 프로토콜 번호 -> 이름
+_PROTOCOL_NAMES = {'-1': 'all', '6': 'tcp', '17': 'udp', '1': 'icmp', '58': 'icmpv6'}
+
+# 규칙 테이블 컬럼
+RULE_COLUMNS = [
+    'GroupId', 'GroupName', 'VpcId', 'Protocol', 'FromPort', 'ToPort',
+    'SourceType', 'Source', 'PrefixLength', 'Description'
+]
+
+# Security Group 전체 조회
+def get_security_groups(session):
+    ec2 = session.client('ec2')
+    return [sg for page in iter_pages(ec2, 'describe_security_groups') for sg in page['SecurityGroups']]
+
+# Inbound 규칙(IpPermissions)을 규칙 1건당 1행인 컬럼형 테이블로 변환
+def flatten_sg_rules(security_groups):
+    """SourceType: ipv4 | ipv6 | prefix_list | security_group
+    PrefixLength: CIDR 프리픽스 길이 (CIDR가 아니면 -1)
+    all 프로토콜은 0-65535, 포트가 없는 규칙(ICMP 등)은 -1
+    """
+    columns = {column: [] for column in RULE_COLUMNS}
+
+    def append(sg, protocol, from_port, to_port, source_type, source, prefix_length, description):
+        columns['GroupId'].append(sg['GroupId'])
+        columns['GroupName'].append(sg.get('GroupName', 'N/A'))
+        columns['VpcId'].append(sg.get('VpcId', 'N/A'))
+        columns['Protocol'].append(protocol)
+        columns['FromPort'].append(from_port)
+        columns['ToPort'].append(to_port)
+        columns['SourceType'].append(source_type)
+        columns['Source'].append(source)
+        columns['PrefixLength'].append(prefix_length)
+        columns['Description'].append(description or '')
+
+    for sg in security_groups:
+        for permission in sg.get('IpPermissions', []):
+            protocol = _PROTOCOL_NAMES.get(permission['IpProtocol'], permission['IpProtocol'])
+            if protocol == 'all':
+                from_port, to_port = 0, 65535
+            else:
+                from_port, to_port = permission.get('FromPort', -1), permission.get('ToPort', -1)
+
+            for ip_range in permission.get('IpRanges', []):
+                cidr = ip_range['CidrIp']
+                append(sg, protocol, from_port, to_port, 'ipv4', cidr,
+                       int(cidr.split('/')[1]), ip_range.get('Description'))
+            for ip_range in permission.get('Ipv6Ranges', []):
+                cidr = ip_range['CidrIpv6']
+                append(sg, protocol, from_port, to_port, 'ipv6', cidr,
+                       int(cidr.split('/')[1]), ip_range.get('Description'))
+            for prefix_list in permission.get('PrefixListIds', []):
+                append(sg, protocol, from_port, to_port, 'prefix_list',
+                       prefix_list['PrefixListId'], -1, prefix_list.get('Description'))
+            for pair in permission.get('UserIdGroupPairs', []):
+                append(sg, protocol, from_port, to_port, 'security_group',
+                       pair.get('GroupId', pair.get('GroupName', 'N/A')), -1, pair.get('Description'))
+
+    rules = pd.DataFrame(columns)
+    return rules.astype({'FromPort': 'int32', 'ToPort': 'int32', 'PrefixLength': 'int16'})
+
+# 정책 조건 (규칙 테이블 -> bool Series)
+def _is_world(rules):
+    return rules['Source'].isin(WORLD_CIDRS)
+
+def _has_ports(rules):
+    return rules['Protocol'].isin(['all', 'tcp', 'udp'])
+
+def _covers_port(rules, port):
+    return _has_ports(rules) & (rules['FromPort'] <= port) & (rules['ToPort'] >= port)
+
+def _world_open(rules):
+    return _is_world(rules)
+
+def _world_open_admin_ports(rules):
+    covers = _covers_port(rules, ADMIN_PORTS[0])
+    for port in ADMIN_PORTS[1:]:
+        covers |= _covers_port(rules, port)
+    return _is_world(rules) & covers
+
+def _wide_port_range(rules):
+    return _has_ports(rules) & (rules['ToPort'] - rules['FromPort'] + 1 > MAX_PORT_RANGE)
+
+def _broad_cidr(rules):
+    return (
+        ((rules['SourceType'] == 'ipv4') & (rules['PrefixLength'] < MIN_PREFIX_LENGTH['ipv4']))
+        | ((rules['SourceType'] == 'ipv6') & (rules['PrefixLength'] < MIN_PREFIX_LENGTH['ipv6']))
+    )
+
+# 정책명 -> (심각도, 설명, 조건 함수)
+SG_POLICIES = {
+    'world-open': ('Medium', '0.0.0.0/0 또는 ::/0 허용', _world_open),
+    'world-open-admin-port': ('High', f"전체 허용 규칙에 관리 포트 {'/'.join(map(str, ADMIN_PORTS))} 포함", _world_open_admin_ports),
+    'wide-port-range': ('Low', f"허용 포트 범위가 {MAX_PORT_RANGE}개 초과", _wide_port_range),
+    'broad-cidr': ('Medium', f"IPv4 /{MIN_PREFIX_LENGTH['ipv4']}, IPv6 /{MIN_PREFIX_LENGTH['ipv6']}보다 넓은 대역 허용", _broad_cidr)
+}
+
+# 규칙 테이블에 정책을 일괄 적용하여 규칙별 탐지 결과 반환 (규칙 x 위반 정책 1건당 1행)
+def evaluate_sg_rules(rules, policies=None):
+    policies = policies or SG_POLICIES
+    findings = []
+    for name, (severity, description, predicate) in policies.items():
+        matched = rules[predicate(rules)]
+        if not matched.empty:
+            findings.append(matched.assign(Policy=name, Severity=severity, Finding=description))
+    if not findings:
+        return pd.DataFrame(columns=RULE_COLUMNS + ['Policy', 'Severity', 'Finding'])
+    return pd.concat(findings, ignore_index=True)
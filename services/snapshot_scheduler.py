@@ -0,0 +1,159 @@
+import os
+import time
+import random
+import logging
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from models.project import get_projects_for_collection
+from models.snapshot import load_snapshot_statuses
+from services.registry import SERVICE_GETTERS
+from services.inventory_snapshot import load_project_inventory
+from utils.errors import capture_errors
+
+logger = logging.getLogger(__name__)
+
+# 서비스별 스냅샷 갱신 주기 (초), 지정되지 않은 서비스는 DEFAULT_REFRESH_INTERVAL 적용
+DEFAULT_REFRESH_INTERVAL = 900
+REFRESH_INTERVALS = {
+    'EC2': 300,
+    'ELB': 600,
+    'ELB Detail': 600,
+    'ELB Target': 600,
+    'RDS': 600,
+    'ElastiCache': 1800,
+    'EFS': 1800,
+    'S3': 1800,
+    'CloudFront': 3600,
+    'Route53': 3600,
+    'AWS WAF': 3600,
+    'ACM': 3600,
+    'EC2 RI': 3600,
+    'RDS RI': 3600,
+    'VPC': 3600,
+    'Subnet': 3600,
+    'Internet Gateway': 3600,
+    'NAT Gateway': 3600,
+    'VPN Gateway': 3600,
+    'Site-to-Site VPN': 1800,
+    'Transit Gateway': 3600,
+    'VPC Peering': 3600,
+    'Customer Gateway': 3600
+}
+
+# 갱신 시각 분산 비율 (주기의 ±10%)
+REFRESH_JITTER = 0.1
+# 스케줄 확인 간격 (초)
+SCHEDULER_TICK = 30
+# 동시에 수집하는 프로젝트 수 상한
+SCHEDULER_MAX_CONCURRENCY = int(os.getenv('SCHEDULER_MAX_CONCURRENCY', '3'))
+
+# (프로젝트 ID, 서비스명) -> 다음 갱신 시각 (epoch 초)
+_next_due = {}
+_running_projects = set()
+_state_lock = threading.Lock()
+_scheduler_thread = None
+_stop_event = threading.Event()
+
+# 환경변수 SNAPSHOT_INTERVALS="EC2=300,VPC=3600" 으로 주기 변경
+for item in os.getenv('SNAPSHOT_INTERVALS', '').split(','):
+    if '=' in item:
+        service, seconds = item.split('=', 1)
+        REFRESH_INTERVALS[service.strip()] = int(seconds)
+
+# 서비스 갱신 주기 조회/변경
+def get_refresh_interval(service):
+    return REFRESH_INTERVALS.get(service, DEFAULT_REFRESH_INTERVAL)
+
+def set_refresh_interval(service, seconds):
+    REFRESH_INTERVALS[service] = seconds
+
+# 마지막 수집 시각 기준 다음 갱신 시각 계산 (지터 적용)
+def _schedule_next(service, collected_at):
+    interval = get_refresh_interval(service)
+    return collected_at + interval + random.uniform(-REFRESH_JITTER, REFRESH_JITTER) * interval
+
+# 스냅샷 상태로부터 서비스의 다음 갱신 시각 계산 (수집 이력이 없으면 즉시)
+def _initial_due(service, status):
+    if not status or not status.get('collected_at'):
+        return 0
+    return _schedule_next(service, datetime.fromisoformat(status['collected_at']).timestamp())
+
+# 프로젝트 1개의 기한이 지난 서비스 스냅샷 갱신
+def _refresh_project(project, service_names):
+    started = time.monotonic()
+    # 백그라운드 스레드에서 보고된 오류는 화면이 아닌 로그로 기록
+    with capture_errors() as errors:
+        try:
+            load_project_inventory(project, service_names, service_names)
+            logger.info("%s: %d개 서비스 갱신 (%.1f초)", project['project_name'], len(service_names), time.monotonic() - started)
+        except Exception:
+            logger.exception("%s: 스냅샷 갱신 오류", project['project_name'])
+        finally:
+            # 실패해도 다음 주기까지 재시도하지 않음
+            now = time.time()
+            with _state_lock:
+                for name in service_names:
+                    _next_due[(project['id'], name)] = _schedule_next(name, now)
+                _running_projects.discard(project['id'])
+    for message in errors:
+        logger.warning("%s: %s", project['project_name'], message)
+
+# 전체 프로젝트를 확인하여 갱신 기한이 지난 서비스를 실행기에 제출
+def run_scheduler_cycle(executor):
+    now = time.time()
+    projects = get_projects_for_collection()
+    project_ids = {project['id'] for project in projects}
+
+    for project in projects:
+        with _state_lock:
+            if project['id'] in _running_projects:
+                continue
+            unknown = [name for name in SERVICE_GETTERS if (project['id'], name) not in _next_due]
+        if unknown:
+            statuses = load_snapshot_statuses(project['id'])
+            with _state_lock:
+                for name in unknown:
+                    _next_due[(project['id'], name)] = _initial_due(name, statuses.get(name))
+
+        with _state_lock:
+            due = [name for name in SERVICE_GETTERS if _next_due[(project['id'], name)] <= now]
+            if due:
+                _running_projects.add(project['id'])
+        if due:
+            executor.submit(_refresh_project, project, due)
+
+    # 삭제된 프로젝트의 스케줄 정리
+    with _state_lock:
+        for key in [key for key in _next_due if key[0] not in project_ids]:
+            del _next_due[key]
+
+# 스케줄러 루프 (stop_event가 설정될 때까지 반복)
+def run_scheduler(stop_event=None):
+    stop_event = stop_event or _stop_event
+    with ThreadPoolExecutor(max_workers=SCHEDULER_MAX_CONCURRENCY) as executor:
+        while not stop_event.is_set():
+            # 프로젝트 목록/스냅샷 상태 조회 오류도 로그로 기록
+            with capture_errors() as errors:
+                try:
+                    run_scheduler_cycle(executor)
+                except Exception:
+                    logger.exception("스케줄러 오류")
+            for message in errors:
+                logger.warning("스케줄러: %s", message)
+            stop_event.wait(SCHEDULER_TICK)
+
+# 프로세스 내 백그라운드 스케줄러 시작 (프로세스당 1회)
+def start_scheduler():
+    global _scheduler_thread
+    with _state_lock:
+        if _scheduler_thread is not None and _scheduler_thread.is_alive():
+            return False
+        _stop_event.clear()
+        _scheduler_thread = threading.Thread(target=run_scheduler, name="snapshot-scheduler", daemon=True)
+        _scheduler_thread.start()
+        return True
+
+# 백그라운드 스케줄러 중지
+def stop_scheduler():
+    _stop_event.set()
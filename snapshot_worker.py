@@ -0,0 +1,16 @@
+import logging
+from config.database import ensure_schema
+from services.snapshot_scheduler import run_scheduler, SCHEDULER_MAX_CONCURRENCY
+
+logger = logging.getLogger("snapshot_worker")
+
+# 스냅샷 사전 수집 워커 (Streamlit과 별도 프로세스로 실행: python snapshot_worker.py)
+# 이 경우 앱은 SNAPSHOT_SCHEDULER=worker 로 실행하여 프로세스 내 스케줄러를 끈다
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(name)s] %(levelname)s %(message)s")
+    logger.info("Starting snapshot worker (동시 수집 프로젝트 최대 %d개)...", SCHEDULER_MAX_CONCURRENCY)
+    ensure_schema()
+    try:
+        run_scheduler()
+    except KeyboardInterrupt:
+        logger.info("Snapshot worker stopped.")
@@ -0,0 +1,104 @@
+# TTL 캐시 테스트 (python -m unittest test_cache)
+
+import unittest
+from unittest import mock
+from utils import cache
+from utils.cache import cached_call, peek_cached, invalidate
+from utils.errors import capture_errors, report_error
+
+
+class CachedCallTest(unittest.TestCase):
+    def setUp(self):
+        cache._cache.clear()
+        # 만료 시각 계산용 가짜 시계
+        patcher = mock.patch.object(cache, 'time')
+        self.clock = patcher.start()
+        self.clock.monotonic.return_value = 1000.0
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cache._cache.clear)
+
+    def loader(self, value='value'):
+        calls = []
+
+        def load():
+            calls.append(1)
+            return value
+        return load, calls
+
+    # TTL 안에서는 loader를 다시 호출하지 않음
+    def test_hit_within_ttl(self):
+        load, calls = self.loader()
+        self.assertEqual(cached_call(1, 'ap-northeast-2', 'EC2', load), 'value')
+        self.clock.monotonic.return_value += cache.get_service_ttl('EC2') - 1
+        self.assertEqual(cached_call(1, 'ap-northeast-2', 'EC2', load), 'value')
+        self.assertEqual(len(calls), 1)
+
+    # TTL이 지나면 다시 조회
+    def test_reload_after_ttl(self):
+        load, calls = self.loader()
+        cached_call(1, 'ap-northeast-2', 'EC2', load)
+        self.clock.monotonic.return_value += cache.get_service_ttl('EC2') + 1
+        cached_call(1, 'ap-northeast-2', 'EC2', load)
+        self.assertEqual(len(calls), 2)
+
+    # 인자별로 별도 캐시
+    def test_key_args_are_part_of_key(self):
+        load, calls = self.loader()
+        cached_call(1, None, 'S3', load, key_args=('a',))
+        cached_call(1, None, 'S3', load, key_args=('b',))
+        self.assertEqual(len(calls), 2)
+
+    # 오류가 보고된 결과는 캐시하지 않고 호출자에게 오류 전달
+    def test_error_result_is_not_cached(self):
+        calls = []
+
+        def load():
+            calls.append(1)
+            report_error("조회 오류")
+            return 'partial'
+
+        with capture_errors() as errors:
+            self.assertEqual(cached_call(1, None, 'RDS', load), 'partial')
+            cached_call(1, None, 'RDS', load)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(errors, ["조회 오류", "조회 오류"])
+        self.assertIsNone(peek_cached(1, None, 'RDS'))
+
+    # 예외는 캐시하지 않고 그대로 전달
+    def test_exception_is_not_cached(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            cached_call(1, None, 'VPC', fail)
+        load, calls = self.loader()
+        self.assertEqual(cached_call(1, None, 'VPC', load), 'value')
+        self.assertEqual(len(calls), 1)
+
+    # 결과값에 따라 TTL 결정
+    def test_callable_ttl(self):
+        load, calls = self.loader(value=30)
+        cached_call(1, None, 'Report', load, ttl=lambda value: value)
+        self.clock.monotonic.return_value += 29
+        self.assertEqual(peek_cached(1, None, 'Report'), 30)
+        self.clock.monotonic.return_value += 2
+        self.assertIsNone(peek_cached(1, None, 'Report'))
+
+    # 프로젝트/서비스 단위 무효화
+    def test_invalidate(self):
+        load, calls = self.loader()
+        cached_call(1, None, 'EC2', load)
+        cached_call(1, None, 'RDS', load)
+        cached_call(2, None, 'EC2', load)
+
+        invalidate(1, 'EC2')
+        self.assertIsNone(peek_cached(1, None, 'EC2'))
+        self.assertEqual(peek_cached(1, None, 'RDS'), 'value')
+
+        invalidate(1)
+        self.assertIsNone(peek_cached(1, None, 'RDS'))
+        self.assertEqual(peek_cached(2, None, 'EC2'), 'value')
+
+
+if __name__ == "__main__":
+    unittest.main()
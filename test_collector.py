@@ -0,0 +1,131 @@
+# 병렬 수집기 상태/시간 초과 테스트 (python -m unittest test_collector)
+
+import time
+import threading
+import unittest
+import pandas as pd
+from utils.collector import (
+    collect_resources, collect_regional_resources, map_concurrently,
+    raise_if_cancelled, CollectionCancelled
+)
+from utils.errors import report_error
+
+
+class CollectResourcesTest(unittest.TestCase):
+    # 정상/오류 보고/예외 getter의 상태 구분
+    def test_statuses(self):
+        def ok(session):
+            return pd.DataFrame({'Id': [session]})
+
+        def reported(session):
+            report_error("권한 없음")
+            return pd.DataFrame({'Id': ['partial']})
+
+        def raising(session):
+            raise RuntimeError("boom")
+
+        frames, statuses = collect_resources('s', {'OK': ok, 'Reported': reported, 'Raising': raising})
+
+        self.assertEqual(list(frames), ['OK', 'Reported', 'Raising'])
+        self.assertEqual(statuses['OK']['status'], 'ok')
+        self.assertEqual(frames['OK']['Id'].tolist(), ['s'])
+        self.assertEqual(statuses['Reported']['status'], 'error')
+        self.assertEqual(statuses['Reported']['message'], "권한 없음")
+        # 오류가 보고되어도 받은 결과는 유지
+        self.assertEqual(frames['Reported']['Id'].tolist(), ['partial'])
+        self.assertEqual(statuses['Raising']['status'], 'error')
+        self.assertIn("Raising 조회 오류: boom", statuses['Raising']['message'])
+        self.assertTrue(frames['Raising'].empty)
+
+    # 제한 시간을 넘긴 getter는 기다리지 않고 취소
+    def test_timeout_cancels_getter(self):
+        stopped = threading.Event()
+
+        def slow(session):
+            try:
+                while True:
+                    raise_if_cancelled()
+                    time.sleep(0.05)
+            except CollectionCancelled:
+                stopped.set()
+                raise
+
+        def fast(session):
+            return pd.DataFrame({'Id': [1]})
+
+        started = time.monotonic()
+        frames, statuses = collect_resources(None, {'Slow': slow, 'Fast': fast}, timeout=0.2)
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(statuses['Slow']['status'], 'timeout')
+        self.assertIn("시간 초과", statuses['Slow']['message'])
+        self.assertTrue(frames['Slow'].empty)
+        self.assertEqual(statuses['Fast']['status'], 'ok')
+        # 취소 이벤트로 워커 스레드도 종료
+        self.assertTrue(stopped.wait(5))
+
+    # 취소 이벤트 밖에서는 raise_if_cancelled가 아무 일도 하지 않음
+    def test_raise_if_cancelled_outside_collector(self):
+        raise_if_cancelled()
+
+
+class CollectRegionalResourcesTest(unittest.TestCase):
+    def getter(self, session):
+        return pd.DataFrame({'Id': [session]})
+
+    # 여러 리전이면 Region 컬럼을 마지막에 추가, 글로벌 서비스는 1회만 조회
+    def test_multi_region(self):
+        calls = []
+
+        def global_getter(session):
+            calls.append(session)
+            return pd.DataFrame({'Id': ['bucket']})
+
+        sessions = {'ap-northeast-2': 'seoul', 'us-east-1': 'virginia'}
+        frames, statuses = collect_regional_resources(
+            sessions, {'EC2': self.getter, 'S3': global_getter}, global_services={'S3'}
+        )
+
+        self.assertEqual(list(frames['EC2'].columns), ['Id', 'Region'])
+        self.assertEqual(sorted(frames['EC2']['Region']), ['ap-northeast-2', 'us-east-1'])
+        self.assertEqual(calls, ['seoul'])
+        self.assertEqual(frames['S3']['Region'].tolist(), ['global'])
+        self.assertEqual(statuses['EC2']['status'], 'ok')
+
+    # 단일 리전이면 컬럼을 바꾸지 않음
+    def test_single_region_keeps_columns(self):
+        frames, statuses = collect_regional_resources({'ap-northeast-2': 'seoul'}, {'EC2': self.getter})
+        self.assertEqual(list(frames['EC2'].columns), ['Id'])
+
+    # 실패한 리전은 메시지에 리전 표시
+    def test_region_error_message(self):
+        def failing(session):
+            if session == 'virginia':
+                report_error("권한 없음")
+            return pd.DataFrame({'Id': [session]})
+
+        sessions = {'ap-northeast-2': 'seoul', 'us-east-1': 'virginia'}
+        frames, statuses = collect_regional_resources(sessions, {'EC2': failing})
+        self.assertEqual(statuses['EC2']['status'], 'error')
+        self.assertEqual(statuses['EC2']['message'], "[us-east-1] 권한 없음")
+
+
+class MapConcurrentlyTest(unittest.TestCase):
+    # 실패한 항목은 예외 객체를 값으로 반환
+    def test_failed_items(self):
+        def fn(item):
+            if item == 'bad':
+                raise ValueError(item)
+            return item.upper()
+
+        results = map_concurrently(fn, ['a', 'bad', 'b'])
+        self.assertEqual(results['a'], 'A')
+        self.assertEqual(results['b'], 'B')
+        self.assertIsInstance(results['bad'], ValueError)
+
+    def test_empty(self):
+        self.assertEqual(map_concurrently(str, []), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# IAM 권한 테이블/정책 테스트 (python -m unittest test_iam_policies)
+
+import json
+import unittest
+from urllib.parse import quote
+from services.iam_policies import build_grants, evaluate_iam_grants, IAM_POLICIES, GRANT_COLUMNS
+
+ADMIN_ARN = 'arn:aws:iam::aws:policy/AdministratorAccess'
+
+
+def document(*statements):
+    return {'Version': '2012-10-17', 'Statement': list(statements)}
+
+
+DETAILS = {
+    'Policies': [{
+        'PolicyName': 'AdministratorAccess', 'Arn': ADMIN_ARN,
+        'PolicyVersionList': [
+            {'IsDefaultVersion': False, 'Document': document({'Effect': 'Allow', 'Action': 's3:GetObject', 'Resource': '*'})},
+            {'IsDefaultVersion': True, 'Document': document({'Effect': 'Allow', 'Action': '*', 'Resource': '*'})}
+        ]
+    }],
+    'GroupDetailList': [
+        {'GroupName': 'Admins', 'Arn': 'arn:aws:iam::1:group/Admins',
+         'AttachedManagedPolicies': [{'PolicyName': 'AdministratorAccess', 'PolicyArn': ADMIN_ARN}]},
+        # boto3가 디코딩하지 않은 URL 인코딩 문서
+        {'GroupName': 'OfficeOnly', 'Arn': 'arn:aws:iam::1:group/OfficeOnly',
+         'GroupPolicyList': [{'PolicyName': 'office', 'PolicyDocument': quote(json.dumps(document({
+             'Effect': 'Allow', 'Action': '*:*', 'Resource': '*',
+             'Condition': {'IpAddress': {'aws:SourceIp': '203.0.113.0/24'}}
+         })))}]}
+    ],
+    'UserDetailList': [
+        {'UserName': 'alice', 'Arn': 'arn:aws:iam::1:user/alice', 'GroupList': ['Admins']},
+        {'UserName': 'bob', 'Arn': 'arn:aws:iam::1:user/bob', 'GroupList': ['OfficeOnly']},
+        {'UserName': 'carol', 'Arn': 'arn:aws:iam::1:user/carol',
+         'UserPolicyList': [{'PolicyName': 's3-full', 'PolicyDocument': document(
+             {'Effect': 'Allow', 'Action': ['S3:*', 'ec2:*'], 'Resource': ['*', 'arn:aws:s3:::bucket']},
+             {'Effect': 'Deny', 'Action': '*', 'Resource': '*'}
+         )}]}
+    ],
+    'RoleDetailList': [
+        {'RoleName': 'deployer', 'Arn': 'arn:aws:iam::1:role/deployer',
+         'RolePolicyList': [{'PolicyName': 'not-iam', 'PolicyDocument': document(
+             {'Effect': 'Allow', 'NotAction': 'iam:*', 'Resource': '*'}
+         )}]},
+        {'RoleName': 'scoped', 'Arn': 'arn:aws:iam::1:role/scoped',
+         'RolePolicyList': [{'PolicyName': 'bucket-admin', 'PolicyDocument': document(
+             {'Effect': 'Allow', 'Action': '*', 'Resource': 'arn:aws:s3:::bucket'}
+         )}]}
+    ]
+}
+
+
+def names(findings, policy):
+    return sorted(set(findings[findings['Policy'] == policy]['Name']))
+
+
+class BuildGrantsTest(unittest.TestCase):
+    def setUp(self):
+        self.grants = build_grants(DETAILS)
+
+    # 사용자는 소속 그룹의 정책을 상속
+    def test_group_inheritance(self):
+        alice = self.grants[self.grants['Name'] == 'alice']
+        self.assertEqual(alice['Source'].tolist(), ['group:Admins'])
+        self.assertEqual(alice['PolicyName'].tolist(), ['AdministratorAccess'])
+        # 관리형 정책은 기본 버전 문서만 사용
+        self.assertEqual(alice['Action'].tolist(), ['*'])
+
+    # Action x Resource 1건당 1행, Allow 문장만, 작업은 소문자
+    def test_allow_rows(self):
+        carol = self.grants[self.grants['Name'] == 'carol']
+        self.assertEqual(list(carol.columns), GRANT_COLUMNS)
+        self.assertEqual(len(carol), 4)
+        self.assertEqual(sorted(set(carol['Action'])), ['ec2:*', 's3:*'])
+        self.assertEqual(set(carol['Source']), {'inline'})
+
+    # URL 인코딩 문서의 Condition
+    def test_condition(self):
+        bob = self.grants[self.grants['Name'] == 'bob']
+        self.assertEqual(bob['Source'].tolist(), ['group:OfficeOnly'])
+        self.assertTrue(bob['HasCondition'].all())
+
+    def test_not_action(self):
+        deployer = self.grants[self.grants['Name'] == 'deployer']
+        self.assertEqual(deployer['Action'].tolist(), ['iam:*'])
+        self.assertTrue(deployer['NotAction'].all())
+
+
+class IamPoliciesTest(unittest.TestCase):
+    def setUp(self):
+        self.findings = evaluate_iam_grants(build_grants(DETAILS))
+
+    # 관리자 권한: 그룹과 상속한 사용자 모두 탐지, Condition이 있거나 리소스가 한정되면 제외
+    def test_admin_equivalent(self):
+        self.assertEqual(names(self.findings, 'admin-equivalent'), ['Admins', 'alice'])
+        admin = self.findings[self.findings['Policy'] == 'admin-equivalent']
+        self.assertEqual(set(admin['Severity']), {IAM_POLICIES['admin-equivalent'][0]})
+
+    # 서비스 전체 작업과 NotAction (모든 리소스 대상만)
+    def test_service_wildcard(self):
+        self.assertEqual(names(self.findings, 'service-wildcard'), ['carol', 'deployer'])
+        carol = self.findings[(self.findings['Policy'] == 'service-wildcard') & (self.findings['Name'] == 'carol')]
+        self.assertEqual(set(carol['Resource']), {'*'})
+
+    # '*:*'는 관리자 권한으로만 판단 (Condition이 있으면 둘 다 아님)
+    def test_conditional_admin_is_not_flagged(self):
+        self.assertNotIn('bob', set(self.findings['Name']))
+        self.assertNotIn('OfficeOnly', set(self.findings['Name']))
+        self.assertNotIn('scoped', set(self.findings['Name']))
+
+    def test_empty(self):
+        findings = evaluate_iam_grants(build_grants({
+            'UserDetailList': [], 'GroupDetailList': [], 'RoleDetailList': [], 'Policies': []
+        }))
+        self.assertTrue(findings.empty)
+        self.assertEqual(list(findings.columns), GRANT_COLUMNS + ['Policy', 'Severity', 'Finding'])
+
+
+if __name__ == "__main__":
+    unittest.main()
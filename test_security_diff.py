@@ -0,0 +1,45 @@
+# 보안 점검 실행 비교 테스트 (python -m unittest test_security_diff)
+
+import unittest
+from services.security_checks import finding_key, diff_findings
+
+
+def findings(*items):
+    return {finding_key(check_id, resource_id): (check_id, resource_id) for check_id, resource_id in items}
+
+
+class FindingKeyTest(unittest.TestCase):
+    # 같은 입력은 항상 같은 키, BIGINT 범위의 부호 있는 정수
+    def test_deterministic_signed_bigint(self):
+        key = finding_key('sg_open', 'sg-1')
+        self.assertEqual(key, finding_key('sg_open', 'sg-1'))
+        self.assertTrue(-2 ** 63 <= key < 2 ** 63)
+
+    # 점검 ID와 리소스 ID 경계가 섞이지 않음
+    def test_separator(self):
+        self.assertNotEqual(finding_key('a', 'bc'), finding_key('ab', 'c'))
+        self.assertNotEqual(finding_key('sg_open', 'sg-1'), finding_key('sg_open', 'sg-2'))
+
+
+class DiffFindingsTest(unittest.TestCase):
+    def test_new_resolved_unchanged(self):
+        base = findings(('sg_open', 'sg-1'), ('sg_open', 'sg-2'), ('iam_keys', 'alice'))
+        target = findings(('sg_open', 'sg-2'), ('iam_keys', 'alice'), ('iam_keys', 'bob'), ('s3_public', 'bucket'))
+
+        diff = diff_findings(base, target)
+        self.assertEqual(diff['new'], [('iam_keys', 'bob'), ('s3_public', 'bucket')])
+        self.assertEqual(diff['resolved'], [('sg_open', 'sg-1')])
+        self.assertEqual(diff['unchanged'], [('iam_keys', 'alice'), ('sg_open', 'sg-2')])
+
+    # 첫 실행과 비교하면 모두 신규
+    def test_empty_base(self):
+        target = findings(('sg_open', 'sg-1'))
+        self.assertEqual(diff_findings({}, target), {'new': [('sg_open', 'sg-1')], 'resolved': [], 'unchanged': []})
+
+    def test_identical(self):
+        run = findings(('sg_open', 'sg-1'))
+        self.assertEqual(diff_findings(run, dict(run)), {'new': [], 'resolved': [], 'unchanged': [('sg_open', 'sg-1')]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# Security Group 규칙 테이블/정책 테스트 (python -m unittest test_sg_rules)
+
+import unittest
+from services.sg_rules import flatten_sg_rules, evaluate_sg_rules, SG_POLICIES, RULE_COLUMNS
+
+SECURITY_GROUPS = [
+    {
+        'GroupId': 'sg-1', 'GroupName': 'web', 'VpcId': 'vpc-1',
+        'IpPermissions': [
+            {'IpProtocol': 'tcp', 'FromPort': 443, 'ToPort': 443,
+             'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'https'}]},
+            {'IpProtocol': 'tcp', 'FromPort': 22, 'ToPort': 22,
+             'Ipv6Ranges': [{'CidrIpv6': '::/0'}]},
+            {'IpProtocol': 'tcp', 'FromPort': 3389, 'ToPort': 3389,
+             'PrefixListIds': [{'PrefixListId': 'pl-1'}]},
+            {'IpProtocol': '-1',
+             'UserIdGroupPairs': [{'GroupId': 'sg-2'}]},
+            {'IpProtocol': 'icmp', 'FromPort': -1, 'ToPort': -1,
+             'IpRanges': [{'CidrIp': '0.0.0.0/0'}]},
+            {'IpProtocol': 'udp', 'FromPort': 1000, 'ToPort': 3000,
+             'IpRanges': [{'CidrIp': '32.0.0.0/4'}],
+             'Ipv6Ranges': [{'CidrIpv6': '2001::/16'}]}
+        ]
+    }
+]
+
+
+def rule(rules, source):
+    return rules[rules['Source'] == source].iloc[0]
+
+
+def matched_sources(rules, policy):
+    predicate = SG_POLICIES[policy][2]
+    return sorted(rules[predicate(rules)]['Source'])
+
+
+class FlattenSgRulesTest(unittest.TestCase):
+    def setUp(self):
+        self.rules = flatten_sg_rules(SECURITY_GROUPS)
+
+    # 출발지 1건당 1행
+    def test_one_row_per_source(self):
+        self.assertEqual(list(self.rules.columns), RULE_COLUMNS)
+        self.assertEqual(len(self.rules), 7)
+        self.assertEqual(rule(self.rules, '0.0.0.0/0')['Description'], 'https')
+
+    # 출발지 유형과 프리픽스 길이
+    def test_source_types(self):
+        self.assertEqual(rule(self.rules, '::/0')['SourceType'], 'ipv6')
+        self.assertEqual(rule(self.rules, '::/0')['PrefixLength'], 0)
+        self.assertEqual(rule(self.rules, 'pl-1')['SourceType'], 'prefix_list')
+        self.assertEqual(rule(self.rules, 'pl-1')['PrefixLength'], -1)
+        self.assertEqual(rule(self.rules, 'sg-2')['SourceType'], 'security_group')
+        self.assertEqual(rule(self.rules, '32.0.0.0/4')['PrefixLength'], 4)
+
+    # all 프로토콜은 전체 포트, ICMP는 포트 없음
+    def test_ports(self):
+        all_rule = rule(self.rules, 'sg-2')
+        self.assertEqual((all_rule['Protocol'], all_rule['FromPort'], all_rule['ToPort']), ('all', 0, 65535))
+        icmp = self.rules[self.rules['Protocol'] == 'icmp'].iloc[0]
+        self.assertEqual((icmp['FromPort'], icmp['ToPort']), (-1, -1))
+
+    def test_empty(self):
+        rules = flatten_sg_rules([])
+        self.assertTrue(rules.empty)
+        self.assertEqual(list(rules.columns), RULE_COLUMNS)
+
+
+class SgPoliciesTest(unittest.TestCase):
+    def setUp(self):
+        self.rules = flatten_sg_rules(SECURITY_GROUPS)
+
+    # IPv4/IPv6 전체 허용 모두 탐지, 프리픽스 목록은 제외
+    def test_world_open(self):
+        self.assertEqual(matched_sources(self.rules, 'world-open'), ['0.0.0.0/0', '0.0.0.0/0', '::/0'])
+
+    # 관리 포트는 포트가 있는 프로토콜만 (ICMP, 프리픽스 목록 제외)
+    def test_world_open_admin_port(self):
+        self.assertEqual(matched_sources(self.rules, 'world-open-admin-port'), ['::/0'])
+
+    # all 프로토콜 전체 포트 허용
+    def test_world_open_all_protocol(self):
+        rules = flatten_sg_rules([{
+            'GroupId': 'sg-3',
+            'IpPermissions': [{'IpProtocol': '-1', 'IpRanges': [{'CidrIp': '0.0.0.0/0'}]}]
+        }])
+        self.assertEqual(matched_sources(rules, 'world-open-admin-port'), ['0.0.0.0/0'])
+        self.assertEqual(matched_sources(rules, 'wide-port-range'), ['0.0.0.0/0'])
+
+    def test_wide_port_range(self):
+        self.assertEqual(
+            matched_sources(self.rules, 'wide-port-range'),
+            ['2001::/16', '32.0.0.0/4', 'sg-2']
+        )
+
+    # 넓은 대역 (/0 포함), 프리픽스 목록/보안 그룹은 제외
+    def test_broad_cidr(self):
+        self.assertEqual(
+            matched_sources(self.rules, 'broad-cidr'),
+            ['0.0.0.0/0', '0.0.0.0/0', '2001::/16', '32.0.0.0/4', '::/0']
+        )
+
+    # 정책별 탐지 결과 행
+    def test_evaluate(self):
+        findings = evaluate_sg_rules(self.rules, {'world-open-admin-port': SG_POLICIES['world-open-admin-port']})
+        self.assertEqual(findings['Source'].tolist(), ['::/0'])
+        self.assertEqual(findings['Policy'].tolist(), ['world-open-admin-port'])
+        self.assertEqual(findings['Severity'].tolist(), ['High'])
+
+    def test_evaluate_no_findings(self):
+        findings = evaluate_sg_rules(flatten_sg_rules([]))
+        self.assertTrue(findings.empty)
+        self.assertEqual(list(findings.columns), RULE_COLUMNS + ['Policy', 'Severity', 'Finding'])
+
+
+if __name__ == "__main__":
+    unittest.main()
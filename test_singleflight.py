@@ -0,0 +1,83 @@
+# single_flight 동시 호출 합치기 테스트 (python -m unittest test_singleflight)
+
+import threading
+import time
+import unittest
+from utils.singleflight import single_flight, inflight_keys
+
+
+class SingleFlightTest(unittest.TestCase):
+    # 같은 키의 동시 호출은 1회만 실행하고 결과를 공유
+    def test_coalesces_concurrent_calls(self):
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def load():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 'value'
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(single_flight('key', load)))
+        leader.start()
+        self.assertTrue(started.wait(5))
+
+        followers = [
+            threading.Thread(target=lambda: results.append(single_flight('key', load)))
+            for _ in range(4)
+        ]
+        for thread in followers:
+            thread.start()
+        # 뒤따른 호출이 진행 중인 호출을 기다리도록 잠시 대기
+        time.sleep(0.1)
+        self.assertEqual(inflight_keys(), ['key'])
+        release.set()
+        for thread in [leader] + followers:
+            thread.join(5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['value'] * 5)
+        self.assertEqual(inflight_keys(), [])
+
+    # 진행 중인 호출의 예외는 기다리던 호출에도 전달
+    def test_error_is_shared_with_waiters(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise ValueError("조회 실패")
+
+        errors = []
+
+        def call():
+            try:
+                single_flight('failing', fail)
+            except ValueError as e:
+                errors.append(str(e))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        self.assertTrue(started.wait(5))
+        follower = threading.Thread(target=call)
+        follower.start()
+        time.sleep(0.1)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        self.assertEqual(errors, ["조회 실패", "조회 실패"])
+        self.assertEqual(inflight_keys(), [])
+
+    # 다른 키는 합치지 않음
+    def test_different_keys_run_separately(self):
+        self.assertEqual(single_flight('a', lambda: 1), 1)
+        self.assertEqual(single_flight('b', lambda: 2), 2)
+        self.assertEqual(inflight_keys(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,133 @@
+import hashlib
+import threading
 import boto3
-import streamlit as st
+from botocore.config import Config
+from utils.errors import report_error
+from utils.collector import COLLECTOR_MAX_WORKERS
+from utils.cache import cached_call
 
-# AWS 세션 생성
-def create_aws_session(access_key, secret_key, region):
-    try:
-        session = boto3.Session(
+# 모든 AWS 클라이언트가 공유하는 botocore 설정
+CLIENT_CONFIG = Config(
+    max_pool_connections=COLLECTOR_MAX_WORKERS,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    connect_timeout=5,
+    read_timeout=30
+)
+
+# (프로젝트 키, 리전) -> PooledSession (프로세스 전역, Streamlit 세션 간 공유)
+_session_pool = {}
+_pool_lock = threading.Lock()
+
+# 자격증명 비교용 지문 (원문 키는 풀 키로 보관하지 않음)
+def _credential_fingerprint(access_key, secret_key):
+    return hashlib.sha256(f"{access_key}:{secret_key}".encode('utf-8')).hexdigest()
+
+class PooledSession:
+    """boto3.Session 래퍼: 서비스/리전별 클라이언트를 한 번만 생성하여 재사용"""
+    def __init__(self, project_key, access_key, secret_key, region):
+        self.project_key = project_key
+        self.fingerprint = _credential_fingerprint(access_key, secret_key)
+        self._session = boto3.Session(
             aws_access_key_id=access_key,
             aws_secret_access_key=secret_key,
             region_name=region
         )
+        self._clients = {}
+        # boto3.Session은 스레드 안전하지 않으므로 클라이언트 생성은 직렬화
+        self._lock = threading.Lock()
+
+    def client(self, service_name, region_name=None, **kwargs):
+        region_name = region_name or self._session.region_name
+        # 별도 설정이 지정된 경우 캐시하지 않음
+        if kwargs:
+            with self._lock:
+                return self._session.client(service_name, region_name=region_name, **kwargs)
+
+        key = (service_name, region_name)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._session.client(service_name, region_name=region_name, config=CLIENT_CONFIG)
+                    self._clients[key] = client
+        return client
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+# AWS 세션 생성 (프로젝트/리전별 풀에서 재사용, 자격증명 변경 시 교체)
+def create_aws_session(access_key, secret_key, region, project_key=None):
+    try:
+        pool_key = (project_key if project_key is not None else access_key, region)
+        fingerprint = _credential_fingerprint(access_key, secret_key)
+        with _pool_lock:
+            session = _session_pool.get(pool_key)
+            if session is None or session.fingerprint != fingerprint:
+                session = PooledSession(pool_key[0], access_key, secret_key, region)
+                _session_pool[pool_key] = session
         return session
     except Exception as e:
-        st.error(f"AWS 세션 생성 오류: {e}")
-        return None
\ No newline at end of file
+        report_error(f"AWS 세션 생성 오류: {e}")
+        return None
+
+# project.region 값: 단일 리전, 쉼표로 구분한 리전 목록 또는 'all' (활성화된 전체 리전)
+ALL_REGIONS = 'all'
+# 'all' 프로젝트의 기본 리전 (리전 목록 조회 및 단일 리전 기능에 사용)
+DEFAULT_REGION = 'us-east-1'
+
+# project.region 값을 리전 목록으로 변환
+def parse_regions(region_value):
+    return [region.strip() for region in (region_value or '').split(',') if region.strip()]
+
+# 프로젝트 기본 리전 (첫 번째로 지정된 리전)
+def primary_region(project_info):
+    regions = parse_regions(project_info['region'])
+    if not regions or regions[0] == ALL_REGIONS:
+        return DEFAULT_REGION
+    return regions[0]
+
+# 프로젝트 정보로 AWS 세션 생성 (기본 리전)
+def create_project_session(project_info):
+    return create_aws_session(
+        project_info['access_key'],
+        project_info['secret_key'],
+        primary_region(project_info),
+        project_key=project_info['id']
+    )
+
+# 계정에서 활성화된 리전 목록 조회
+def _enabled_regions(session):
+    regions = session.client('ec2').describe_regions(AllRegions=False)['Regions']
+    return sorted(region['RegionName'] for region in regions)
+
+# 프로젝트의 수집 대상 리전별 세션 생성 ({리전: 세션}, 기본 리전이 첫 번째)
+def create_region_sessions(project_info):
+    session = create_project_session(project_info)
+    if not session:
+        return {}
+
+    regions = parse_regions(project_info['region'])
+    if ALL_REGIONS in regions:
+        try:
+            enabled = cached_call(project_info['id'], None, 'Regions', lambda: _enabled_regions(session))
+        except Exception as e:
+            report_error(f"활성화된 리전 조회 오류: {e}")
+            enabled = []
+        regions = [session.region_name] + [region for region in enabled if region != session.region_name]
+
+    sessions = {session.region_name: session}
+    for region in regions:
+        if region not in sessions:
+            regional = create_aws_session(
+                project_info['access_key'], project_info['secret_key'], region, project_key=project_info['id']
+            )
+            if regional:
+                sessions[region] = regional
+    return sessions
+
+# 프로젝트의 풀링된 세션/클라이언트 제거
+def evict_aws_sessions(project_key):
+    with _pool_lock:
+        for pool_key in [key for key in _session_pool if key[0] == project_key]:
+            del _session_pool[pool_key]
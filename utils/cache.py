@@ -0,0 +1,120 @@
+import time
+import threading
+from utils.errors import capture_errors, report_error
+from utils.singleflight import single_flight, inflight_keys
+
+# 서비스별 캐시 유지 시간 (초), 지정되지 않은 서비스는 DEFAULT_TTL 적용
+DEFAULT_TTL = 300
+SERVICE_TTLS = {
+    'EC2': 120,
+    'ELB': 300,
+    'ELB Detail': 300,
+    'ELB Target': 300,
+    'ELB Topology': 300,
+    'RDS': 300,
+    'ElastiCache': 600,
+    'EFS': 600,
+    'S3': 1800,
+    'CloudFront': 1800,
+    'Route53': 1800,
+    'AWS WAF': 1800,
+    'ACM': 3600,
+    'EC2 RI': 3600,
+    'RDS RI': 3600,
+    'VPC': 3600,
+    'Subnet': 3600,
+    'Internet Gateway': 3600,
+    'NAT Gateway': 3600,
+    'VPN Gateway': 3600,
+    'Site-to-Site VPN': 900,
+    'Transit Gateway': 3600,
+    'VPC Peering': 3600,
+    'Customer Gateway': 3600,
+    'Regions': 86400,
+    'Account ID': 86400,
+    'IAM Authorization': 3600,
+    'Security Check': 86400
+}
+
+# (프로젝트 키, 리전, 서비스, 인자) -> (만료 시각, 값)
+_cache = {}
+_cache_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+# 서비스 캐시 유지 시간 조회/변경
+def get_service_ttl(service):
+    return SERVICE_TTLS.get(service, DEFAULT_TTL)
+
+def set_service_ttl(service, ttl):
+    SERVICE_TTLS[service] = ttl
+
+# loader() 결과를 서비스별 TTL 동안 캐시 (오류가 보고된 결과는 캐시하지 않음)
+# 같은 키의 동시 미적중은 세션에 관계없이 1회만 조회하고 결과를 공유
+# ttl: 서비스 TTL 대신 사용할 초 또는 결과값을 받아 초를 반환하는 함수 (만료 시각이 결과에 따라 정해지는 경우)
+def cached_call(project_key, region, service, loader, key_args=(), ttl=None):
+    key = (project_key, region, service, key_args)
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > now:
+            _stats['hits'] += 1
+            return entry[1]
+        _stats['misses'] += 1
+
+    value, errors = single_flight(key, lambda: _load_and_store(key, service, loader, ttl))
+    for message in errors:
+        report_error(message)
+    return value
+
+# loader() 실행 후 오류가 없으면 캐시에 저장, (값, 오류 목록) 반환
+def _load_and_store(key, service, loader, ttl=None):
+    with capture_errors() as errors:
+        value = loader()
+    if not errors:
+        if ttl is None:
+            ttl = get_service_ttl(service)
+        elif callable(ttl):
+            ttl = ttl(value)
+        with _cache_lock:
+            _cache[key] = (time.monotonic() + ttl, value)
+    return value, list(errors)
+
+# 캐시된 값만 조회 (없거나 만료되면 None, 통계에 포함하지 않음)
+def peek_cached(project_key, region, service, key_args=()):
+    with _cache_lock:
+        entry = _cache.get((project_key, region, service, key_args))
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+    return None
+
+# 세션(PooledSession)의 프로젝트/리전을 키로 getter(session, *args) 결과 캐시
+def cached_session_call(session, service, getter, *args):
+    return cached_call(
+        session.project_key, session.region_name, service,
+        lambda: getter(session, *args), args
+    )
+
+# getter(session)를 캐시된 버전으로 감싸기
+def cached_getter(service, getter):
+    def wrapper(session):
+        return cached_session_call(session, service, getter)
+    return wrapper
+
+# 프로젝트 또는 서비스 단위 캐시 무효화 (인자가 없으면 전체)
+def invalidate(project_key=None, service=None):
+    with _cache_lock:
+        for key in list(_cache):
+            if project_key is not None and key[0] != project_key:
+                continue
+            if service is not None and key[2] != service:
+                continue
+            del _cache[key]
+
+# 프로젝트에서 현재 조회 중인 서비스명 목록
+def inflight_services(project_key):
+    return sorted({key[2] for key in inflight_keys(lambda key: key[0] == project_key)})
+
+# 캐시 적중/미적중 통계
+def cache_stats():
+    with _cache_lock:
+        return {'hits': _stats['hits'], 'misses': _stats['misses'], 'entries': len(_cache)}
@@ -0,0 +1,167 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
+import pandas as pd
+from utils.errors import capture_errors
+
+# 동시 조회 스레드 수
+COLLECTOR_MAX_WORKERS = 10
+# 서비스별 조회 제한 시간 (초)
+COLLECTOR_TIMEOUT = 60
+
+# 현재 스레드 조회 작업의 취소 이벤트 (시간 초과 시 설정)
+_local = threading.local()
+
+class CollectionCancelled(Exception):
+    """시간 초과로 취소된 조회 (다음 페이지 요청 전에 발생)"""
+    def __init__(self):
+        super().__init__("조회 시간 초과로 취소되었습니다.")
+
+# 현재 조회 작업이 취소되었으면 CollectionCancelled 발생 (iter_pages가 페이지마다 확인)
+def raise_if_cancelled():
+    cancel = getattr(_local, 'cancel', None)
+    if cancel is not None and cancel.is_set():
+        raise CollectionCancelled()
+
+# 취소 이벤트를 현재 스레드에 설정하여 fn 실행
+def _run_with_cancel(cancel, fn, *args):
+    previous = getattr(_local, 'cancel', None)
+    _local.cancel = cancel
+    try:
+        return fn(*args)
+    finally:
+        _local.cancel = previous
+
+# 개별 서비스 조회 (워커 스레드에서 실행)
+def _run_getter(key, getter, session, started_at, cancel):
+    started_at[key] = time.monotonic()
+    with capture_errors() as errors:
+        frame = _run_with_cancel(cancel, getter, session)
+    return frame, errors, time.monotonic() - started_at[key]
+
+# (키 -> (getter, session)) 작업을 병렬 실행하여 키별 결과/상태 반환
+# 시간 초과된 작업은 결과를 기다리지 않고 취소 이벤트를 설정: getter는 다음 페이지 요청 전(iter_pages)에 중단되고,
+# 진행 중인 API 호출 1건은 CLIENT_CONFIG의 connect/read timeout과 재시도 횟수 안에서 끝나므로 스레드가 계속 쌓이지 않음
+def _collect_tasks(tasks, labels, max_workers, timeout):
+    frames = {}
+    statuses = {}
+    started_at = {}
+    cancels = {key: threading.Event() for key in tasks}
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='aws-collector')
+    try:
+        futures = {
+            executor.submit(_run_getter, key, getter, session, started_at, cancels[key]): key
+            for key, (getter, session) in tasks.items()
+        }
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = futures[future]
+                try:
+                    frame, errors, duration = future.result()
+                    frames[key] = frame if frame is not None else pd.DataFrame()
+                    statuses[key] = {
+                        'status': 'error' if errors else 'ok',
+                        'message': '; '.join(errors),
+                        'duration': duration
+                    }
+                except Exception as e:
+                    statuses[key] = {
+                        'status': 'error',
+                        'message': f"{labels[key]} 조회 오류: {e}",
+                        'duration': time.monotonic() - started_at.get(key, time.monotonic())
+                    }
+
+            # 시작 후 제한 시간을 넘긴 작업은 결과를 기다리지 않음
+            now = time.monotonic()
+            for future in list(pending):
+                key = futures[future]
+                start = started_at.get(key)
+                if start is not None and now - start > timeout:
+                    pending.discard(future)
+                    cancels[key].set()
+                    statuses[key] = {
+                        'status': 'timeout',
+                        'message': f"{labels[key]} 조회 시간 초과 ({timeout}초)",
+                        'duration': now - start
+                    }
+    finally:
+        # 예외로 빠져나온 경우에도 남은 작업 중단
+        for cancel in cancels.values():
+            cancel.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+    return frames, statuses
+
+# 여러 서비스 조회 함수를 병렬로 실행하여 {서비스명: DataFrame} 반환
+def collect_resources(session, getters, max_workers=COLLECTOR_MAX_WORKERS, timeout=COLLECTOR_TIMEOUT):
+    """getters: {서비스명: getter(session)}, session은 스레드 간 공유 가능해야 함 (PooledSession)
+    반환값: (frames, statuses)
+      frames   - {서비스명: DataFrame} (실패/시간초과 시 빈 DataFrame)
+      statuses - {서비스명: {'status': 'ok'|'error'|'timeout', 'message': str, 'duration': float}}
+    """
+    tasks = {name: (getter, session) for name, getter in getters.items()}
+    frames, statuses = _collect_tasks(tasks, {name: name for name in getters}, max_workers, timeout)
+
+    # 요청한 서비스 순서 유지
+    frames = {name: frames.get(name, pd.DataFrame()) for name in getters}
+    return frames, statuses
+
+# 리전 x 서비스 조회를 병렬로 실행하여 {서비스명: DataFrame} 반환 (여러 리전이면 Region 컬럼 추가)
+def collect_regional_resources(sessions, getters, global_services=(), max_workers=COLLECTOR_MAX_WORKERS, timeout=COLLECTOR_TIMEOUT):
+    """sessions: {리전: session}, global_services의 서비스는 첫 번째 리전에서 1회만 조회
+    반환값: collect_resources와 동일 (상태는 서비스 단위로 합산, 오류 메시지에 리전 표시)
+    """
+    regions = list(sessions)
+    tasks = {}
+    labels = {}
+    for name, getter in getters.items():
+        for region in (regions[:1] if name in global_services else regions):
+            tasks[(name, region)] = (getter, sessions[region])
+            labels[(name, region)] = f"{name} ({region})"
+    results, task_statuses = _collect_tasks(tasks, labels, max_workers, timeout)
+
+    frames = {}
+    statuses = {}
+    for name in getters:
+        keys = [key for key in tasks if key[0] == name]
+        parts = []
+        for key in keys:
+            frame = results.get(key)
+            if frame is None or frame.empty:
+                continue
+            # 여러 리전을 합칠 때만 마지막 컬럼에 Region 추가 (기존 컬럼 순서와 CSV 형식 유지)
+            if len(regions) > 1 and 'Region' not in frame.columns:
+                frame = frame.assign(Region='global' if name in global_services else key[1])
+            parts.append(frame)
+        frames[name] = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+
+        failed = [key for key in keys if task_statuses[key]['status'] != 'ok']
+        show_region = len(regions) > 1 and name not in global_services
+        statuses[name] = {
+            'status': task_statuses[failed[0]]['status'] if failed else 'ok',
+            'message': '; '.join(
+                f"[{key[1]}] {task_statuses[key]['message']}" if show_region else task_statuses[key]['message']
+                for key in failed
+            ),
+            'duration': max(task_statuses[key]['duration'] for key in keys) if keys else 0
+        }
+    return frames, statuses
+
+# 항목별로 fn을 병렬 실행하여 {항목: 결과} 반환 (실패한 항목은 예외 객체가 값)
+def map_concurrently(fn, items, max_workers=COLLECTOR_MAX_WORKERS):
+    items = list(items)
+    results = {}
+    if not items:
+        return results
+    # 호출한 조회 작업의 취소 이벤트를 하위 스레드에도 전달
+    cancel = getattr(_local, 'cancel', None)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = {executor.submit(_run_with_cancel, cancel, fn, item): item for item in items}
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                results[item] = future.result()
+            except Exception as e:
+                results[item] = e
+    return results
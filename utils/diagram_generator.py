@@ -2,6 +2,7 @@ import streamlit as st
 import urllib.parse
 import base64
 from datetime import datetime
+from services.aws_ec2 import instance_index_from_frame
 
 # Draw.io XML을 iframe에 로드하는 함수
 def load_drawio_with_xml(xml_content):
@@ -121,18 +122,20 @@ def generate_aws_drawio_xml(project_name, aws_data):
         
         # ALB 생성
         alb_id = None
+        alb_name = None
         if 'ELB' in aws_data and hasattr(aws_data['ELB'], '__len__') and len(aws_data['ELB']) > 0:
             alb_name = aws_data['ELB'].iloc[0]['Load Balancer'] if 'Load Balancer' in aws_data['ELB'].columns else "ALB"
             cells.append(f'<mxCell id="{cell_id}" value="{alb_name}" style="sketch=0;outlineConnect=0;fontColor=#232F3E;gradientColor=none;fillColor=#8C4FFF;strokeColor=none;dashed=0;verticalLabelPosition=bottom;verticalAlign=top;align=center;html=1;fontSize=10;fontStyle=0;aspect=fixed;pointerEvents=1;shape=mxgraph.aws4.application_load_balancer;" vertex="1" parent="1"><mxGeometry x="700" y="150" width="78" height="78" as="geometry" /></mxCell>')
             alb_id = cell_id
             cell_id += 1
         
-        # 모든 EC2 인스턴스를 서브넷별로 배치
+        # 모든 EC2 인스턴스를 서브넷별로 배치 (ELB와 같은 인스턴스 인덱스 사용, 인스턴스 ID -> 셀 ID)
         ec2_ids = []
+        ec2_cells = {}
         subnet_ec2_count = {}
         
         if 'EC2' in aws_data and hasattr(aws_data['EC2'], '__len__') and len(aws_data['EC2']) > 0:
-            for _, ec2 in aws_data['EC2'].iterrows():
+            for instance_id, ec2 in instance_index_from_frame(aws_data['EC2']).items():
                 ec2_name = ec2.get('Name', 'EC2')
                 ec2_subnet_id = ec2.get('Subnet ID', '')
                 
@@ -153,6 +156,7 @@ def generate_aws_drawio_xml(project_name, aws_data):
                     
                     cells.append(f'<mxCell id="{cell_id}" value="{ec2_name}" style="sketch=0;points=[[0,0,0],[0.25,0,0],[0.5,0,0],[0.75,0,0],[1,0,0],[0,1,0],[0.25,1,0],[0.5,1,0],[0.75,1,0],[1,1,0],[0,0.25,0],[0,0.5,0],[0,0.75,0],[1,0.25,0],[1,0.5,0],[1,0.75,0]];outlineConnect=0;fontColor=#232F3E;gradientColor=#F78E04;gradientDirection=north;fillColor=#D05C17;strokeColor=#ffffff;dashed=0;verticalLabelPosition=bottom;verticalAlign=top;align=center;html=1;fontSize=8;fontStyle=0;aspect=fixed;shape=mxgraph.aws4.resourceIcon;resIcon=mxgraph.aws4.ec2;" vertex="1" parent="1"><mxGeometry x="{x_pos}" y="{y_pos}" width="40" height="40" as="geometry" /></mxCell>')
                     ec2_ids.append(cell_id)
+                    ec2_cells[instance_id] = cell_id
                     subnet_ec2_count[ec2_subnet_id] += 1
                     cell_id += 1
                 else:
@@ -162,6 +166,7 @@ def generate_aws_drawio_xml(project_name, aws_data):
                     
                     cells.append(f'<mxCell id="{cell_id}" value="{ec2_name}" style="sketch=0;points=[[0,0,0],[0.25,0,0],[0.5,0,0],[0.75,0,0],[1,0,0],[0,1,0],[0.25,1,0],[0.5,1,0],[0.75,1,0],[1,1,0],[0,0.25,0],[0,0.5,0],[0,0.75,0],[1,0.25,0],[1,0.5,0],[1,0.75,0]];outlineConnect=0;fontColor=#232F3E;gradientColor=#F78E04;gradientDirection=north;fillColor=#D05C17;strokeColor=#ffffff;dashed=0;verticalLabelPosition=bottom;verticalAlign=top;align=center;html=1;fontSize=8;fontStyle=0;aspect=fixed;shape=mxgraph.aws4.resourceIcon;resIcon=mxgraph.aws4.ec2;" vertex="1" parent="1"><mxGeometry x="{x_pos}" y="{y_pos}" width="40" height="40" as="geometry" /></mxCell>')
                     ec2_ids.append(cell_id)
+                    ec2_cells[instance_id] = cell_id
                     cell_id += 1
         
         # NAT Gateway 생성
@@ -207,9 +212,15 @@ def generate_aws_drawio_xml(project_name, aws_data):
                 s3_count += 1
                 cell_id += 1
         
-        # 연결선 생성 (ALB에서 EC2로)
+        # 연결선 생성 (ALB에서 실제 대상 EC2로, 대상 정보가 없으면 일부 EC2로)
         if alb_id and ec2_ids:
-            for ec2_id in ec2_ids[:5]:  # 너무 많은 연결선 방지
+            elb_targets = aws_data.get('ELB Target')
+            if elb_targets is not None and len(elb_targets) > 0:
+                target_ids = elb_targets.loc[elb_targets['ELB Name'] == alb_name, 'Instance ID']
+                edge_targets = [ec2_cells[instance_id] for instance_id in target_ids if instance_id in ec2_cells]
+            else:
+                edge_targets = ec2_ids[:5]  # 너무 많은 연결선 방지
+            for ec2_id in edge_targets:
                 connections.append(f'<mxCell id="{cell_id}" value="" style="endArrow=classic;html=1;rounded=0;strokeColor=#666666;" edge="1" parent="1" source="{alb_id}" target="{ec2_id}"><mxGeometry width="50" height="50" relative="1" as="geometry"><mxPoint x="500" y="300" as="sourcePoint" /><mxPoint x="550" y="250" as="targetPoint" /></mxGeometry></mxCell>')
                 cell_id += 1
         
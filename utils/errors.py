@@ -0,0 +1,29 @@
+import sys
+import threading
+from contextlib import contextmanager
+
+_local = threading.local()
+
+# 오류 메시지 출력 (수집 스레드에서는 화면 대신 수집기에 전달)
+# Streamlit을 직접 import하지 않으므로 CLI/워커에서는 표준 오류로 출력
+def report_error(message):
+    sink = getattr(_local, 'sink', None)
+    if sink is not None:
+        sink.append(message)
+        return
+    st = sys.modules.get('streamlit')
+    if st is not None:
+        st.error(message)
+    else:
+        print(message, file=sys.stderr)
+
+# 현재 스레드에서 발생하는 report_error 메시지를 리스트로 수집
+@contextmanager
+def capture_errors():
+    previous = getattr(_local, 'sink', None)
+    errors = []
+    _local.sink = errors
+    try:
+        yield errors
+    finally:
+        _local.sink = previous
@@ -0,0 +1,19 @@
+import pandas as pd
+from utils.collector import raise_if_cancelled
+
+# 페이지네이터가 있으면 페이지 단위로, 없으면 단일 응답으로 순회 (시간 초과로 취소된 조회는 다음 요청 전에 중단)
+def iter_pages(client, operation, **kwargs):
+    raise_if_cancelled()
+    if client.can_paginate(operation):
+        for page in client.get_paginator(operation).paginate(**kwargs):
+            yield page
+            raise_if_cancelled()
+    else:
+        yield getattr(client, operation)(**kwargs)
+
+# 행 묶음(청크) 제너레이터를 하나의 DataFrame으로 변환
+def frame_from_chunks(chunks):
+    rows = []
+    for chunk in chunks:
+        rows.extend(chunk)
+    return pd.DataFrame(rows)
@@ -0,0 +1,36 @@
+import threading
+
+# 진행 중인 호출: 키 -> {'event', 'result', 'error'}
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+# 같은 키의 동시 호출을 1회 실행으로 합침 (나중 호출은 진행 중인 호출의 결과를 공유)
+def single_flight(key, fn):
+    with _inflight_lock:
+        call = _inflight.get(key)
+        leader = call is None
+        if leader:
+            call = {'event': threading.Event(), 'result': None, 'error': None}
+            _inflight[key] = call
+
+    if not leader:
+        call['event'].wait()
+        if call['error'] is not None:
+            raise call['error']
+        return call['result']
+
+    try:
+        call['result'] = fn()
+        return call['result']
+    except Exception as e:
+        call['error'] = e
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+        call['event'].set()
+
+# 진행 중인 호출 키 목록 (조건 함수로 필터링)
+def inflight_keys(predicate=None):
+    with _inflight_lock:
+        return [key for key in _inflight if predicate is None or predicate(key)]